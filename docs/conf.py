@@ -97,6 +97,13 @@ man_pages = [
         "Free Software Foundation Europe",
         1,
     ),
+    (
+        "man/reuse-cache-server",
+        "reuse-cache-server",
+        "Serve a shared cache of REUSE information",
+        "Free Software Foundation Europe",
+        1,
+    ),
     (
         "man/reuse-convert-dep5",
         "reuse-convert-dep5",
@@ -0,0 +1,683 @@
+# SPDX-FileCopyrightText: 2025 Free Software Foundation Europe e.V. <https://fsfe.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""On-disk caches that speed up repeated runs over the same project.
+
+Everything in the cache can be recomputed, so errors while reading or writing
+it are logged and otherwise ignored.
+"""
+
+import contextlib
+import hashlib
+import http.client
+import json
+import logging
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Collection
+from enum import Enum
+from pathlib import Path
+from typing import Any, BinaryIO, NamedTuple, cast
+from urllib.parse import urlsplit
+
+from . import __version__
+from .copyright import CopyrightNotice, ReuseInfo, SpdxExpression
+from .exceptions import CopyrightNoticeParseError
+from .i18n import _
+from .types import StrPath
+from .vcs import VCSStrategy
+
+_LOGGER = logging.getLogger(__name__)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+#: Connections that a forked process inherited and must not use. They are kept
+#: here so that they are not closed when they are forgotten, either.
+_INHERITED_CONNECTIONS: list[Any] = []
+
+#: The metadata directories of VCSs, which :func:`tree_fingerprint` skips.
+_VCS_DIRECTORIES = frozenset({".git", ".hg", ".sl", ".jj", ".pijul"})
+
+
+def user_cache_directory() -> Path:
+    """Return the directory in which reuse caches results for the current user,
+    in the same place as :func:`platformdirs.user_cache_dir`. This is
+    ``$XDG_CACHE_HOME/reuse`` (by default ``~/.cache/reuse``) on most systems,
+    ``~/Library/Caches/reuse`` on macOS, and ``%LOCALAPPDATA%\\reuse\\Cache``
+    on Windows.
+
+    Raises:
+        RuntimeError: if the home directory cannot be determined.
+    """
+    if sys.platform == "win32":
+        local_app_data = os.environ.get("LOCALAPPDATA")
+        if local_app_data:
+            return Path(local_app_data) / "reuse" / "Cache"
+        return Path.home() / "AppData" / "Local" / "reuse" / "Cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "reuse"
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME", "")
+    if os.path.isabs(xdg_cache_home):
+        return Path(xdg_cache_home) / "reuse"
+    return Path.home() / ".cache" / "reuse"
+
+
+def cache_directory(root: StrPath) -> Path | None:
+    """Return the cache directory of the project in *root*, or :const:`None` if
+    there is none.
+
+    The directory is in :func:`user_cache_directory`, outside of the project, so
+    that the contents of a project cannot change what reuse reads from its
+    cache.
+    """
+    # pylint: disable=broad-except
+    try:
+        root = Path(root).resolve()
+        return (
+            user_cache_directory()
+            / "projects"
+            / hashlib.sha256(os.fsencode(root)).hexdigest()
+        )
+    except Exception as error:
+        _LOGGER.debug("could not find cache directory: %s", error)
+        return None
+
+
+def content_cache_path() -> Path | None:
+    """Return the path of the database of :class:`ContentCache`, or
+    :const:`None` if there is none.
+
+    The database contains no paths, so all projects share it, wherever they
+    are. That way, a clone at another path, such as on a CI runner that restored
+    the database, finds the entries of the others.
+    """
+    # pylint: disable=broad-except
+    try:
+        return user_cache_directory() / "content.sqlite"
+    except Exception as error:
+        _LOGGER.debug("could not find cache directory: %s", error)
+        return None
+
+
+def digest(*parts: bytes) -> str:
+    """Return a hexadecimal digest of *parts* and the version of reuse. The
+    layout of cached values may change between versions.
+    """
+    result = hashlib.sha256(__version__.encode("utf-8"))
+    for part in parts:
+        result.update(len(part).to_bytes(8, "big"))
+        result.update(part)
+    return result.hexdigest()
+
+
+def load(path: StrPath) -> Any:
+    """Return the JSON value stored in *path*, or :const:`None` if it does not
+    exist or cannot be read. The caller must check the value.
+    """
+    # pylint: disable=broad-except
+    try:
+        with open(path, encoding="utf-8") as fp:
+            return json.load(fp)
+    except FileNotFoundError:
+        return None
+    except Exception as error:
+        _LOGGER.debug("could not read cache '%s': %s", path, error)
+        return None
+
+
+def dump(path: StrPath, value: Any) -> None:
+    """Store *value* as JSON in *path*. The file is replaced atomically, so
+    concurrent readers never see a partial file.
+    """
+    path = Path(path)
+    # pylint: disable=broad-except
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, prefix=".tmp-", delete=False
+        ) as fp:
+            try:
+                json.dump(value, fp)
+            except BaseException:
+                fp.close()
+                os.unlink(fp.name)
+                raise
+        os.replace(fp.name, path)
+    except Exception as error:
+        _LOGGER.debug("could not write cache '%s': %s", path, error)
+
+
+class CacheMode(Enum):
+    """How :class:`ReuseInfoCache` identifies the contents of files."""
+
+    #: By the path, size, modification time and inode of files. This is the
+    #: fastest, but the cache is only valid in the same working tree.
+    METADATA = "metadata"
+    #: By the Git blob ID of the contents of files. The cache is valid across
+    #: clones, branches and machines.
+    CONTENT = "content"
+
+
+class CacheKey(NamedTuple):
+    """The key of an entry of :class:`ReuseInfoCache`."""
+
+    #: The identifier of the entry. A new entry replaces an older one with the
+    #: same identifier.
+    name: str
+    #: The entry is only valid if this matches, too.
+    validity: str
+
+
+class ReuseInfoCache(ABC):
+    """A cache of the REUSE information in the contents of files, in an SQLite
+    database. The information is stored as JSON (see
+    :func:`reuse_info_to_json`), and checked when it is read.
+
+    Entries can be looked up and added in worker processes, but only the main
+    process writes them to the database. New entries are collected with
+    :meth:`pop_new_entries`, and written with :meth:`write`.
+    """
+
+    def __init__(self, path: StrPath):
+        self.path = Path(path)
+        self._version = digest()
+        self._connection: sqlite3.Connection | None = None
+        self._new_entries: dict[CacheKey, ReuseInfo] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Connections cannot be pickled, and new entries stay in the process
+        # that found them.
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        state["_new_entries"] = {}
+        return state
+
+    @abstractmethod
+    def key(
+        self, path: str, fp: BinaryIO, stat: os.stat_result
+    ) -> CacheKey | None:
+        """Return the key of the file at *path*, relative to the root of the
+        project. The file is open as *fp*, and *stat* is its status, which must
+        have been taken before the file is read. Return :const:`None` if the
+        file must not be cached.
+
+        The position of *fp* is unchanged afterwards.
+        """
+
+    def prefetch(self) -> None:
+        """Fetch entries that are likely to be looked up ahead of time. By
+        default, this does nothing.
+        """
+
+    def close(self) -> None:
+        """Close the connection to the database, if it is open. It is opened
+        again when it is needed.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def forget_connections(self) -> None:
+        """Forget the open connections of this cache without using them, in a
+        process that was forked from the one that opened them. SQLite
+        connections must not be used across a fork.
+        """
+        if self._connection is not None:
+            _INHERITED_CONNECTIONS.append(self._connection)
+            self._connection = None
+
+    def _connect(self, create: bool = False) -> sqlite3.Connection | None:
+        if self._connection is None:
+            if not create and not self.path.exists():
+                return None
+            if create:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.path, timeout=10)
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " name TEXT PRIMARY KEY, validity TEXT, reuse_info TEXT)"
+            )
+        return self._connection
+
+    def get(self, key: CacheKey) -> ReuseInfo | None:
+        """Return the cached REUSE information of *key*, if any."""
+        # pylint: disable=broad-except
+        try:
+            connection = self._connect()
+            if connection is None:
+                return None
+            row = connection.execute(
+                "SELECT reuse_info FROM entries"
+                " WHERE name = ? AND validity = ?",
+                (key.name, f"{self._version}:{key.validity}"),
+            ).fetchone()
+            if row is None:
+                return None
+            return reuse_info_from_json(json.loads(row[0]))
+        except Exception as error:
+            _LOGGER.debug("could not read cache '%s': %s", self.path, error)
+            return None
+
+    def put(self, key: CacheKey, reuse_info: ReuseInfo) -> None:
+        """Add the REUSE information of *key* as a new entry."""
+        self._new_entries[key] = reuse_info
+
+    def pop_new_entries(self) -> dict[CacheKey, ReuseInfo]:
+        """Return the new entries of this process, and forget them."""
+        result = self._new_entries
+        self._new_entries = {}
+        return result
+
+    def write(self, entries: dict[CacheKey, ReuseInfo]) -> None:
+        """Write *entries* to the database."""
+        if not entries:
+            return
+        # pylint: disable=broad-except
+        try:
+            connection = cast(sqlite3.Connection, self._connect(create=True))
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                    (
+                        (
+                            key.name,
+                            f"{self._version}:{key.validity}",
+                            json.dumps(reuse_info_to_json(reuse_info)),
+                        )
+                        for key, reuse_info in entries.items()
+                    ),
+                )
+        except Exception as error:
+            _LOGGER.debug("could not write cache '%s': %s", self.path, error)
+
+
+class FileCache(ReuseInfoCache):
+    """A :class:`ReuseInfoCache` in which an entry is keyed on the path of its
+    file, and is valid for as long as the size, modification time and inode of
+    the file do not change.
+    """
+
+    #: Files that were modified this recently (in nanoseconds) are not cached,
+    #: because a change in the same tick of the file system's clock would go
+    #: unnoticed.
+    RACY_NS = 2_000_000_000
+
+    def key(
+        self, path: str, fp: BinaryIO, stat: os.stat_result
+    ) -> CacheKey | None:
+        if time.time_ns() - stat.st_mtime_ns < self.RACY_NS:
+            return None
+        return CacheKey(
+            path, f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
+        )
+
+
+class ContentCache(ReuseInfoCache):
+    """A :class:`ReuseInfoCache` in which an entry is keyed on the Git blob ID
+    of the contents of its file. The database contains no paths, so it can be
+    moved between clones and machines.
+
+    The IDs of files that are tracked and unmodified are taken from the VCS
+    without reading the files, see :meth:`VCSStrategy.content_ids`. The IDs of
+    other files are computed with :func:`git_blob_id`.
+    """
+
+    def __init__(
+        self,
+        path: StrPath,
+        vcs_strategy: VCSStrategy,
+        backend: "CacheBackend | None" = None,
+    ):
+        super().__init__(path)
+        self.vcs_strategy = vcs_strategy
+        #: A shared cache that is consulted in :meth:`prefetch`, and to which
+        #: new entries are sent in :meth:`write`.
+        self.backend = backend
+        # The VCS strategy remembers the IDs, so copies of it that are sent to
+        # worker processes afterwards need not compute them again.
+        self.vcs_strategy.content_ids()
+
+    def key(
+        self, path: str, fp: BinaryIO, stat: os.stat_result
+    ) -> CacheKey | None:
+        content_id = self.vcs_strategy.content_ids().get(path)
+        if content_id is None:
+            content_id = git_blob_id(fp, stat.st_size)
+        return CacheKey(content_id, "")
+
+    def _backend_name(self, content_id: str) -> str:
+        # Entries of different versions of reuse must not mix in the backend.
+        return digest(content_id.encode("utf-8"))
+
+    def prefetch(self) -> None:
+        """Look up the files that the VCS knows, and that are not in the
+        database yet, in :attr:`backend`. Add the results to the database.
+
+        The connection to the database is closed afterwards, so that worker
+        processes that are forked from this one do not inherit it.
+        """
+        if self.backend is None:
+            return
+        try:
+            self._prefetch(self.backend)
+        finally:
+            self.close()
+
+    def _prefetch(self, backend: "CacheBackend") -> None:
+        missing = set(self.vcs_strategy.content_ids().values())
+        # pylint: disable=broad-except
+        try:
+            connection = self._connect()
+            if connection is not None:
+                missing.difference_update(
+                    row[0]
+                    for row in connection.execute(
+                        "SELECT name FROM entries WHERE validity = ?",
+                        (f"{self._version}:",),
+                    )
+                )
+        except Exception as error:
+            _LOGGER.debug("could not read cache '%s': %s", self.path, error)
+        if not missing:
+            return
+        names = {
+            self._backend_name(content_id): content_id for content_id in missing
+        }
+        found = backend.lookup(names)
+        super().write(
+            {
+                CacheKey(names[name], ""): reuse_info
+                for name, reuse_info in found.items()
+                if name in names
+            }
+        )
+
+    def forget_connections(self) -> None:
+        super().forget_connections()
+        if self.backend is not None:
+            self.backend.forget_connections()
+
+    def write(self, entries: dict[CacheKey, ReuseInfo]) -> None:
+        """Write *entries* to the database, and send them to :attr:`backend`."""
+        super().write(entries)
+        if self.backend is not None and entries:
+            self.backend.store(
+                {
+                    self._backend_name(key.name): reuse_info
+                    for key, reuse_info in entries.items()
+                }
+            )
+
+
+def git_blob_id(fp: BinaryIO, size: int) -> str:
+    """Return the SHA-1 ID that Git gives a blob with the contents of *fp*,
+    which are *size* bytes long. The position of *fp* is unchanged afterwards.
+    """
+    position = fp.tell()
+    fp.seek(0)
+    result = hashlib.sha1(f"blob {size}\0".encode("ascii"))
+    while chunk := fp.read(_HASH_CHUNK_SIZE):
+        result.update(chunk)
+    fp.seek(position)
+    return result.hexdigest()
+
+
+def tree_fingerprint(
+    directory: StrPath,
+    vcs_strategy: VCSStrategy | None = None,
+    include_submodules: bool = False,
+) -> str | None:
+    """Return a hash of the names of all files and directories below
+    *directory*, and of the size, modification time and inode of the files.
+    The metadata directories of VCSs, directories without files, and files and
+    directories that *vcs_strategy* ignores are skipped, as are submodules
+    unless *include_submodules* is set. That way, only the files that could be
+    linted are looked at.
+
+    Return :const:`None` if a file was modified so recently that a later
+    modification could go unnoticed. See :attr:`FileCache.RACY_NS`.
+    """
+    limit = time.time_ns() - FileCache.RACY_NS
+
+    def is_ignored(entry: os.DirEntry, is_dir: bool) -> bool:
+        if vcs_strategy is None:
+            return False
+        path = Path(entry.path)
+        if vcs_strategy.is_ignored(path):
+            return True
+        return (
+            is_dir
+            and not include_submodules
+            and vcs_strategy.is_submodule(path)
+        )
+
+    def walk(path: str) -> bytes | None:
+        """Return the hash of *path*, or an empty string if it contains no
+        files.
+        """
+        result = hashlib.sha256()
+        empty = True
+        with os.scandir(path) as entries:
+            for entry in sorted(entries, key=lambda entry: entry.name):
+                if entry.name in _VCS_DIRECTORIES:
+                    continue
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if is_ignored(entry, is_dir):
+                    continue
+                if is_dir:
+                    child = walk(entry.path)
+                    if child is None:
+                        return None
+                    if not child:
+                        continue
+                    record = b"d" + child
+                else:
+                    stat = entry.stat(follow_symlinks=False)
+                    if stat.st_mtime_ns > limit:
+                        return None
+                    record = (
+                        f"f{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}"
+                    ).encode("ascii")
+                name = os.fsencode(entry.name)
+                result.update(len(name).to_bytes(8, "big"))
+                result.update(name)
+                result.update(len(record).to_bytes(8, "big"))
+                result.update(record)
+                empty = False
+        return b"" if empty else result.digest()
+
+    # pylint: disable=broad-except
+    try:
+        result = walk(os.path.abspath(directory))
+    except Exception as error:
+        _LOGGER.debug("could not fingerprint '%s': %s", directory, error)
+        return None
+    return None if result is None else result.hex()
+
+
+class CacheBackend(ABC):
+    """A store of the REUSE information in the contents of files that is
+    shared between projects, such as a server. Entries are keyed on opaque
+    names.
+
+    Like the rest of the cache, backends log and otherwise ignore errors.
+    """
+
+    @abstractmethod
+    def lookup(self, names: Collection[str]) -> dict[str, ReuseInfo]:
+        """Return the entries of *names* that the backend has."""
+
+    @abstractmethod
+    def store(self, entries: dict[str, ReuseInfo]) -> None:
+        """Add *entries* to the backend."""
+
+    def forget_connections(self) -> None:
+        """See :meth:`ReuseInfoCache.forget_connections`. By default, this does
+        nothing.
+        """
+
+
+class HTTPCacheBackend(CacheBackend):
+    """A :class:`CacheBackend` on an HTTP server, such as the one in
+    :mod:`reuse.cache_server`. Requests are sent in batches of
+    :attr:`batch_size` entries over a single persistent connection.
+
+    After the first error, the backend is not contacted again.
+    """
+
+    def __init__(self, url: str, batch_size: int = 1000, timeout: float = 10):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.netloc:
+            raise ValueError(f"'{url}' is not an HTTP URL")
+        self.url = url
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._https = parts.scheme == "https"
+        self._netloc = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        self._connection: http.client.HTTPConnection | None = None
+        self._failed = False
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_connection"] = None
+        return state
+
+    def forget_connections(self) -> None:
+        if self._connection is not None:
+            _INHERITED_CONNECTIONS.append(self._connection)
+            self._connection = None
+
+    def _request(self, method: str, path: str, body: Any) -> Any:
+        """Send *body* as JSON and return the decoded JSON response, or
+        :const:`None` if the response has no content.
+        """
+        data = json.dumps(body).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        # A persistent connection may have been closed by the server in the
+        # meantime, so try once more with a new connection.
+        for attempt in range(2):
+            if self._connection is None:
+                connection_class = (
+                    http.client.HTTPSConnection
+                    if self._https
+                    else http.client.HTTPConnection
+                )
+                self._connection = connection_class(
+                    self._netloc, timeout=self.timeout
+                )
+            try:
+                self._connection.request(
+                    method, self._base_path + path, data, headers
+                )
+                response = self._connection.getresponse()
+                content = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                self._connection.close()
+                self._connection = None
+                if attempt:
+                    raise
+        if response.status >= 300:
+            raise http.client.HTTPException(
+                f"{method} {path}: {response.status} {response.reason}"
+            )
+        return json.loads(content) if content else None
+
+    def lookup(self, names: Collection[str]) -> dict[str, ReuseInfo]:
+        result: dict[str, ReuseInfo] = {}
+        names = list(names)
+        # pylint: disable=broad-except
+        try:
+            for start in range(0, len(names), self.batch_size):
+                if self._failed:
+                    break
+                found = self._request(
+                    "POST",
+                    "/lookup",
+                    names[start : start + self.batch_size],
+                )
+                for name, value in dict(found).items():
+                    with contextlib.suppress(
+                        CopyrightNoticeParseError, TypeError, ValueError
+                    ):
+                        result[name] = reuse_info_from_json(value)
+        except Exception as error:
+            self._failed = True
+            _LOGGER.warning(_("Could not read cache '%s': %s"), self.url, error)
+        return result
+
+    def store(self, entries: dict[str, ReuseInfo]) -> None:
+        items = list(entries.items())
+        # pylint: disable=broad-except
+        try:
+            for start in range(0, len(items), self.batch_size):
+                if self._failed:
+                    break
+                self._request(
+                    "PUT",
+                    "/entries",
+                    {
+                        name: reuse_info_to_json(reuse_info)
+                        for name, reuse_info in items[
+                            start : start + self.batch_size
+                        ]
+                    },
+                )
+        except Exception as error:
+            self._failed = True
+            _LOGGER.warning(
+                _("Could not write cache '%s': %s"), self.url, error
+            )
+
+
+def reuse_info_to_json(reuse_info: ReuseInfo) -> dict[str, list[str]]:
+    """Return the REUSE information in the contents of a file as a JSON object.
+    The path and source are left out.
+    """
+    return {
+        "spdx_expressions": sorted(
+            str(expression) for expression in reuse_info.spdx_expressions
+        ),
+        "copyright_notices": sorted(
+            str(notice) for notice in reuse_info.copyright_notices
+        ),
+        "contributor_lines": sorted(reuse_info.contributor_lines),
+    }
+
+
+def reuse_info_from_json(value: Any) -> ReuseInfo:
+    """Return the REUSE information in the JSON object *value*, as created by
+    :func:`reuse_info_to_json`.
+
+    Raises:
+        TypeError: *value* is not such an object.
+        CopyrightNoticeParseError: *value* contains an invalid copyright
+            notice.
+    """
+
+    def strings(key: str) -> list[str]:
+        items = value.get(key, [])
+        if not isinstance(items, list) or not all(
+            isinstance(item, str) for item in items
+        ):
+            raise TypeError(f"'{key}' must be a list of strings")
+        return items
+
+    if not isinstance(value, dict):
+        raise TypeError("REUSE information must be an object")
+    return ReuseInfo(
+        spdx_expressions=frozenset(
+            SpdxExpression(item) for item in strings("spdx_expressions")
+        ),
+        copyright_notices=frozenset(
+            CopyrightNotice.from_string(item)
+            for item in strings("copyright_notices")
+        ),
+        contributor_lines=frozenset(strings("contributor_lines")),
+    )
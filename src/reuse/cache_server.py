@@ -0,0 +1,167 @@
+# SPDX-FileCopyrightText: 2025 Free Software Foundation Europe e.V. <https://fsfe.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""A small HTTP server that stores the REUSE information in the contents of
+files for :class:`reuse.cache.HTTPCacheBackend`, so that it can be shared
+between clones and machines.
+
+The server stores JSON values under opaque names in an SQLite database. It
+understands the following requests:
+
+- ``GET /entries/<name>`` returns the value of *name*, or 404.
+- ``PUT /entries/<name>`` sets the value of *name* to the JSON request body.
+- ``PUT /entries`` sets the values of the names in the JSON object in the
+  request body.
+- ``POST /lookup`` returns a JSON object with the values of those names in the
+  JSON array in the request body that the server has.
+
+The server does not check the values. Anyone who can write to it can change
+the results of the clients that read from it.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from .types import StrPath
+
+_LOGGER = logging.getLogger(__name__)
+
+#: Requests with larger bodies are refused.
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+
+class CacheServer(ThreadingHTTPServer):
+    """An HTTP server that stores entries in the SQLite database at
+    *database*.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], database: StrPath):
+        super().__init__(address, _CacheRequestHandler)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " name TEXT PRIMARY KEY, value TEXT)"
+            )
+
+    def server_close(self) -> None:
+        super().server_close()
+        with self._lock:
+            self._connection.close()
+
+    def lookup(self, names: list[str]) -> dict[str, Any]:
+        """Return the values of those *names* that are stored."""
+        result: dict[str, Any] = {}
+        with self._lock:
+            for name in names:
+                row = self._connection.execute(
+                    "SELECT value FROM entries WHERE name = ?", (name,)
+                ).fetchone()
+                if row is not None:
+                    result[name] = json.loads(row[0])
+        return result
+
+    def store(self, entries: dict[str, Any]) -> None:
+        """Store *entries*, replacing the values of existing names."""
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?)",
+                ((name, json.dumps(value)) for name, value in entries.items()),
+            )
+
+
+class _CacheRequestHandler(BaseHTTPRequestHandler):
+    """Handle the requests of :class:`CacheServer`."""
+
+    # Keep connections open between requests.
+    protocol_version = "HTTP/1.1"
+    server: CacheServer
+
+    def log_message(self, format: str, *args: Any) -> None:
+        _LOGGER.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status: HTTPStatus, body: Any = None) -> None:
+        data = b"" if body is None else json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_body(self) -> Any:
+        """Return the decoded JSON body of the request. If it is invalid,
+        respond with an error and return :const:`None`.
+        """
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if not 0 <= length <= MAX_BODY_SIZE:
+                raise ValueError(f"invalid Content-Length: {length}")
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            # The rest of the body may still be unread.
+            self.close_connection = True
+            self._send(HTTPStatus.BAD_REQUEST)
+            return None
+        if body is None:
+            self._send(HTTPStatus.BAD_REQUEST)
+        return body
+
+    def _name(self) -> str | None:
+        """Return the name in the path of the request, if it is of an entry."""
+        prefix, _, name = self.path.partition("/entries/")
+        if prefix or not name or "/" in name:
+            return None
+        return name
+
+    def do_GET(self) -> None:
+        # pylint: disable=invalid-name,missing-function-docstring
+        name = self._name()
+        if name is None:
+            self._send(HTTPStatus.NOT_FOUND)
+            return
+        found = self.server.lookup([name])
+        if name in found:
+            self._send(HTTPStatus.OK, found[name])
+        else:
+            self._send(HTTPStatus.NOT_FOUND)
+
+    def do_PUT(self) -> None:
+        # pylint: disable=invalid-name,missing-function-docstring
+        body = self._read_body()
+        if body is None:
+            return
+        if self.path == "/entries":
+            if not isinstance(body, dict):
+                self._send(HTTPStatus.BAD_REQUEST)
+                return
+            self.server.store(body)
+        elif (name := self._name()) is not None:
+            self.server.store({name: body})
+        else:
+            self._send(HTTPStatus.NOT_FOUND)
+            return
+        self._send(HTTPStatus.NO_CONTENT)
+
+    def do_POST(self) -> None:
+        # pylint: disable=invalid-name,missing-function-docstring
+        body = self._read_body()
+        if body is None:
+            return
+        if self.path != "/lookup":
+            self._send(HTTPStatus.NOT_FOUND)
+            return
+        if not isinstance(body, list) or not all(
+            isinstance(name, str) for name in body
+        ):
+            self._send(HTTPStatus.BAD_REQUEST)
+            return
+        self._send(HTTPStatus.OK, self.server.lookup(body))
@@ -6,6 +6,7 @@
 
 from . import (
     annotate,
+    cache_server,
     convert_dep5,
     download,
     lint,
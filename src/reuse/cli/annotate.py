@@ -278,14 +278,14 @@ def get_reuse_info(
         if copyright_prefix is not None
         else CopyrightPrefix.SPDX
     )
-    copyright_notices = {
+    copyright_notices = frozenset(
         CopyrightNotice(item, years=years, prefix=prefix) for item in copyrights
-    }
+    )
 
     return ReuseInfo(
-        spdx_expressions=set(licenses),
+        spdx_expressions=frozenset(licenses),
         copyright_notices=copyright_notices,
-        contributor_lines=set(contributors),
+        contributor_lines=frozenset(contributors),
     )
 
 
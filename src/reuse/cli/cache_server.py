@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2025 Free Software Foundation Europe e.V. <https://fsfe.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Click code for cache-server subcommand."""
+
+from pathlib import Path
+
+import click
+
+from ..cache_server import CacheServer
+from ..i18n import _
+from .common import ClickObj
+from .main import main
+
+_HELP = _(
+    "Serve a cache of the REUSE information in the contents of files over"
+    " HTTP, to be used with '--cache-url'. Only run this server for clients"
+    " that you trust, because they can change each other's results."
+)
+
+
+@main.command(name="cache-server", help=_HELP)
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    show_default=True,
+    help=_("Address on which to listen."),
+)
+@click.option(
+    "--port",
+    type=click.IntRange(0, 65535),
+    default=8000,
+    show_default=True,
+    help=_("Port on which to listen."),
+)
+@click.option(
+    "--database",
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default=Path("reuse-cache.sqlite"),
+    show_default=True,
+    help=_("SQLite database in which to store the cache."),
+)
+@click.pass_obj
+def cache_server(_obj: ClickObj, host: str, port: int, database: Path) -> None:
+    # pylint: disable=missing-function-docstring
+    try:
+        server = CacheServer((host, port), database)
+    except OSError as error:
+        raise click.UsageError(str(error)) from error
+    with server:
+        click.echo(
+            _("Serving on http://{host}:{port}/").format(
+                host=host, port=server.server_address[1]
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -12,6 +12,7 @@ from typing import Any
 
 import click
 
+from ..cache import CacheMode
 from ..copyright import SpdxExpression
 from ..exceptions import GlobalLicensingConflictError, GlobalLicensingParseError
 from ..i18n import _
@@ -27,6 +28,9 @@ class ClickObj:
     include_submodules: bool = False
     include_meson_subprojects: bool = False
     no_multiprocessing: bool = True
+    no_cache: bool = True
+    cache_mode: CacheMode = CacheMode.METADATA
+    cache_url: str | None = None
 
     @cached_property
     def project(self) -> Project:
@@ -42,6 +46,9 @@ class ClickObj:
                 root,
                 include_submodules=self.include_submodules,
                 include_meson_subprojects=self.include_meson_subprojects,
+                use_cache=not self.no_cache,
+                cache_mode=self.cache_mode,
+                cache_url=self.cache_url,
             )
         # FileNotFoundError and NotADirectoryError don't need to be caught
         # because argparse already made sure of these things.
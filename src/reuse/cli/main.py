@@ -20,6 +20,7 @@ from click.formatting import wrap_text
 
 from .. import __REUSE_version__
 from .._util import setup_logging
+from ..cache import CacheMode, HTTPCacheBackend
 from ..i18n import _
 from .common import ClickObj
 
@@ -107,6 +108,31 @@ _HELP = (
     is_flag=True,
     help=_("Do not use multiprocessing."),
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help=_("Do not cache results between runs."),
+)
+@click.option(
+    "--cache-mode",
+    type=click.Choice([mode.value for mode in CacheMode]),
+    default=CacheMode.METADATA.value,
+    show_default=True,
+    help=_(
+        "Identify cached files by their metadata, or by their contents. The"
+        " latter cache is valid across clones and machines."
+    ),
+)
+@click.option(
+    "--cache-url",
+    metavar="URL",
+    default=None,
+    help=_(
+        "Share the cache with other clones through the server at URL, such as"
+        " one started with 'reuse cache-server'. Requires '--cache-mode"
+        " content'."
+    ),
+)
 @click.option(
     "--root",
     type=click.Path(
@@ -129,6 +155,9 @@ def main(
     include_submodules: bool,
     include_meson_subprojects: bool,
     no_multiprocessing: bool,
+    no_cache: bool,
+    cache_mode: str,
+    cache_url: str | None,
     root: Path | None,
 ) -> None:
     # pylint: disable=missing-function-docstring,too-many-arguments
@@ -139,6 +168,20 @@ def main(
     if ctx.invoked_subcommand == "convert-dep5":
         os.environ["_SUPPRESS_DEP5_WARNING"] = "1"
 
+    if cache_url is not None:
+        if no_cache:
+            raise click.UsageError(
+                _("'--cache-url' cannot be used with '--no-cache'.")
+            )
+        if CacheMode(cache_mode) != CacheMode.CONTENT:
+            raise click.UsageError(
+                _("'--cache-url' requires '--cache-mode content'.")
+            )
+        try:
+            HTTPCacheBackend(cache_url)
+        except ValueError as error:
+            raise click.UsageError(str(error)) from error
+
     if not suppress_deprecation:
         warnings.filterwarnings("default", module="reuse")
 
@@ -147,4 +190,7 @@ def main(
         include_submodules=include_submodules,
         include_meson_subprojects=include_meson_subprojects,
         no_multiprocessing=no_multiprocessing,
+        no_cache=no_cache,
+        cache_mode=CacheMode(cache_mode),
+        cache_url=cache_url,
     )
@@ -6,6 +6,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+# pylint: disable=too-many-lines
+
 """Utilities related to the parsing and storing of copyright notices."""
 
 import difflib
@@ -13,12 +15,13 @@ import logging
 import re
 from collections import Counter, defaultdict
 from collections.abc import Iterable
-from dataclasses import InitVar, dataclass, field
+from collections.abc import Set as AbstractSet
+from dataclasses import InitVar, dataclass, field, fields, replace
 from enum import Enum, unique
-from functools import cached_property
+from functools import cached_property, lru_cache
 from io import StringIO
 from itertools import chain
-from typing import Any, Literal, NewType, cast
+from typing import Any, ClassVar, Literal, NamedTuple, NewType, cast
 
 from license_expression import (
     ExpressionError,
@@ -35,6 +38,13 @@ _LOGGER = logging.getLogger(__name__)
 
 _LICENSING = Licensing()
 
+#: The maximum number of distinct copyright notices that are kept in the
+#: process-wide intern table of :meth:`CopyrightNotice.from_match`.
+NOTICE_CACHE_SIZE = 2048
+#: The maximum number of distinct SPDX License Expressions that are kept in the
+#: process-wide parse cache of :class:`SpdxExpression`.
+EXPRESSION_CACHE_SIZE = 4096
+
 #: A string that is four digits long.
 FourDigitString = NewType("FourDigitString", str)
 #: A range separator between two years.
@@ -197,6 +207,13 @@ class CopyrightPrefix(Enum):
         return name.upper().replace("-", "_")
 
 
+#: Map of every :class:`CopyrightPrefix` value, with all whitespace removed, to
+#: its enum member.
+_PREFIX_TABLE: dict[str, CopyrightPrefix] = {
+    _WHITESPACE_PATTERN.sub("", item.value): item for item in CopyrightPrefix
+}
+
+
 @dataclass(frozen=True)
 class YearRange:
     """Represents a year range, such as '2017-2025', or '2017'. This only
@@ -465,6 +482,21 @@ def _most_common_prefix(
     return CopyrightPrefix.SPDX
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of a process-wide parse cache."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
 @dataclass(frozen=True)
 class CopyrightNotice:
     """Represents a single copyright notice."""
@@ -503,15 +535,15 @@ class CopyrightNotice:
         """Given a matched prefix from :const:`COPYRIGHT_NOTICE_PATTERN`, detect
         the associated prefix.
         """
-        # String-match the prefix.
-        for prefix_enum in (
-            cast(CopyrightPrefix, item) for item in reversed(CopyrightPrefix)
-        ):
-            if prefix == prefix_enum.value:
-                return prefix_enum
-        # The prefix could not be string-matched, most likely because there
-        # was unexpected spacing in the prefix. Get a close match using
-        # difflib.
+        # Look up the prefix with all whitespace removed, which also covers
+        # unexpected spacing such as 'SPDX-FileCopyrightText:  Copyright'.
+        if (
+            prefix_enum := _PREFIX_TABLE.get(
+                _WHITESPACE_PATTERN.sub("", prefix)
+            )
+        ) is not None:
+            return prefix_enum
+        # The prefix is malformed. Get a close match using difflib.
         matches = difflib.get_close_matches(
             prefix,
             # TODO: In Python 3.11, this list comprehension is not needed.
@@ -529,10 +561,40 @@ class CopyrightNotice:
     def from_match(cls, value: re.Match) -> "CopyrightNotice":
         """Create a :class:`CopyrightNotice` object from a regular expression
         match using the :const:`COPYRIGHT_NOTICE_PATTERN` :class:`re.Pattern`.
+
+        Identical notices are interned: parsing the same text twice returns the
+        same immutable object. See :meth:`cache_info`.
+        """
+        if cls is not CopyrightNotice:
+            return cls._from_parts(
+                value.group("prefix"), value.group("text"), value.string
+            )
+        return _intern_notice(
+            value.group("prefix"), value.group("text"), value.string
+        )
+
+    @classmethod
+    def cache_info(cls) -> CacheInfo:
+        """Return statistics of the intern table of :meth:`from_match`."""
+        # pylint: disable=no-value-for-parameter
+        return CacheInfo._make(_intern_notice.cache_info())
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Empty the intern table of :meth:`from_match` and reset its
+        statistics.
         """
-        prefix = cls._detect_prefix(value.group("prefix"))
+        _intern_notice.cache_clear()
+
+    @classmethod
+    def _from_parts(
+        cls, raw_prefix: str, re_text: str, original: str
+    ) -> "CopyrightNotice":
+        """Parse the *prefix* and *text* groups of a match of
+        :const:`COPYRIGHT_NOTICE_PATTERN` in *original*.
+        """
+        prefix = cls._detect_prefix(raw_prefix)
 
-        re_text = value.group("text")
         year_ranges_substrings = list(_YEARS_PATTERN.finditer(re_text))
         start_ends: list[tuple[int, int]] = [
             (match.start("prefix"), match.end("years"))
@@ -566,7 +628,7 @@ class CopyrightNotice:
             prefix=prefix,
             years=years,
         )
-        object.__setattr__(result, "original", value.string)
+        object.__setattr__(result, "original", original)
         return result
 
     @classmethod
@@ -636,6 +698,118 @@ class CopyrightNotice:
         return str(self)
 
 
+@lru_cache(maxsize=NOTICE_CACHE_SIZE)
+def _intern_notice(prefix: str, text: str, original: str) -> CopyrightNotice:
+    return CopyrightNotice._from_parts(  # pylint: disable=protected-access
+        prefix, text, original
+    )
+
+
+_SIMPLE_LICENSE_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9.\-]*\+?")
+_SIMPLE_EXCEPTION_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9.\-]*")
+_OPERATOR_KEYWORDS = frozenset(("and", "or", "with"))
+
+
+class _ParsedExpression:
+    """The parse result of a valid SPDX License Expression. The
+    :class:`LicenseExpression` tree is only built when it is first needed.
+    """
+
+    __slots__ = ("_text", "_expression", "licenses", "string")
+
+    def __init__(
+        self,
+        text: str,
+        licenses: tuple[str, ...],
+        string: str,
+        expression: LicenseExpression | None = None,
+    ):
+        self._text = text
+        self._expression = expression
+        self.licenses = licenses
+        self.string = string
+
+    @property
+    def expression(self) -> LicenseExpression:
+        """The parsed :class:`LicenseExpression` tree."""
+        if self._expression is None:
+            self._expression = _LICENSING.parse(self._text, simple=True)
+        return self._expression
+
+
+def _parse_simple_expression(text: str) -> _ParsedExpression | None:
+    """Recognise the common forms of expressions without handing them to the
+    :class:`Licensing` parser: a single license, optionally followed by ``+``
+    or a ``WITH`` exception, or a flat list of such licenses joined by only
+    ``AND`` or only ``OR``. *text* must have its whitespace normalised.
+
+    Return :const:`None` if *text* is not of such a form. This does not mean
+    that it is invalid.
+    """
+    tokens = text.split(" ")
+    licenses: dict[str, None] = {}
+    operator: str | None = None
+    index = 0
+    while True:
+        key = tokens[index]
+        if (
+            not _SIMPLE_LICENSE_PATTERN.fullmatch(key)
+            or key.lower() in _OPERATOR_KEYWORDS
+        ):
+            return None
+        licenses[key] = None
+        index += 1
+        if index < len(tokens) and tokens[index] == "WITH":
+            if index + 1 == len(tokens):
+                return None
+            exception = tokens[index + 1]
+            if (
+                not _SIMPLE_EXCEPTION_PATTERN.fullmatch(exception)
+                or exception.lower() in _OPERATOR_KEYWORDS
+            ):
+                return None
+            licenses[exception] = None
+            index += 2
+        if index == len(tokens):
+            break
+        if tokens[index] not in ("AND", "OR") or index + 1 == len(tokens):
+            return None
+        if operator is None:
+            operator = tokens[index]
+        elif tokens[index] != operator:
+            return None
+        index += 1
+    return _ParsedExpression(text, tuple(licenses), text)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _parse_normalised_expression(text: str) -> _ParsedExpression | None:
+    if (simple := _parse_simple_expression(text)) is not None:
+        return simple
+    try:
+        expression = _LICENSING.parse(text, simple=True)
+    except ExpressionError:
+        return None
+    if expression is None:
+        return None
+    return _ParsedExpression(
+        text,
+        tuple(_LICENSING.license_keys(expression)),
+        str(expression),
+        expression,
+    )
+
+
+def _parse_expression(text: str) -> _ParsedExpression | None:
+    """Parse *text* as an SPDX License Expression, or return :const:`None` if
+    it is invalid. Results are shared between all texts that only differ in
+    whitespace.
+    """
+    return _parse_normalised_expression(
+        _WHITESPACE_PATTERN.sub(" ", text).strip()
+    )
+
+
 @dataclass(frozen=True)
 class SpdxExpression:
     """A simple dataclass that contains an SPDX License Expression.
@@ -660,7 +834,14 @@ class SpdxExpression:
         specification. The licenses and exceptions need not appear on the
         license list.
         """
-        return self._expression is not None
+        return self._parsed is not None
+
+    @cached_property
+    def _parsed(self) -> _ParsedExpression | None:
+        """The shared parse result of :attr:`text`, or :const:`None` if
+        :attr:`text` could not be parsed.
+        """
+        return _parse_expression(self._text)
 
     @cached_property
     def _expression(self) -> LicenseExpression | None:
@@ -668,10 +849,9 @@ class SpdxExpression:
         :attr:`text` could not be parsed, *_expression*'s value is
         :const:`None`.
         """
-        try:
-            return _LICENSING.parse(self._text, simple=True)
-        except ExpressionError:
-            return None
+        if self._parsed is not None:
+            return self._parsed.expression
+        return None
 
     @cached_property
     def licenses(self) -> list[str]:
@@ -681,10 +861,20 @@ class SpdxExpression:
         If the expression is invalid, the list contains a single item
         :attr:`text`.
         """
-        if self._expression is not None:
-            return _LICENSING.license_keys(self._expression)
+        if self._parsed is not None:
+            return list(self._parsed.licenses)
         return [self._text]
 
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return statistics of the process-wide parse cache."""
+        return CacheInfo._make(_parse_normalised_expression.cache_info())
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Empty the process-wide parse cache and reset its statistics."""
+        _parse_normalised_expression.cache_clear()
+
     @classmethod
     def combine(
         cls,
@@ -730,13 +920,15 @@ class SpdxExpression:
         """Return a string representation of the expression if it is valid.
         Otherwise, return :attr:`text`.
         """
-        if self._expression is not None:
-            return str(self._expression)
+        if self._parsed is not None:
+            return self._parsed.string
         return self._text
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, SpdxExpression):
             return NotImplemented
+        if self._parsed is not None and self._parsed is other._parsed:
+            return True
         if self._expression is not None and other._expression is not None:
             return self._expression == other._expression
         return self._text == other._text
@@ -762,19 +954,55 @@ class SourceType(Enum):
     REUSE_TOML = "reuse-toml"
 
 
-@dataclass(frozen=True, kw_only=True)
+_REUSE_INFO_SET_FIELDS = (
+    "spdx_expressions",
+    "copyright_notices",
+    "contributor_lines",
+)
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ReuseInfo:
-    """Simple dataclass holding licensing and copyright information"""
+    """Simple dataclass holding licensing and copyright information.
+
+    The sets are stored as :class:`frozenset`, so that instances can share
+    them. Sets that are passed to the constructor are converted.
+    """
+
+    #: A shared, empty instance.
+    EMPTY: ClassVar["ReuseInfo"]
 
-    spdx_expressions: set[SpdxExpression] = field(default_factory=set)
-    copyright_notices: set[CopyrightNotice] = field(default_factory=set)
-    contributor_lines: set[str] = field(default_factory=set)
+    spdx_expressions: AbstractSet[SpdxExpression] = frozenset()
+    copyright_notices: AbstractSet[CopyrightNotice] = frozenset()
+    contributor_lines: AbstractSet[str] = frozenset()
     path: str | None = None
     source_path: str | None = None
     source_type: SourceType | None = None
+    #: Whether the source of this information was not scanned in full, because
+    #: an extraction limit was hit.
+    partially_scanned: bool = False
+
+    _contains_info: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        for key in _REUSE_INFO_SET_FIELDS:
+            value = getattr(self, key)
+            if not isinstance(value, frozenset):
+                object.__setattr__(self, key, frozenset(value))
+        object.__setattr__(
+            self,
+            "_contains_info",
+            bool(
+                self.spdx_expressions
+                or self.copyright_notices
+                or self.contributor_lines
+            ),
+        )
 
     def _check_nonexistent(self, **kwargs: Any) -> None:
-        nonexistent_attributes = set(kwargs) - set(self.__dict__)
+        nonexistent_attributes = kwargs.keys() - _REUSE_INFO_FIELDS
         if nonexistent_attributes:
             raise KeyError(
                 f"The following attributes do not exist in"
@@ -783,13 +1011,20 @@ class ReuseInfo:
 
     def copy(self, **kwargs: Any) -> "ReuseInfo":
         """Return a copy of ReuseInfo, replacing the values of attributes with
-        the values from *kwargs*.
+        the values from *kwargs*. The copy shares all sets that are not
+        replaced.
         """
+        if not kwargs:
+            return self
         self._check_nonexistent(**kwargs)
-        new_kwargs = {}
-        for key, value in self.__dict__.items():
-            new_kwargs[key] = kwargs.get(key, value)
-        return self.__class__(**new_kwargs)  # type: ignore
+        if any(key in kwargs for key in _REUSE_INFO_SET_FIELDS):
+            return replace(self, **kwargs)
+        # None of the sets change, so nothing needs to be converted or
+        # recomputed.
+        result = object.__new__(self.__class__)
+        for key in _REUSE_INFO_SLOTS:
+            object.__setattr__(result, key, kwargs.get(key, getattr(self, key)))
+        return result
 
     def union(self, *other: "ReuseInfo") -> "ReuseInfo":
         """Return a new instance of ReuseInfo where all set attributes are equal
@@ -807,17 +1042,19 @@ class ReuseInfo:
         >>> print(result.source_path)
         foo.py
         """
+        # pylint: disable=protected-access
+        other = tuple(info for info in other if info._contains_info)
         if not other:
             return self
-        new_kwargs = {}
-        for key, attr_val in self.__dict__.items():
-            if isinstance(attr_val, set):
-                new_kwargs[key] = attr_val.union(
+        return replace(
+            self,
+            **{
+                key: getattr(self, key).union(
                     *(getattr(info, key) for info in other)
                 )
-            else:
-                new_kwargs[key] = attr_val
-        return self.__class__(**new_kwargs)  # type: ignore
+                for key in _REUSE_INFO_SET_FIELDS
+            },
+        )
 
     def contains_copyright_or_licensing(self) -> bool:
         """Either *spdx_expressions* or *copyright_notices* is non-empty."""
@@ -828,21 +1065,29 @@ class ReuseInfo:
         return bool(self.spdx_expressions) ^ bool(self.copyright_notices)
 
     def contains_info(self) -> bool:
-        """Any field except *path*, *source_path* and *source_type* is
-        non-empty.
+        """Any field except *path*, *source_path*, *source_type* and
+        *partially_scanned* is non-empty.
         """
-        keys = {
-            key
-            for key in self.__dict__
-            if key not in ("path", "source_path", "source_type")
-        }
-        return any(self.__dict__[key] for key in keys)
+        return self._contains_info
 
     def __bool__(self) -> bool:
-        return any(self.__dict__.values())
+        return bool(
+            self._contains_info
+            or self.path
+            or self.source_path
+            or self.source_type
+            or self.partially_scanned
+        )
 
     def __or__(self, value: "ReuseInfo") -> "ReuseInfo":
         return self.union(value)
 
 
+_REUSE_INFO_FIELDS = frozenset(
+    item.name for item in fields(ReuseInfo) if item.init
+)
+_REUSE_INFO_SLOTS = tuple(item.name for item in fields(ReuseInfo))
+ReuseInfo.EMPTY = ReuseInfo()
+
+
 # REUSE-IgnoreEnd
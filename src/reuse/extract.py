@@ -13,6 +13,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+# pylint: disable=too-many-lines
+
 """Utilities related to the extraction of REUSE information out of files."""
 
 import codecs
@@ -23,12 +25,33 @@ import os
 import platform
 import re
 import sys
+import time
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from encodings import aliases, normalize_encoding
-from itertools import chain
+from functools import lru_cache
+from itertools import chain, pairwise
+from pathlib import Path
 from types import ModuleType
 from typing import BinaryIO, Generator, Literal, NamedTuple, cast
 
-from .comment import _all_style_classes
+from .comment import (
+    CCommentStyle,
+    CommentStyle,
+    HaskellCommentStyle,
+    LispCommentStyle,
+    PascalCommentStyle,
+    PythonCommentStyle,
+    _all_style_classes,
+    get_comment_style,
+)
 from .copyright import (
     COPYRIGHT_NOTICE_PATTERN,
     CopyrightNotice,
@@ -37,6 +60,7 @@ from .copyright import (
 )
 from .exceptions import NoEncodingModuleError
 from .i18n import _
+from .types import StrPath
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -222,6 +246,19 @@ _LINE_ENDING_ENCODINGS_UTF_32_LE = {
     "utf_32_le",
 }
 
+# Encodings that consume a byte order mark when decoding, mapped to an encoding
+# that encodes to the same amount of bytes without emitting a byte order mark.
+_FIXED_BYTE_ORDER_ENCODINGS = {
+    "utf_8_sig": "utf_8",
+    "utf_16": "utf_16_le",
+    "utf_32": "utf_32_le",
+}
+_BYTE_ORDER_MARKS = {
+    "utf_8_sig": (codecs.BOM_UTF8,),
+    "utf_16": (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE),
+    "utf_32": (codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE),
+}
+
 
 #: Default chunk size for reading files.
 CHUNK_SIZE = 1024 * 64
@@ -230,6 +267,17 @@ LINE_SIZE = 1024
 #: Default chunk size used to heuristically detect file type, encoding, et
 #: cetera.
 HEURISTICS_CHUNK_SIZE = 1024 * 2
+#: Files of at least this size are split into ranges that are scanned in
+#: parallel. See :func:`reuse_info_of_large_file`.
+LARGE_FILE_SIZE = 1024 * 1024 * 256
+#: Default size of the ranges into which large files are split.
+RANGE_SIZE = 1024 * 1024 * 32
+#: Lines that contain a tag and that are longer than this amount of characters
+#: are only partially parsed.
+MAX_LINE_LENGTH = 1024 * 4
+#: Default amount of seconds after which the search for REUSE information in a
+#: single file (or range of a large file) is cut short.
+TIME_BUDGET = 60.0
 
 
 class FilterBlock(NamedTuple):
@@ -241,6 +289,40 @@ class FilterBlock(NamedTuple):
     in_ignore_block: bool
 
 
+def _retained_spans(
+    text: str,
+    in_ignore_block: bool = False,
+    start_marker: str = REUSE_IGNORE_START,
+    end_marker: str = REUSE_IGNORE_END,
+) -> tuple[list[tuple[int, int]], bool]:
+    """Scan *text* once from start to end, and return the ``(start, end)``
+    offsets of all spans that are not inside of an ignore block, alongside
+    whether the ignore block is still open at the end of *text*.
+
+    The ignore block is delimited by *start_marker* and *end_marker*.
+    """
+    spans: list[tuple[int, int]] = []
+    position = 0
+    length = len(text)
+    while position < length:
+        if in_ignore_block:
+            end = text.find(end_marker, position)
+            if end == -1:
+                break
+            position = end + len(end_marker)
+            in_ignore_block = False
+        else:
+            start = text.find(start_marker, position)
+            if start == -1:
+                spans.append((position, length))
+                break
+            if start > position:
+                spans.append((position, start))
+            position = start + len(start_marker)
+            in_ignore_block = True
+    return spans, in_ignore_block
+
+
 def filter_ignore_block(
     text: str, in_ignore_block: bool = False
 ) -> FilterBlock:
@@ -248,6 +330,9 @@ def filter_ignore_block(
     REUSE_IGNORE_END to remove lines that should not be treated as copyright and
     licensing information.
 
+    The text is scanned linearly, so the amount of ignore blocks in the text
+    does not affect the recursion depth or lead to repeated copying.
+
     Args:
         text: The text out of which the ignore blocks must be filtered.
         in_ignore_block: Whether the text is already in an ignore block. This is
@@ -258,64 +343,209 @@ def filter_ignore_block(
         A :class:`FilterBlock` tuple that contains the filtered text and a
         boolean that signals whether the ignore block is still open.
     """
-    ignore_start: int | None = None if not in_ignore_block else 0
-    ignore_end: int | None = None
-    if REUSE_IGNORE_START in text:
-        ignore_start = text.index(REUSE_IGNORE_START)
-    if REUSE_IGNORE_END in text:
-        ignore_end = text.index(REUSE_IGNORE_END) + len(REUSE_IGNORE_END)
-    if ignore_start is None:
-        return FilterBlock(text, False)
-    if ignore_end is None:
-        return FilterBlock(text[:ignore_start], True)
-    if ignore_start < ignore_end:
-        text_before_block = text[:ignore_start]
-        text_after_block, in_ignore_block = filter_ignore_block(
-            text[ignore_end:], False
-        )
-        return FilterBlock(
-            text_before_block + text_after_block, in_ignore_block
-        )
-    rest = text[ignore_start + len(REUSE_IGNORE_START) :]
-    if REUSE_IGNORE_END in rest:
-        ignore_end = rest.index(REUSE_IGNORE_END) + len(REUSE_IGNORE_END)
-        text_before_block = text[:ignore_start]
-        text_after_block, in_ignore_block = filter_ignore_block(
-            rest[ignore_end:]
-        )
-        return FilterBlock(
-            text_before_block + text_after_block, in_ignore_block
+    spans, in_ignore_block = _retained_spans(text, in_ignore_block)
+    if len(spans) == 1 and spans[0] == (0, len(text)):
+        return FilterBlock(text, in_ignore_block)
+    return FilterBlock(
+        "".join(text[start:end] for start, end in spans), in_ignore_block
+    )
+
+
+class ReuseTag(NamedTuple):
+    """A single tag of REUSE information found in a file.
+
+    *kind* is the name of the :class:`ReuseInfo` attribute that the *value*
+    belongs to. *line* is the 1-indexed line number of the tag. *start* and
+    *end* are the byte offsets in the file from the start of the tag up to the
+    end of its line. The offsets are exact for files that are valid in
+    *encoding*.
+    """
+
+    kind: Literal["copyright_notices", "spdx_expressions", "contributor_lines"]
+    value: CopyrightNotice | SpdxExpression | str
+    line: int
+    start: int
+    end: int
+    encoding: str
+
+
+def _parse_tag(
+    possible: re.Match,
+) -> tuple[str, CopyrightNotice | SpdxExpression | str] | None:
+    """Given a match of :const:`_ALL_MATCH_PATTERN`, return the kind and value
+    of the REUSE tag on that line, or :const:`None` if there is no tag.
+
+    Lines longer than :const:`MAX_LINE_LENGTH` are cut down to that length,
+    starting at the tag, so that the patterns do not take unreasonably long.
+    """
+    possible_text = possible.group()
+    if len(possible_text) > MAX_LINE_LENGTH:
+        start = possible.end("prefix") - possible.start()
+        possible_text = possible_text[start : start + MAX_LINE_LENGTH]
+    else:
+        prefix = possible.group("prefix").strip()
+        reversed_prefix = prefix[::-1]
+        possible_text = possible_text.removesuffix(reversed_prefix)
+    if match := _COPYRIGHT_NOTICE_PATTERN.match(possible_text):
+        return "copyright_notices", CopyrightNotice.from_match(match)
+    if match := _LICENSE_IDENTIFIER_PATTERN.match(possible_text):
+        return "spdx_expressions", SpdxExpression(match.group("value"))
+    if match := _CONTRIBUTOR_PATTERN.match(possible_text):
+        return "contributor_lines", match.group("value")
+    return None
+
+
+#: Single-line comment markers of languages that their comment style does not
+#: write, but in which existing headers are commonly written, such as the
+#: ``//`` headers of C files in the Linux kernel.
+_EXTRA_SINGLE_LINE_MARKERS: dict[type[CommentStyle], tuple[str, ...]] = {
+    CCommentStyle: ("//",),
+}
+
+#: Comment styles whose languages have comments that the style does not
+#: describe, or whose headers are commonly not comments at all, such as Python
+#: docstrings. Only searching the comments of these files would miss REUSE
+#: information, so they are searched entirely.
+_INCOMPLETE_COMMENT_STYLES: frozenset[type[CommentStyle]] = frozenset(
+    {
+        # {- ... -}
+        HaskellCommentStyle,
+        # #| ... |#
+        LispCommentStyle,
+        # (* ... *)
+        PascalCommentStyle,
+        # """...""" and '''...'''
+        PythonCommentStyle,
+    }
+)
+
+
+def _can_filter_comments(style: type[CommentStyle]) -> bool:
+    """Whether only the comments of text in *style* can be searched without
+    missing REUSE information.
+    """
+    return (
+        style.can_handle_single() or style.can_handle_multi()
+    ) and style not in _INCOMPLETE_COMMENT_STYLES
+
+
+@lru_cache
+def _single_line_comment_pattern(
+    style: type[CommentStyle],
+) -> re.Pattern | None:
+    """Return a pattern that matches every line that contains a single-line
+    comment marker of *style*, including those in
+    :data:`_EXTRA_SINGLE_LINE_MARKERS`, or :const:`None` if *style* has no
+    single-line comments.
+    """
+    markers = [
+        re.escape(marker)
+        for marker in _EXTRA_SINGLE_LINE_MARKERS.get(style, ())
+    ]
+    if style.can_handle_single():
+        markers.append(re.escape(style.SINGLE_LINE))
+    if style.SINGLE_LINE_REGEXP:
+        markers.append(style.SINGLE_LINE_REGEXP.pattern.removeprefix("^"))
+    if not markers:
+        return None
+    return re.compile(rf"^[^\n]*?(?:{'|'.join(markers)})[^\n]*$", re.MULTILINE)
+
+
+def filter_comment_regions(
+    text: str, style: type[CommentStyle], in_comment: bool = False
+) -> tuple[str, bool]:
+    """Return only the lines of *text* that contain (part of) a comment in
+    *style*, and whether a multi-line comment is still open at the end of
+    *text*. This is a cheap approximation that does not account for comment
+    markers inside of string literals; it errs on the side of keeping lines.
+
+    Lines with the single-line comments of the language that *style* does not
+    write are kept, too, such as ``//`` comments in C. Some styles do not
+    describe all places in which their files have REUSE information, such as
+    Python docstrings. Files in such styles should be searched entirely; see
+    :func:`reuse_info_of_file`.
+
+    Args:
+        text: The text out of which the comment lines must be taken.
+        style: The comment style of *text*.
+        in_comment: Whether the text starts inside of a multi-line comment.
+            This is useful when you parse subsequent chunks of text.
+    """
+    spans: list[tuple[int, int]] = []
+    if style.can_handle_multi():
+        outside, in_comment = _retained_spans(
+            text, in_comment, style.MULTI_LINE.start, style.MULTI_LINE.end
         )
-    return FilterBlock(text[:ignore_start], True)
+        position = 0
+        for start, end in outside:
+            if start > position:
+                spans.append((position, start))
+            position = end
+        if position < len(text):
+            spans.append((position, len(text)))
+    if (
+        pattern := _single_line_comment_pattern(style)  # type: ignore[arg-type]
+    ) is not None:
+        spans.extend(match.span() for match in pattern.finditer(text))
+    spans.sort()
+
+    lines: list[str] = []
+    region_start = region_end = -1
+    for start, end in spans:
+        start = text.rfind("\n", 0, start) + 1
+        end = text.find("\n", end)
+        if end == -1:
+            end = len(text)
+        if start > region_end:
+            if region_end != -1:
+                lines.append(text[region_start:region_end])
+            region_start = start
+        region_end = max(region_end, end)
+    if region_end != -1:
+        lines.append(text[region_start:region_end])
+    return "\n".join(lines), in_comment
 
 
 def extract_reuse_info(text: str) -> ReuseInfo:
     """Extract REUSE information from a multi-line text block.
 
+    If a line with a tag is longer than :const:`MAX_LINE_LENGTH`, only the start
+    of that tag is parsed, and the result is marked as partially scanned.
+
     Raises:
         ExpressionError: if an SPDX expression could not be parsed.
         ParseError: if an SPDX expression could not be parsed.
     """
-    notices: set[CopyrightNotice] = set()
-    expressions: set[SpdxExpression] = set()
-    contributors: set[str] = set()
+    return _extract_reuse_info(text)
+
+
+def _extract_reuse_info(text: str, deadline: float | None = None) -> ReuseInfo:
+    """Like :func:`extract_reuse_info`, but stop parsing lines once
+    :func:`time.monotonic` passes *deadline*, in which case the result is marked
+    as partially scanned.
+    """
+    found: dict[str, set] = {
+        "copyright_notices": set(),
+        "spdx_expressions": set(),
+        "contributor_lines": set(),
+    }
+
+    partially_scanned = False
 
     for possible in _ALL_MATCH_PATTERN.finditer(text):
-        possible_text = possible.group()
-        prefix = possible.group("prefix").strip()
-        reversed_prefix = prefix[::-1]
-        possible_text = possible_text.removesuffix(reversed_prefix)
-        if match := _COPYRIGHT_NOTICE_PATTERN.match(possible_text):
-            notices.add(CopyrightNotice.from_match(match))
-        elif match := _LICENSE_IDENTIFIER_PATTERN.match(possible_text):
-            expressions.add(SpdxExpression(match.group("value")))
-        elif match := _CONTRIBUTOR_PATTERN.match(possible_text):
-            contributors.add(match.group("value"))
+        if deadline is not None and time.monotonic() > deadline:
+            partially_scanned = True
+            break
+        if possible.end() - possible.start() > MAX_LINE_LENGTH:
+            partially_scanned = True
+        if (tag := _parse_tag(possible)) is not None:
+            found[tag[0]].add(tag[1])
 
     return ReuseInfo(
-        spdx_expressions=expressions,
-        copyright_notices=notices,
-        contributor_lines=contributors,
+        spdx_expressions=frozenset(found["spdx_expressions"]),
+        copyright_notices=frozenset(found["copyright_notices"]),
+        contributor_lines=frozenset(found["contributor_lines"]),
+        partially_scanned=partially_scanned,
     )
 
 
@@ -466,16 +696,9 @@ def detect_newline(chunk: bytes, encoding: str = "ascii") -> str:
     return os.linesep
 
 
-def reuse_info_of_file(
-    fp: BinaryIO,
-    chunk_size: int = CHUNK_SIZE,
-    line_size: int = LINE_SIZE,
-) -> ReuseInfo:
-    """Read from *fp* to extract REUSE information. It is read in chunks of
-    *chunk_size*, additionally reading up to *line_size* until the next newline.
-
-    This function decodes the binary data into UTF-8 and removes REUSE ignore
-    blocks before attempting to extract the REUSE information.
+def _detect_file_encoding(fp: BinaryIO) -> tuple[str, str] | None:
+    """Detect the encoding and newline of *fp* without changing its position.
+    Return :const:`None` if *fp* is a binary file.
     """
     position = fp.tell()
     heuristics_chunk = fp.read(HEURISTICS_CHUNK_SIZE)
@@ -490,7 +713,7 @@ def reuse_info_of_file(
                     " contents for REUSE information."
                 ).format(path=filename)
             )
-        return ReuseInfo()
+        return None
 
     newline = detect_newline(heuristics_chunk, encoding=encoding)
 
@@ -507,19 +730,488 @@ def reuse_info_of_file(
                 newline=repr(newline),
             )
         )
-    in_ignore_block = False
+    return encoding, newline
+
+
+def reuse_info_of_file(
+    fp: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    line_size: int = LINE_SIZE,
+    time_budget: float | None = TIME_BUDGET,
+    comment_style: type[CommentStyle] | None = None,
+) -> ReuseInfo:
+    """Read from *fp* to extract REUSE information. It is read in chunks of
+    *chunk_size*, additionally reading up to *line_size* until the next newline.
+
+    This function decodes the binary data into UTF-8 and removes REUSE ignore
+    blocks before attempting to extract the REUSE information.
+
+    If *comment_style* is given, only the lines that contain comments in that
+    style are searched for REUSE information (see
+    :func:`filter_comment_regions`). If the style has no comments, or if its
+    files commonly have REUSE information outside of the comments that it
+    describes, such as in Python docstrings, the entire text is searched.
+
+    If reading and parsing *fp* takes longer than *time_budget* seconds, the
+    remainder of *fp* is not read, and the result is marked as partially
+    scanned. See also :func:`extract_reuse_info`.
+    """
+    detected = _detect_file_encoding(fp)
+    if detected is None:
+        return ReuseInfo.EMPTY
+    encoding, newline = detected
+
+    return _reuse_info_of_chunks(
+        _read_chunks(
+            fp,
+            chunk_size=chunk_size,
+            line_size=line_size,
+            newline=newline.encode(
+                _FIXED_BYTE_ORDER_ENCODINGS.get(encoding, encoding)
+            ),
+        ),
+        encoding,
+        time_budget=time_budget,
+        filename=getattr(fp, "name", None),
+        comment_style=comment_style,
+    )[0]
+
+
+def _reuse_info_of_chunks(
+    chunks: Iterable[bytes],
+    encoding: str,
+    in_ignore_block: bool = False,
+    time_budget: float | None = None,
+    filename: StrPath | None = None,
+    comment_style: type[CommentStyle] | None = None,
+) -> tuple[ReuseInfo, bool]:
+    """Decode *chunks* and extract their REUSE information. Return the
+    information and whether an ignore block is still open after the last chunk.
+
+    Stop consuming *chunks* after *time_budget* seconds. If *comment_style* is
+    given, only search the comments.
+    """
+    if comment_style is not None and not _can_filter_comments(comment_style):
+        comment_style = None
+    in_comment = False
+    deadline = None
+    if time_budget is not None:
+        deadline = time.monotonic() + time_budget
+    partially_scanned = False
     reuse_infos: list[ReuseInfo] = []
+    for chunk in chunks:
+        text = chunk.decode(encoding, errors="replace")
+        text = _NEWLINE_PATTERN.sub("\n", text)
+        text, in_ignore_block = filter_ignore_block(text, in_ignore_block)
+        if comment_style is not None:
+            text, in_comment = filter_comment_regions(
+                text, comment_style, in_comment
+            )
+        reuse_info = _extract_reuse_info(text, deadline)
+        partially_scanned |= reuse_info.partially_scanned
+        reuse_infos.append(reuse_info)
+        if deadline is not None and time.monotonic() > deadline:
+            partially_scanned = True
+            if filename:
+                _LOGGER.warning(
+                    _(
+                        "'{path}' could not be searched for REUSE information"
+                        " within {seconds} seconds; only part of the file was"
+                        " searched."
+                    ).format(path=filename, seconds=time_budget)
+                )
+            break
+    return (
+        ReuseInfo(partially_scanned=partially_scanned).union(*reuse_infos),
+        in_ignore_block,
+    )
+
+
+class _ByteCounter:
+    """Translate ascending character offsets in a decoded chunk into byte
+    offsets in the file, encoding only the text between two offsets at a time.
+    """
+
+    def __init__(self, decoded: str, byte_offset: int, encoding: str):
+        self.decoded = decoded
+        self.encoding = _FIXED_BYTE_ORDER_ENCODINGS.get(encoding, encoding)
+        self.char_position = 0
+        self.byte_position = byte_offset
+
+    def byte_offset(self, char_position: int) -> int:
+        """Return the byte offset of the character at *char_position*."""
+        self.byte_position += len(
+            self.decoded[self.char_position : char_position].encode(
+                self.encoding, errors="replace"
+            )
+        )
+        self.char_position = char_position
+        return self.byte_position
+
+
+def _bom_length(chunk: bytes, encoding: str) -> int:
+    """Return the length of the byte order mark at the start of *chunk* that is
+    consumed when decoding it with *encoding*.
+    """
+    for bom in _BYTE_ORDER_MARKS.get(encoding, ()):
+        if chunk.startswith(bom):
+            return len(bom)
+    return 0
+
+
+def _span_starts(spans: list[tuple[int, int]]) -> list[int]:
+    """Return the positions in the text joined from *spans* at which each span
+    starts.
+    """
+    result: list[int] = []
+    total = 0
+    for start, end in spans:
+        result.append(total)
+        total += end - start
+    return result
+
+
+def _unfiltered_position(
+    position: int, spans: list[tuple[int, int]], span_starts: list[int]
+) -> int:
+    """Translate *position* in the text joined from *spans* into the position
+    in the text from which the spans were taken.
+    """
+    index = bisect_right(span_starts, position) - 1
+    return spans[index][0] + position - span_starts[index]
+
+
+def reuse_tags_of_file(
+    fp: BinaryIO,
+    chunk_size: int = CHUNK_SIZE,
+    line_size: int = LINE_SIZE,
+) -> Generator[ReuseTag, None, None]:
+    """Read from *fp* and yield every REUSE tag as a :class:`ReuseTag` as soon
+    as it is found, in order of appearance. *fp* is read in the same way as in
+    :func:`reuse_info_of_file`, and REUSE ignore blocks are likewise skipped.
+
+    Because the tags are yielded lazily, the caller can stop reading the file
+    early by no longer iterating.
+
+    Raises:
+        ExpressionError: if an SPDX expression could not be parsed.
+        ParseError: if an SPDX expression could not be parsed.
+    """
+    # pylint: disable=too-many-locals
+    detected = _detect_file_encoding(fp)
+    if detected is None:
+        return
+    encoding, newline = detected
+
+    in_ignore_block = False
+    chunk_offset = fp.tell()
+    line = 1
     for chunk in _read_chunks(
         fp,
         chunk_size=chunk_size,
         line_size=line_size,
-        newline=newline.encode(encoding),
+        newline=newline.encode(
+            _FIXED_BYTE_ORDER_ENCODINGS.get(encoding, encoding)
+        ),
     ):
-        text = chunk.decode(encoding, errors="replace")
-        text = _NEWLINE_PATTERN.sub("\n", text)
-        text, in_ignore_block = filter_ignore_block(text, in_ignore_block)
-        reuse_infos.append(extract_reuse_info(text))
-    return ReuseInfo().union(*reuse_infos)
+        decoded = chunk.decode(encoding, errors="replace")
+        text = _NEWLINE_PATTERN.sub("\n", decoded)
+        # Positions in *text* where a '\r\n' was collapsed into one character.
+        collapsed = [
+            match.start() - i
+            for i, match in enumerate(re.finditer("\r\n", decoded))
+        ]
+        spans, in_ignore_block = _retained_spans(text, in_ignore_block)
+        filtered = "".join(text[start:end] for start, end in spans)
+        span_starts = _span_starts(spans)
+        counter = _ByteCounter(
+            decoded, chunk_offset + _bom_length(chunk, encoding), encoding
+        )
+        text_position = 0
+        for possible in _ALL_MATCH_PATTERN.finditer(filtered):
+            if (tag := _parse_tag(possible)) is None:
+                continue
+            start = _unfiltered_position(
+                possible.end("prefix"), spans, span_starts
+            )
+            end = _unfiltered_position(possible.end() - 1, spans, span_starts)
+            end += 1
+            line += text.count("\n", text_position, start)
+            text_position = start
+            yield ReuseTag(
+                kind=tag[0],  # type: ignore[arg-type]
+                value=tag[1],
+                line=line,
+                start=counter.byte_offset(
+                    start + bisect_left(collapsed, start)
+                ),
+                end=counter.byte_offset(end + bisect_left(collapsed, end)),
+                encoding=encoding,
+            )
+        line += text.count("\n", text_position)
+        chunk_offset += len(chunk)
+
+
+def _reuse_info_of_path(
+    path: Path, comments_only: bool = False
+) -> ReuseInfo | Exception:
+    """Open *path* and return its :class:`ReuseInfo`, or the exception that was
+    raised while doing so.
+    """
+    # pylint: disable=broad-except
+    try:
+        with path.open("rb", buffering=CHUNK_SIZE) as fp:
+            if hasattr(os, "posix_fadvise"):
+                with contextlib.suppress(OSError):
+                    os.posix_fadvise(fp.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            return reuse_info_of_file(
+                fp,
+                comment_style=(
+                    get_comment_style(path) if comments_only else None
+                ),
+            )
+    except Exception as exc:
+        return exc
+
+
+def reuse_info_of_files(
+    paths: Iterable[StrPath],
+    workers: int | None = None,
+    window: int | None = None,
+    comments_only: bool = False,
+) -> Generator[tuple[Path, ReuseInfo | Exception], None, None]:
+    """Extract REUSE information from all files in *paths*, like
+    :func:`reuse_info_of_file`. The files are opened and read on a pool of
+    *workers* threads, such that reading one file overlaps with parsing
+    another.
+
+    A tuple of the path and its :class:`ReuseInfo` is yielded as soon as a file
+    is done, which need not be in the order of *paths*. If the file could not be
+    read or parsed, the exception is yielded in place of the
+    :class:`ReuseInfo`.
+
+    Args:
+        paths: The paths of the files.
+        workers: The amount of threads. Defaults to the default of
+            :class:`concurrent.futures.ThreadPoolExecutor` in Python 3.13.
+        window: The maximum amount of files that are being processed or whose
+            results have not yet been yielded. Defaults to four times the amount
+            of threads.
+        comments_only: Whether to only search the comments of files whose
+            comment style is known. See :func:`filter_comment_regions`.
+    """
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    if window is None:
+        window = workers * 4
+    window = max(1, window)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: dict[Future, Path] = {}
+        for path in paths:
+            path = Path(path)
+            pending[
+                executor.submit(_reuse_info_of_path, path, comments_only)
+            ] = path
+            if len(pending) < window:
+                continue
+            done, _not_done = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+        for future in as_completed(pending):
+            yield pending[future], future.result()
+
+
+class _RangeResult(NamedTuple):
+    """Result of scanning a range of a file with :func:`_scan_range`. For both
+    the case that the range starts outside of an ignore block and the case that
+    it starts inside of one, this holds the REUSE information and whether an
+    ignore block is still open at the end of the range.
+    """
+
+    outside: tuple[ReuseInfo, bool]
+    inside: tuple[ReuseInfo, bool]
+
+
+def _scan_range(
+    path: StrPath,
+    start: int,
+    end: int,
+    encoding: str,
+    newline: str,
+) -> _RangeResult:
+    """Extract the REUSE information from the bytes between *start* and *end* of
+    the file at *path*.
+
+    Because it is not known whether the range starts inside of an ignore block,
+    both cases are followed in the same pass. As soon as they are in the same
+    state at the end of a chunk, which is at the latest after the first end
+    marker, the remaining chunks are searched only once.
+    """
+    # pylint: disable=too-many-locals
+    fixed_encoding = _FIXED_BYTE_ORDER_ENCODINGS.get(encoding, encoding)
+    deadline = time.monotonic() + TIME_BUDGET
+    # The information found before both cases are in the same state, and the
+    # information found after.
+    heads: tuple[list[ReuseInfo], list[ReuseInfo]] = ([], [])
+    tail: list[ReuseInfo] = []
+    states = [False, True]
+    converged = False
+    partially_scanned = False
+    with open(path, "rb", buffering=CHUNK_SIZE) as fp:
+        fp.seek(start)
+        position = start
+        for chunk in _read_chunks(fp, newline=newline.encode(fixed_encoding)):
+            chunk = chunk[: end - position]
+            position += len(chunk)
+            text = chunk.decode(encoding, errors="replace")
+            text = _NEWLINE_PATTERN.sub("\n", text)
+            if converged:
+                filtered, states[0] = filter_ignore_block(text, states[0])
+                tail.append(_extract_reuse_info(filtered, deadline))
+            else:
+                for index, infos in enumerate(heads):
+                    filtered, states[index] = filter_ignore_block(
+                        text, states[index]
+                    )
+                    infos.append(_extract_reuse_info(filtered, deadline))
+                converged = states[0] == states[1]
+            if time.monotonic() > deadline:
+                partially_scanned = True
+                _LOGGER.warning(
+                    _(
+                        "'{path}' could not be searched for REUSE information"
+                        " within {seconds} seconds; only part of the file was"
+                        " searched."
+                    ).format(path=path, seconds=TIME_BUDGET)
+                )
+                break
+            if position >= end:
+                break
+    partially_scanned = partially_scanned or any(
+        info.partially_scanned for info in chain(*heads, tail)
+    )
+    partial = ReuseInfo(partially_scanned=partially_scanned)
+    if converged:
+        states[1] = states[0]
+    return _RangeResult(
+        outside=(partial.union(*heads[0], *tail), states[0]),
+        inside=(partial.union(*heads[1], *tail), states[1]),
+    )
+
+
+def _range_boundaries(
+    fp: BinaryIO, size: int, range_size: int, newline: bytes, unit: int
+) -> list[int]:
+    """Return the offsets at which *fp* of *size* bytes is split into ranges of
+    roughly *range_size*. Every offset directly follows a *newline* that is
+    aligned to the code *unit* of the encoding.
+    """
+    boundaries = [0]
+    range_size = max(unit, range_size - range_size % unit)
+    target = range_size
+    while target < size:
+        fp.seek(target)
+        found = -1
+        offset = target
+        while found == -1:
+            buffer = fp.read(CHUNK_SIZE + len(newline))
+            if len(buffer) < len(newline):
+                break
+            index = buffer.find(newline)
+            while index != -1 and index % unit:
+                index = buffer.find(newline, index + 1)
+            if index != -1:
+                found = offset + index + len(newline)
+            else:
+                offset += CHUNK_SIZE
+                fp.seek(offset)
+        if found == -1 or found >= size:
+            break
+        boundaries.append(found)
+        target = found + range_size
+    boundaries.append(size)
+    return boundaries
+
+
+class FileRanges(NamedTuple):
+    """The newline-aligned ranges into which a large file is split, so that
+    they can be scanned separately with :func:`_scan_range`. See
+    :func:`ranges_of_file`.
+    """
+
+    path: Path
+    encoding: str
+    newline: str
+    #: The offsets at which the ranges start, followed by the size of the file.
+    boundaries: list[int]
+
+    def spans(self) -> list[tuple[int, int]]:
+        """Return the start and end offsets of the ranges."""
+        return list(pairwise(self.boundaries))
+
+    def scan(self, start: int, end: int) -> _RangeResult:
+        """Scan the range from *start* to *end*."""
+        return _scan_range(self.path, start, end, self.encoding, self.newline)
+
+
+def ranges_of_file(
+    path: StrPath, range_size: int = RANGE_SIZE
+) -> FileRanges | None:
+    """Split the file at *path* into newline-aligned ranges of roughly
+    *range_size* bytes. If the file is a binary, return :const:`None`.
+    """
+    with open(path, "rb") as fp:
+        detected = _detect_file_encoding(fp)
+        if detected is None:
+            return None
+        encoding, newline = detected
+        fixed_encoding = _FIXED_BYTE_ORDER_ENCODINGS.get(encoding, encoding)
+        boundaries = _range_boundaries(
+            fp,
+            os.fstat(fp.fileno()).st_size,
+            range_size,
+            newline.encode(fixed_encoding),
+            len("\n".encode(fixed_encoding)),
+        )
+    return FileRanges(Path(path), encoding, newline, boundaries)
+
+
+def merge_ranges(results: Iterable[_RangeResult]) -> ReuseInfo:
+    """Combine the results of scanning the ranges of a file, in order.
+
+    Every range was scanned both as though it starts outside of an ignore block
+    and as though it starts inside of one (see :func:`_scan_range`). The ranges
+    are walked in order, picking the result that matches whether an ignore
+    block was open at the end of the previous range.
+    """
+    reuse_infos: list[ReuseInfo] = []
+    in_ignore_block = False
+    for result in results:
+        reuse_info, in_ignore_block = (
+            result.inside if in_ignore_block else result.outside
+        )
+        reuse_infos.append(reuse_info)
+    return ReuseInfo(
+        partially_scanned=any(info.partially_scanned for info in reuse_infos)
+    ).union(*reuse_infos)
+
+
+def reuse_info_of_large_file(
+    path: StrPath, range_size: int = RANGE_SIZE
+) -> ReuseInfo:
+    """Like :func:`reuse_info_of_file`, but scan the file at *path* in
+    newline-aligned ranges of roughly *range_size* bytes, one after the other.
+
+    To scan the ranges in parallel, use :func:`ranges_of_file` and
+    :func:`merge_ranges` instead, and call :meth:`FileRanges.scan` on worker
+    processes.
+    """
+    ranges = ranges_of_file(path, range_size)
+    if ranges is None:
+        return ReuseInfo.EMPTY
+    return merge_ranges(
+        ranges.scan(start, end) for start, end in ranges.spans()
+    )
 
 
 def contains_reuse_info(text: str) -> bool:
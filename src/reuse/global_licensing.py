@@ -2,27 +2,41 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+# pylint: disable=too-many-lines
+
 """Code for parsing and validating REUSE.toml."""
 
 # mypy: disable-error-code=attr-defined
 
 import functools
+import io
 import logging
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Callable, Collection, Generator, Iterable
 from enum import Enum
 from pathlib import Path, PurePath
-from typing import Any, TypeVar, cast
+from typing import Any, Literal, TypeVar, cast
 
 import attrs
 import tomlkit
 from attr.validators import _InstanceOfValidator as _AttrInstanceOfValidator
 from debian.copyright import Copyright
 from debian.copyright import Error as DebianError
-
-from .copyright import CopyrightNotice, ReuseInfo, SourceType, SpdxExpression
+from debian.copyright import globs_to_re
+
+from . import cache
+from .copyright import (
+    CopyrightNotice,
+    CopyrightPrefix,
+    ReuseInfo,
+    SourceType,
+    SpdxExpression,
+    YearRange,
+)
 from .covered_files import is_path_ignored
 from .exceptions import (
     CopyrightNoticeParseError,
@@ -34,6 +48,9 @@ from .i18n import _
 from .types import StrPath
 from .vcs import VCSStrategy
 
+if sys.version_info >= (3, 11):
+    import tomllib
+
 _LOGGER = logging.getLogger(__name__)
 
 _T = TypeVar("_T")
@@ -194,16 +211,16 @@ def _to_set_any(value: Any | None) -> set[Any]:
 
 def _to_set_of_expr(
     value: str | Iterable[str] | None,
-) -> set[SpdxExpression]:
+) -> frozenset[SpdxExpression]:
     value = _to_set(value)
-    return {SpdxExpression(expression) for expression in value}
+    return frozenset(SpdxExpression(expression) for expression in value)
 
 
 def _to_set_of_notice(
     value: str | Iterable[str] | None,
-) -> set[CopyrightNotice]:
+) -> frozenset[CopyrightNotice]:
     value = _to_set(value)
-    result = set()
+    result: set[CopyrightNotice] = set()
     for notice in value:
         try:
             result.add(CopyrightNotice.from_string(notice))
@@ -218,6 +235,69 @@ def _to_set_of_notice(
                 raise GlobalLicensingParseValueError(
                     _("Could not parse '{notice}'").format(notice=notice)
                 ) from error
+    return frozenset(result)
+
+
+def _json_strings(value: dict[str, Any], key: str) -> list[str]:
+    """Return the list of strings under *key* in the JSON object *value*.
+
+    Raises:
+        TypeError: the item is not a list of strings.
+    """
+    items = value[key]
+    if not isinstance(items, list) or not all(
+        isinstance(item, str) for item in items
+    ):
+        raise TypeError(f"'{key}' must be a list of strings")
+    return items
+
+
+def _notice_to_json(notice: CopyrightNotice) -> dict[str, Any]:
+    """Return the parts of a parsed copyright notice as a JSON object."""
+    return {
+        "name": notice.name,
+        "prefix": notice.prefix.name,
+        "years": [
+            [year.start, year.separator, year.end, year.original]
+            for year in notice.years
+        ],
+        "original": notice.original,
+    }
+
+
+def _notice_from_json(value: dict[str, Any]) -> CopyrightNotice:
+    """Return the copyright notice in the JSON object *value*, as created by
+    :func:`_notice_to_json`, without parsing it again.
+
+    Raises:
+        KeyError: *value* lacks a part, or names an unknown prefix.
+        TypeError: *value* is not such an object.
+        ValueError: *value* is not such an object.
+    """
+    if not isinstance(value["name"], str):
+        raise TypeError("'name' must be a string")
+    years = []
+    for start, separator, end, original in value["years"]:
+        year = YearRange(start, separator, end)
+        object.__setattr__(year, "original", original)
+        years.append(year)
+    result = CopyrightNotice(
+        name=value["name"],
+        prefix=CopyrightPrefix[value["prefix"]],
+        years=tuple(years),
+    )
+    object.__setattr__(result, "original", value["original"])
+    return result
+
+
+def _without_validation(cls: type[_T], **values: Any) -> _T:
+    """Create an instance of the frozen attrs class *cls* from attribute
+    values that were converted and validated before. Converters, validators and
+    ``__attrs_post_init__`` are not run.
+    """
+    result = cls.__new__(cls)
+    for name, value in values.items():
+        object.__setattr__(result, name, value)
     return result
 
 
@@ -252,19 +332,101 @@ class GlobalLicensing(ABC):
         The key indicates the precedence type for the subsequent information.
         """
 
+    def reuse_info_of_subtree(
+        self, directory: StrPath
+    ) -> dict[PrecedenceType, list[ReuseInfo]] | None:
+        """If every file in and below *directory* is given the same REUSE
+        information, and that information overrides the contents of the files,
+        return it like :meth:`reuse_info_of`, but without a path. Otherwise, or
+        if that cannot be determined cheaply, return :const:`None`.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+
+class _Dep5Matcher:
+    """An index over the Files paragraphs of a :class:`Copyright` that finds
+    the REUSE information of the last paragraph matching a path.
+
+    The globs are compiled once. Literal paths are looked up in a dictionary,
+    and the remaining globs are combined in a single expression, last paragraph
+    first. Unlike :class:`Copyright`, the matcher can be pickled.
+    """
+
+    def __init__(self, dep5_copyright: Copyright):
+        self._infos: list[ReuseInfo] = []
+        self._exact: dict[str, int] = {}
+        patterns: list[tuple[int, str]] = []
+        for index, paragraph in enumerate(
+            dep5_copyright.all_files_paragraphs()
+        ):
+            self._infos.append(
+                ReuseInfo(
+                    spdx_expressions=_to_set_of_expr(
+                        paragraph.license.synopsis
+                    ),
+                    copyright_notices=_to_set_of_notice(
+                        map(str.strip, paragraph.copyright.splitlines())
+                    ),
+                    source_type=SourceType.DEP5,
+                    # This is hardcoded. It must be a relative path from the
+                    # project root. ReuseDep5.source is not (guaranteed) a
+                    # relative path.
+                    source_path=".reuse/dep5",
+                )
+            )
+            globs = []
+            for glob in paragraph.files:
+                if any(char in glob for char in "*?\\"):
+                    globs.append(glob)
+                else:
+                    self._exact[glob] = index
+            if globs:
+                patterns.append((index, globs_to_re(globs).pattern))
+        patterns.reverse()
+        self._indices = [index for index, _ in patterns]
+        self._pattern = (
+            re.compile(
+                "|".join(f"({pattern})" for _, pattern in patterns),
+                re.MULTILINE | re.DOTALL,
+            )
+            if patterns
+            else None
+        )
+
+    def find(self, path: str) -> ReuseInfo | None:
+        """Return the REUSE information of the last paragraph that matches
+        *path*, or :const:`None`. The result has no path.
+        """
+        result = self._exact.get(path, -1)
+        if self._pattern is not None:
+            if match := self._pattern.fullmatch(path):
+                # Every alternative contains exactly one group.
+                lastindex = cast(int, match.lastindex)
+                result = max(result, self._indices[lastindex - 1])
+        return self._infos[result] if result >= 0 else None
+
 
 @attrs.define(frozen=True)
 class ReuseDep5(GlobalLicensing):
-    """A soft wrapper around :class:`Copyright`."""
+    """A soft wrapper around :class:`Copyright`.
 
-    dep5_copyright: Copyright
+    The Files paragraphs are compiled when the object is created. Only the
+    compiled matcher is pickled; :attr:`dep5_copyright` is parsed again from
+    its text when it is needed after unpickling.
+    """
+
+    text: str = attrs.field(repr=False)
+    _matcher: _Dep5Matcher = attrs.field(repr=False, eq=False)
 
     @classmethod
     def from_file(cls, path: StrPath, **kwargs: Any) -> "ReuseDep5":
         path = Path(path)
         try:
             with path.open(encoding="utf-8") as fp:
-                return cls(str(path), Copyright(fp))
+                text = fp.read()
+            dep5_copyright = Copyright(io.StringIO(text))
+            result = cls(str(path), text, _Dep5Matcher(dep5_copyright))
         except UnicodeDecodeError as error:
             raise GlobalLicensingParseError(
                 str(error), source=str(path)
@@ -276,32 +438,67 @@ class ReuseDep5(GlobalLicensing):
             raise GlobalLicensingParseError(
                 str(error), source=str(path)
             ) from error
+        # Spare the second parse in this process.
+        object.__setattr__(result, "dep5_copyright", dep5_copyright)
+        return result
+
+    @functools.cached_property
+    def dep5_copyright(self) -> Copyright:
+        """The parsed :class:`Copyright` object."""
+        return Copyright(io.StringIO(self.text))
 
     def reuse_info_of(
         self, path: StrPath
     ) -> dict[PrecedenceType, list[ReuseInfo]]:
         path = PurePath(path).as_posix()
-        result = self.dep5_copyright.find_files_paragraph(path)
+        result = self._matcher.find(path)
 
         if result is None:
             return {}
 
-        return {
-            PrecedenceType.AGGREGATE: [
-                ReuseInfo(
-                    spdx_expressions=_to_set_of_expr(result.license.synopsis),
-                    copyright_notices=_to_set_of_notice(
-                        map(str.strip, result.copyright.splitlines())
-                    ),
-                    path=path,
-                    source_type=SourceType.DEP5,
-                    # This is hardcoded. It must be a relative path from the
-                    # project root. self.source is not (guaranteed) a relative
-                    # path.
-                    source_path=".reuse/dep5",
-                )
-            ]
-        }
+        return {PrecedenceType.AGGREGATE: [result.copy(path=path)]}
+
+
+def _translate_glob(path: str) -> str:
+    """Translate a path glob of REUSE.toml into an anchored regular expression.
+    The expression contains exactly one group.
+    """
+    # pylint: disable=too-many-branches
+    blocks = []
+    escaping = False
+    globstar = False
+    prev_char = ""
+    for char in path:
+        if char == "\\":
+            if prev_char == "\\" and escaping:
+                escaping = False
+                blocks.append("\\\\")
+            else:
+                escaping = True
+        elif char == "*":
+            if escaping:
+                blocks.append(re.escape("*"))
+                escaping = False
+            elif prev_char == "*" and not globstar:
+                globstar = True
+                blocks.append(r".*")
+        elif char == "/":
+            if not globstar:
+                if prev_char == "*":
+                    blocks.append("[^/]*")
+                blocks.append("/")
+            escaping = False
+        else:
+            if prev_char == "*" and not globstar:
+                blocks.append(r"[^/]*")
+            blocks.append(re.escape(char))
+            globstar = False
+            escaping = False
+        prev_char = char
+    if prev_char == "*" and not globstar:
+        blocks.append(r"[^/]*")
+    result = "".join(blocks)
+    return f"^({result})$"
 
 
 @attrs.define(frozen=True)
@@ -334,56 +531,33 @@ class AnnotationsItem:
         # Immediately trigger cached properties to get error as needed.
         _ = self.copyright_notices
         _ = self.spdx_expressions
+        _ = self.reuse_info
 
     @functools.cached_property
-    def copyright_notices(self) -> set[CopyrightNotice]:
+    def copyright_notices(self) -> frozenset[CopyrightNotice]:
         return _to_set_of_notice(self._copyright_notices)
 
     @functools.cached_property
-    def spdx_expressions(self) -> set[SpdxExpression]:
+    def spdx_expressions(self) -> frozenset[SpdxExpression]:
         return _to_set_of_expr(self._spdx_expressions)
 
     @functools.cached_property
-    def _paths_regex(self) -> re.Pattern:
-        def translate(path: str) -> str:
-            # pylint: disable=too-many-branches
-            blocks = []
-            escaping = False
-            globstar = False
-            prev_char = ""
-            for char in path:
-                if char == "\\":
-                    if prev_char == "\\" and escaping:
-                        escaping = False
-                        blocks.append("\\\\")
-                    else:
-                        escaping = True
-                elif char == "*":
-                    if escaping:
-                        blocks.append(re.escape("*"))
-                        escaping = False
-                    elif prev_char == "*" and not globstar:
-                        globstar = True
-                        blocks.append(r".*")
-                elif char == "/":
-                    if not globstar:
-                        if prev_char == "*":
-                            blocks.append("[^/]*")
-                        blocks.append("/")
-                    escaping = False
-                else:
-                    if prev_char == "*" and not globstar:
-                        blocks.append(r"[^/]*")
-                    blocks.append(re.escape(char))
-                    globstar = False
-                    escaping = False
-                prev_char = char
-            if prev_char == "*" and not globstar:
-                blocks.append(r"[^/]*")
-            result = "".join(blocks)
-            return f"^({result})$"
+    def reuse_info(self) -> ReuseInfo:
+        """The REUSE information of this item, without a path. Copies of it
+        share its sets.
+        """
+        return ReuseInfo(
+            spdx_expressions=self.spdx_expressions,
+            copyright_notices=self.copyright_notices,
+            source_path="REUSE.toml",
+            source_type=SourceType.REUSE_TOML,
+        )
 
-        return re.compile("|".join(translate(path) for path in self.paths))
+    @functools.cached_property
+    def _paths_regex(self) -> re.Pattern:
+        return re.compile(
+            "|".join(_translate_glob(path) for path in self.paths)
+        )
 
     @classmethod
     def from_dict(cls, values: dict[str, Any]) -> "AnnotationsItem":
@@ -403,6 +577,48 @@ class AnnotationsItem:
         )
         return cls(**new_dict)  # type: ignore
 
+    def _to_json(self) -> dict[str, Any]:
+        """Return the validated and normalised values of this item as a JSON
+        object, from which :meth:`_from_json` creates an equal item.
+        """
+        return {
+            "paths": sorted(self.paths),
+            "precedence": self.precedence.value,
+            "copyright_notices": sorted(self._copyright_notices),
+            "parsed_copyright_notices": [
+                _notice_to_json(notice)
+                for notice in sorted(self.copyright_notices)
+            ],
+            "spdx_expressions": sorted(self._spdx_expressions),
+        }
+
+    @classmethod
+    def _from_json(cls, value: dict[str, Any]) -> "AnnotationsItem":
+        """Create an :class:`AnnotationsItem` from the JSON object *value*, as
+        created by :meth:`_to_json`. The values are not validated or parsed
+        again; only the shape of *value* is checked.
+
+        Raises:
+            KeyError: *value* is not such an object.
+            TypeError: *value* is not such an object.
+            ValueError: *value* is not such an object.
+        """
+        spdx_expressions = set(_json_strings(value, "spdx_expressions"))
+        return _without_validation(
+            cls,
+            paths=set(_json_strings(value, "paths")),
+            precedence=PrecedenceType(value["precedence"]),
+            _copyright_notices=set(_json_strings(value, "copyright_notices")),
+            _spdx_expressions=spdx_expressions,
+            copyright_notices=frozenset(
+                _notice_from_json(notice)
+                for notice in value["parsed_copyright_notices"]
+            ),
+            spdx_expressions=frozenset(
+                SpdxExpression(expression) for expression in spdx_expressions
+            ),
+        )
+
     def matches(self, path: str) -> bool:
         """Determine whether *path* matches any of the paths (or path globs) in
         :class:`AnnotationsItem`.
@@ -410,6 +626,200 @@ class AnnotationsItem:
         return bool(self._paths_regex.match(path))
 
 
+def _glob_literal_prefix(path: str) -> str:
+    """Return the part of a path glob before its first wildcard or escape
+    character. If *path* contains neither, it is returned in full.
+    """
+    for index, char in enumerate(path):
+        if char in "*\\":
+            return path[:index]
+    return path
+
+
+def _is_directory_glob(path: str) -> bool:
+    """Whether the path glob matches everything in and below a literal
+    directory, like ``src/**``. Such globs cannot tell files in the same
+    directory apart.
+    """
+    prefix = _glob_literal_prefix(path)
+    return path == f"{prefix}**" and (not prefix or prefix.endswith("/"))
+
+
+def _glob_reaches_subdirectories(path: str) -> bool:
+    """Whether the path glob can match files in subdirectories of the
+    directories that precede its first wildcard, like ``src/**/*.py`` or
+    ``src/*/foo.py``, as opposed to ``src/*.py``.
+    """
+    prefix = _glob_literal_prefix(path)
+    remainder = path[prefix.rfind("/") + 1 :]
+    return "/" in remainder or "**" in remainder
+
+
+@attrs.define
+class _GlobNode:
+    """A directory in the index of :class:`_AnnotationsMatcher`."""
+
+    children: dict[str, "_GlobNode"] = attrs.field(factory=dict)
+    #: The globs whose literal prefix ends in this directory, with the indices
+    #: of their items.
+    globs: list[tuple[int, str]] = attrs.field(factory=list)
+    #: The item indices of the alternatives in *pattern*.
+    indices: list[int] = attrs.field(factory=list)
+    pattern: re.Pattern | None = None
+    #: Whether any of the globs can match some files in this directory, but
+    #: not others.
+    distinguishes_siblings: bool = False
+    #: Whether any of the globs can match some files in a subdirectory, but not
+    #: others.
+    distinguishes_descendants: bool = False
+    #: The latest item index of the globs in the descendants of this node.
+    latest_below: int = -1
+
+
+class _AnnotationsMatcher:
+    """An index over the paths of a list of :class:`AnnotationsItem` that finds
+    the latest item matching a path.
+
+    Literal paths are looked up in a dictionary. Globs are stored in a trie
+    under the directories that precede their first wildcard, so that only the
+    globs along the directories of a path are tried. The globs in each
+    directory are combined in a single expression, latest item first.
+    """
+
+    def __init__(self, annotations: Iterable[AnnotationsItem]):
+        self._exact: dict[str, int] = {}
+        self._exact_directories: set[str] = set()
+        # Directory -> the latest item index of the literal paths in and below
+        # it.
+        self._exact_below: dict[str, int] = {}
+        self._root = _GlobNode()
+        nodes: dict[int, _GlobNode] = {}
+        for index, item in enumerate(annotations):
+            for path in item.paths:
+                prefix = _glob_literal_prefix(path)
+                if prefix == path:
+                    self._exact[path] = index
+                    self._exact_directories.add(path.rpartition("/")[0])
+                    directory = path
+                    while directory:
+                        directory = directory.rpartition("/")[0]
+                        self._exact_below[directory] = index
+                    continue
+                node = self._root
+                ancestors = []
+                for part in prefix.split("/")[:-1]:
+                    ancestors.append(node)
+                    node = node.children.setdefault(part, _GlobNode())
+                node.globs.append((index, path))
+                nodes[id(node)] = node
+                for ancestor in ancestors:
+                    ancestor.latest_below = index
+        for node in nodes.values():
+            node.globs.sort(key=lambda glob: glob[0], reverse=True)
+            node.indices = [index for index, _ in node.globs]
+            node.pattern = re.compile(
+                "|".join(_translate_glob(glob) for _, glob in node.globs)
+            )
+            node.distinguishes_siblings = not all(
+                _is_directory_glob(glob) for _, glob in node.globs
+            )
+            node.distinguishes_descendants = any(
+                _glob_reaches_subdirectories(glob)
+                and not _is_directory_glob(glob)
+                for _, glob in node.globs
+            )
+
+    def find(self, path: str) -> int | None:
+        """Return the index of the latest item that matches *path*, or
+        :const:`None`.
+        """
+        result = self._exact.get(path, -1)
+        node: _GlobNode | None = self._root
+        # Visit the root, and then every directory of *path*.
+        for part in path.split("/"):
+            if node is None:
+                break
+            if node.pattern is not None:
+                if match := node.pattern.match(path):
+                    # Every alternative contains exactly one group.
+                    lastindex = cast(int, match.lastindex)
+                    result = max(result, node.indices[lastindex - 1])
+            node = node.children.get(part)
+        return result if result >= 0 else None
+
+    def distinguishes_siblings(self, directory: str) -> bool:
+        """Whether the files directly in *directory* may match different items.
+        If not, :meth:`find` returns the same result for all of them. The root
+        directory is the empty string.
+        """
+        if directory in self._exact_directories:
+            return True
+        node = self._root
+        for part in directory.split("/") if directory else []:
+            if node.distinguishes_descendants:
+                return True
+            child = node.children.get(part)
+            if child is None:
+                return False
+            node = child
+        return node.distinguishes_siblings
+
+    def find_in_subtree(self, directory: str) -> int | None:
+        """Return the index of the item that is the latest match of every file
+        in and below *directory*, or -1 if no item matches any of them. Return
+        :const:`None` if different files may match different items. The root
+        directory is the empty string.
+        """
+        parts = directory.split("/") if directory else []
+        # The latest item that matches every file, and the latest item that
+        # may match only some of them.
+        covering = -1
+        partial = self._exact_below.get(directory, -1)
+        node = self._root
+        for depth in range(len(parts) + 1):
+            own = depth == len(parts)
+            for index, glob in node.globs:
+                if _is_directory_glob(glob):
+                    covering = max(covering, index)
+                # Globs in the directories above only reach into this one if
+                # they reach into subdirectories.
+                elif own or _glob_reaches_subdirectories(glob):
+                    partial = max(partial, index)
+            if own:
+                partial = max(partial, node.latest_below)
+                break
+            child = node.children.get(parts[depth])
+            if child is None:
+                break
+            node = child
+        if partial > covering:
+            return None
+        return covering
+
+
+def _parse_toml(toml: str, source: str) -> dict[str, Any]:
+    """Parse the TOML text of a REUSE.toml file.
+
+    The text is only read, so the standard library's :mod:`tomllib` is used
+    where it is available. It is much faster than :mod:`tomlkit`, which
+    preserves the style of a document for writing it back.
+
+    Raises:
+        GlobalLicensingParseError: if the text is not valid TOML.
+    """
+    if sys.version_info >= (3, 11):
+        try:
+            return tomllib.loads(toml)
+        except tomllib.TOMLDecodeError as error:
+            raise GlobalLicensingParseError(
+                str(error), source=source
+            ) from error
+    try:
+        return tomlkit.loads(toml)
+    except tomlkit.exceptions.TOMLKitError as error:
+        raise GlobalLicensingParseError(str(error), source=source) from error
+
+
 @attrs.define(frozen=True)
 class ReuseTOML(GlobalLicensing):
     """A class that contains the data parsed from a REUSE.toml file."""
@@ -443,32 +853,122 @@ class ReuseTOML(GlobalLicensing):
     @classmethod
     def from_toml(cls, toml: str, source: str) -> "ReuseTOML":
         """Create a :class:`ReuseTOML` from TOML text."""
-        try:
-            tomldict = tomlkit.loads(toml)
-        except tomlkit.exceptions.TOMLKitError as error:
-            raise GlobalLicensingParseError(
-                str(error), source=source
-            ) from error
-        return cls.from_dict(tomldict, source)
+        return cls.from_dict(_parse_toml(toml, source), source)
+
+    def _to_json(self) -> dict[str, Any]:
+        """Return the validated and normalised values of this object as a JSON
+        object, from which :meth:`_from_json` creates an equal object.
+        """
+        # pylint: disable=protected-access
+        return {
+            "version": self.version,
+            "annotations": [item._to_json() for item in self.annotations],
+        }
+
+    @classmethod
+    def _from_json(cls, value: Any, source: str) -> "ReuseTOML":
+        """Create a :class:`ReuseTOML` from the JSON object *value*, as created
+        by :meth:`_to_json`, without validating it again.
+
+        Raises:
+            KeyError: *value* is not such an object.
+            TypeError: *value* is not such an object.
+            ValueError: *value* is not such an object.
+        """
+        if not isinstance(value, dict) or not isinstance(value["version"], int):
+            raise TypeError("not a cached REUSE.toml")
+        # pylint: disable=protected-access
+        return _without_validation(
+            cls,
+            source=source,
+            version=value["version"],
+            annotations=[
+                AnnotationsItem._from_json(item)
+                for item in value["annotations"]
+            ],
+        )
 
     @classmethod
-    def from_file(cls, path: StrPath, **kwargs: Any) -> "ReuseTOML":
+    def from_file(
+        cls,
+        path: StrPath,
+        cache_directory: StrPath | None = None,
+        **kwargs: Any,
+    ) -> "ReuseTOML":
+        """If *cache_directory* is given, the validated and normalised contents
+        of the file are cached in it as JSON. For as long as the contents of the
+        file do not change, they are neither parsed nor validated again.
+        """
         try:
             with Path(path).open(encoding="utf-8") as fp:
-                return cls.from_toml(fp.read(), str(path))
+                toml = fp.read()
         except UnicodeDecodeError as error:
             raise GlobalLicensingParseError(
                 str(error), source=str(path)
             ) from error
+        if cache_directory is None:
+            return cls.from_toml(toml, str(path))
+
+        cache_path = (
+            Path(cache_directory)
+            / "reuse-toml"
+            / f"{cache.digest(str(path).encode('utf-8'))}.json"
+        )
+        key = cache.digest(toml.encode("utf-8"))
+        cached = cache.load(cache_path)
+        if isinstance(cached, dict) and cached.get("key") == key:
+            try:
+                return cls._from_json(cached.get("reuse_toml"), str(path))
+            except (KeyError, TypeError, ValueError) as error:
+                _LOGGER.debug("could not use cached '%s': %s", path, error)
+
+        result = cls.from_toml(toml, str(path))
+        cache.dump(cache_path, {"key": key, "reuse_toml": result._to_json()})
+        return result
 
     def find_annotations_item(self, path: StrPath) -> AnnotationsItem | None:
         """Find a :class:`AnnotationsItem` that matches *path*. The latest match
         in :attr:`annotations` is returned.
         """
-        path = PurePath(path).as_posix()
-        for item in reversed(self.annotations):
-            if item.matches(path):
-                return item
+        index = self._matcher.find(PurePath(path).as_posix())
+        if index is None:
+            return None
+        return self.annotations[index]
+
+    def _distinguishes_siblings(self, directory: StrPath) -> bool:
+        """Whether the files directly in *directory* may match different
+        :class:`AnnotationsItem`s.
+        """
+        posix = PurePath(directory).as_posix()
+        return self._matcher.distinguishes_siblings(
+            "" if posix == "." else posix
+        )
+
+    @functools.cached_property
+    def _matcher(self) -> _AnnotationsMatcher:
+        return _AnnotationsMatcher(self.annotations)
+
+    def _find_in_subtree(
+        self, directory: StrPath
+    ) -> AnnotationsItem | Literal[False] | None:
+        """Return the :class:`AnnotationsItem` that matches every file in and
+        below *directory*, :const:`None` if none of them are matched, or
+        :const:`False` if different files may match different items.
+        """
+        posix = PurePath(directory).as_posix()
+        index = self._matcher.find_in_subtree("" if posix == "." else posix)
+        if index is None:
+            return False
+        if index < 0:
+            return None
+        return self.annotations[index]
+
+    def reuse_info_of_subtree(
+        self, directory: StrPath
+    ) -> dict[PrecedenceType, list[ReuseInfo]] | None:
+        item = self._find_in_subtree(directory)
+        if item and item.precedence == PrecedenceType.OVERRIDE:
+            return {item.precedence: [item.reuse_info]}
         return None
 
     def reuse_info_of(
@@ -477,17 +977,7 @@ class ReuseTOML(GlobalLicensing):
         path = PurePath(path).as_posix()
         item = self.find_annotations_item(path)
         if item:
-            return {
-                item.precedence: [
-                    ReuseInfo(
-                        spdx_expressions=item.spdx_expressions,
-                        copyright_notices=item.copyright_notices,
-                        path=path,
-                        source_path="REUSE.toml",
-                        source_type=SourceType.REUSE_TOML,
-                    )
-                ]
-            }
+            return {item.precedence: [item.reuse_info.copy(path=path)]}
         return {}
 
     @property
@@ -496,6 +986,16 @@ class ReuseTOML(GlobalLicensing):
         return PurePath(self.source).parent
 
 
+@attrs.define
+class _DirectoryNode:
+    """A directory in the tree of :class:`ReuseTOML` objects of a
+    :class:`NestedReuseTOML`.
+    """
+
+    children: dict[str, "_DirectoryNode"] = attrs.field(factory=dict)
+    tomls: list[ReuseTOML] = attrs.field(factory=list)
+
+
 @attrs.define(frozen=True)
 class NestedReuseTOML(GlobalLicensing):
     """A class that represents a hierarchy of :class:`ReuseTOML` objects."""
@@ -510,8 +1010,9 @@ class NestedReuseTOML(GlobalLicensing):
             "include_meson_subprojects", False
         )
         vcs_strategy: VCSStrategy | None = kwargs.get("vcs_strategy")
+        cache_directory: StrPath | None = kwargs.get("cache_directory")
         tomls = [
-            ReuseTOML.from_file(toml_path)
+            ReuseTOML.from_file(toml_path, cache_directory=cache_directory)
             for toml_path in cls.find_reuse_tomls(
                 path,
                 include_submodules=include_submodules,
@@ -529,24 +1030,69 @@ class NestedReuseTOML(GlobalLicensing):
         toml_items: list[tuple[ReuseTOML, AnnotationsItem]] = (
             self._find_relevant_tomls_and_items(path)
         )
+        key = tuple((id(toml), id(item)) for toml, item in toml_items)
+        resolved = self._resolutions.get(key)
+        if resolved is None:
+            resolved = self._resolutions[key] = self._resolve(toml_items)
+
+        posix = path.as_posix()
+        return {
+            precedence: [info.copy(path=posix) for info in infos]
+            for precedence, infos in resolved.items()
+        }
+
+    def reuse_info_of_subtree(
+        self, directory: StrPath
+    ) -> dict[PrecedenceType, list[ReuseInfo]] | None:
+        adjusted_directory = PurePath(self.source) / directory
+        tomls, _ = self._directory_tomls(adjusted_directory)
+
+        # The REUSE.toml files below *directory* don't matter, because the
+        # information of the topmost overriding item is final.
+        toml_items: list[tuple[ReuseTOML, AnnotationsItem]] = []
+        for toml in tomls:
+            # pylint: disable=protected-access
+            item = toml._find_in_subtree(
+                adjusted_directory.relative_to(toml.directory)
+            )
+            if item is False:
+                return None
+            if item:
+                toml_items.append((toml, item))
+                if item.precedence == PrecedenceType.OVERRIDE:
+                    return self._resolve(toml_items)
+        return None
+
+    @functools.cached_property
+    def _source_paths(self) -> dict[int, str]:
+        # The paths of the REUSE.toml files relative to self.source instead of
+        # their own directories, by identity.
+        return {
+            id(toml): PurePath(toml.source).relative_to(self.source).as_posix()
+            for toml in self.reuse_tomls
+        }
+
+    @functools.cached_property
+    def _resolutions(
+        self,
+    ) -> dict[
+        tuple[tuple[int, int], ...], dict[PrecedenceType, list[ReuseInfo]]
+    ]:
+        # Cache of the identities of matching (ReuseTOML, AnnotationsItem)
+        # pairs -> resolved REUSE information without a path.
+        return {}
 
+    def _resolve(
+        self, toml_items: list[tuple[ReuseTOML, AnnotationsItem]]
+    ) -> dict[PrecedenceType, list[ReuseInfo]]:
+        """Combine the matching items of the relevant REUSE.toml files, from
+        topmost to deepest, into REUSE information. The information does not
+        have a path.
+        """
         result = defaultdict(list)
-        for keyval in toml_items:
-            toml = keyval[0]
-            item = keyval[1]
-            relpath = (PurePath(self.source) / path).relative_to(toml.directory)
-            # I'm pretty sure there should be no KeyError here.
-            info = toml.reuse_info_of(relpath)[item.precedence][0]
+        for toml, item in toml_items:
             result[item.precedence].append(
-                # Fix the paths to be relative to self.source. As-is, they
-                # were relative to the directory of the respective
-                # REUSE.toml.
-                info.copy(
-                    path=path.as_posix(),
-                    source_path=PurePath(toml.source)
-                    .relative_to(self.source)
-                    .as_posix(),
-                )
+                item.reuse_info.copy(source_path=self._source_paths[id(toml)])
             )
             if item.precedence == PrecedenceType.OVERRIDE:
                 # No more!
@@ -559,7 +1105,7 @@ class NestedReuseTOML(GlobalLicensing):
         to_keep: list[ReuseInfo] = []
         for info in reversed(result[PrecedenceType.CLOSEST]):
             new_info = info.copy(
-                copyright_notices=set(), spdx_expressions=set()
+                copyright_notices=frozenset(), spdx_expressions=frozenset()
             )
             if not copyright_found and info.copyright_notices:
                 new_info = new_info.copy(
@@ -617,14 +1163,76 @@ class NestedReuseTOML(GlobalLicensing):
             else:
                 yield item
 
-    def _find_relevant_tomls(self, path: StrPath) -> list[ReuseTOML]:
-        found = []
+    @functools.cached_property
+    def _toml_tree(self) -> _DirectoryNode:
+        root = _DirectoryNode()
         for toml in self.reuse_tomls:
-            if PurePath(path).is_relative_to(toml.directory):
-                found.append(toml)
-        # Sort from topmost to deepest directory.
-        found.sort(key=lambda toml: toml.directory.parts)
-        return found
+            node = root
+            for part in toml.directory.parts:
+                node = node.children.setdefault(
+                    os.path.normcase(part), _DirectoryNode()
+                )
+            node.tomls.append(toml)
+        return root
+
+    @functools.cached_property
+    def _toml_chains(
+        self,
+    ) -> dict[PurePath, tuple[list[ReuseTOML], _DirectoryNode | None]]:
+        # Cache of directory -> (REUSE.toml files that cover the directory,
+        # the node of the directory in _toml_tree).
+        return {}
+
+    def _directory_tomls(
+        self, directory: PurePath
+    ) -> tuple[list[ReuseTOML], _DirectoryNode | None]:
+        """Return the :class:`ReuseTOML` objects whose directories contain
+        *directory*, from topmost to deepest, and the node of *directory* in
+        the tree, if any.
+        """
+        cached = self._toml_chains.get(directory)
+        if cached is None:
+            node: _DirectoryNode | None = self._toml_tree
+            chain = list(self._toml_tree.tomls)
+            for part in directory.parts:
+                node = cast(_DirectoryNode, node).children.get(
+                    os.path.normcase(part)
+                )
+                if node is None:
+                    break
+                chain.extend(node.tomls)
+            cached = self._toml_chains[directory] = (chain, node)
+        return cached
+
+    @staticmethod
+    def _own_tomls(node: _DirectoryNode | None, name: str) -> list[ReuseTOML]:
+        """Return the :class:`ReuseTOML` objects in the child *name* of
+        *node*.
+        """
+        if node is not None and (
+            child := node.children.get(os.path.normcase(name))
+        ):
+            return child.tomls
+        return []
+
+    def _find_relevant_tomls(self, path: StrPath) -> list[ReuseTOML]:
+        """Return the :class:`ReuseTOML` objects whose directories contain
+        *path*, from topmost to deepest directory.
+        """
+        path = PurePath(path)
+        chain, node = self._directory_tomls(path.parent)
+        # A REUSE.toml is relevant to its own directory, too.
+        if own := self._own_tomls(node, path.name):
+            return chain + own
+        return chain
+
+    @functools.cached_property
+    def _directory_items(
+        self,
+    ) -> dict[PurePath, list[tuple[ReuseTOML, AnnotationsItem]]]:
+        # Cache of directory -> matching items, for directories in which all
+        # files match the same items.
+        return {}
 
     def _find_relevant_tomls_and_items(
         self, path: StrPath
@@ -634,12 +1242,23 @@ class NestedReuseTOML(GlobalLicensing):
         # path.
         path = PurePath(path)
         adjusted_path = PurePath(self.source) / path
+        directory = adjusted_path.parent
+
+        tomls, node = self._directory_tomls(directory)
+        if own := self._own_tomls(node, adjusted_path.name):
+            tomls = tomls + own
+        elif (cached := self._directory_items.get(directory)) is not None:
+            return cached
 
-        tomls = self._find_relevant_tomls(adjusted_path)
         toml_items: list[tuple[ReuseTOML, AnnotationsItem]] = []
+        shared = not own
         for toml in tomls:
             relpath = adjusted_path.relative_to(toml.directory)
             item = toml.find_annotations_item(relpath)
             if item is not None:
                 toml_items.append((toml, item))
+            # pylint: disable=protected-access
+            shared = shared and not toml._distinguishes_siblings(relpath.parent)
+        if shared:
+            self._directory_items[directory] = toml_items
         return toml_items
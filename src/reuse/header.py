@@ -19,6 +19,7 @@
 import logging
 import re
 from collections.abc import Sequence
+from collections.abc import Set as AbstractSet
 from typing import NamedTuple, cast
 
 from jinja2 import Environment, PackageLoader, Template
@@ -142,17 +143,18 @@ def create_header(
     if header:
         existing_spdx = extract_reuse_info(header)
         if merge_copyrights:
-            spdx_copyrights = CopyrightNotice.merge(
-                reuse_info.copyright_notices.union(
-                    existing_spdx.copyright_notices
+            spdx_copyrights: AbstractSet[CopyrightNotice] = (
+                CopyrightNotice.merge(
+                    reuse_info.copyright_notices
+                    | existing_spdx.copyright_notices
                 )
             )
         else:
-            spdx_copyrights = reuse_info.copyright_notices.union(
-                existing_spdx.copyright_notices
+            spdx_copyrights = (
+                reuse_info.copyright_notices | existing_spdx.copyright_notices
             )
         if replace_license and reuse_info.spdx_expressions:
-            existing_spdx.spdx_expressions.clear()
+            existing_spdx = existing_spdx.copy(spdx_expressions=frozenset())
 
         # TODO: This behaviour does not match the docstring.
         reuse_info = existing_spdx | reuse_info
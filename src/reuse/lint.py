@@ -154,6 +154,21 @@ def format_plain(report: ProjectReport) -> str:
                 output.write(f"* {file}\n")
             output.write("\n")
 
+    # Partially scanned files are not necessarily non-compliant, but the user
+    # ought to know that the result for these files may be incomplete.
+    if report.partially_scanned_files:
+        output.write("# " + _("PARTIALLY SCANNED FILES") + "\n\n")
+        output.write(
+            _(
+                "The following files could only be partially searched for"
+                " REUSE information:"
+            )
+            + "\n"
+        )
+        for path in sorted(report.partially_scanned_files):
+            output.write(f"* {path}\n")
+        output.write("\n")
+
     output.write("# " + _("SUMMARY"))
     output.write("\n\n")
 
@@ -306,6 +321,10 @@ def _format_lines_subset_dict(
     for path in report.files_without_copyright:
         result_dict[str(path)].append(_("no copyright notice"))
 
+    # Partially scanned
+    for path in report.partially_scanned_files:
+        result_dict[str(path)].append(_("partially scanned"))
+
     return result_dict
 
 
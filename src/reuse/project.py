@@ -11,6 +11,7 @@
 """Module that contains the central Project class."""
 
 import errno
+import functools
 import glob
 import logging
 import os
@@ -18,10 +19,11 @@ import warnings
 from collections import defaultdict
 from collections.abc import Collection, Iterator
 from pathlib import Path
-from typing import NamedTuple, cast
+from typing import BinaryIO, NamedTuple, cast
 
 import attrs
 
+from . import cache
 from ._licenses import EXCEPTION_MAP, LICENSE_MAP
 from ._util import _determine_license_path, relative_from_root
 from .copyright import ReuseInfo, SourceType
@@ -30,7 +32,15 @@ from .exceptions import (
     GlobalLicensingConflictError,
     SpdxIdentifierNotFoundError,
 )
-from .extract import _LICENSEREF_PATTERN, CHUNK_SIZE, reuse_info_of_file
+from .extract import (
+    _LICENSEREF_PATTERN,
+    CHUNK_SIZE,
+    LARGE_FILE_SIZE,
+    FileRanges,
+    ranges_of_file,
+    reuse_info_of_file,
+    reuse_info_of_large_file,
+)
 from .global_licensing import (
     GlobalLicensing,
     NestedReuseTOML,
@@ -55,7 +65,7 @@ class GlobalLicensingFound(NamedTuple):
 # to contain exclusively those values, or maybe these values should be extracted
 # out of Project to simplify passing this information around.
 @attrs.define
-class Project:
+class Project:  # pylint: disable=too-many-instance-attributes
     """Simple object that holds the project's root, which is necessary for many
     interactions.
     """
@@ -65,6 +75,14 @@ class Project:
     include_meson_subprojects: bool = False
     vcs_strategy: VCSStrategy = attrs.field()
     global_licensing: GlobalLicensing | None = None
+    #: The directory in which results are cached between runs, or
+    #: :const:`None` to not use a cache.
+    cache_directory: Path | None = None
+    #: How :attr:`file_cache` identifies the contents of files.
+    cache_mode: cache.CacheMode = cache.CacheMode.METADATA
+    #: The URL of an HTTP server with which :attr:`file_cache` is shared, if
+    #: :attr:`cache_mode` is :attr:`~reuse.cache.CacheMode.CONTENT`.
+    cache_url: str | None = None
 
     # TODO: I want to get rid of these, or somehow refactor this mess.
     license_map: dict[str, dict] = attrs.field()
@@ -90,6 +108,9 @@ class Project:
         root: StrPath,
         include_submodules: bool = False,
         include_meson_subprojects: bool = False,
+        use_cache: bool = False,
+        cache_mode: cache.CacheMode = cache.CacheMode.METADATA,
+        cache_url: str | None = None,
     ) -> "Project":
         """A factory method that reads various files in the *root* directory to
         correctly build the :class:`Project` object.
@@ -98,6 +119,10 @@ class Project:
             root: The root of the project.
             include_submodules: Whether to also lint VCS submodules.
             include_meson_subprojects: Whether to also lint Meson subprojects.
+            use_cache: Whether to cache results in the cache directory of the
+                project between runs.
+            cache_mode: How the cache identifies the contents of files.
+            cache_url: The URL of an HTTP server with which to share the cache.
 
         Raises:
             FileNotFoundError: if root does not exist.
@@ -124,6 +149,7 @@ class Project:
             )
 
         vcs_strategy = cls._detect_vcs_strategy(root)
+        cache_directory = cache.cache_directory(root) if use_cache else None
 
         global_licensing: GlobalLicensing | None = None
         found = cls.find_global_licensing(
@@ -134,13 +160,16 @@ class Project:
         )
         if found:
             global_licensing = cls._global_licensing_from_found(
-                found, str(root)
+                found, str(root), cache_directory=cache_directory
             )
 
         project = cls(
             root,
             vcs_strategy=vcs_strategy,
             global_licensing=global_licensing,
+            cache_directory=cache_directory,
+            cache_mode=cache_mode,
+            cache_url=cache_url,
             include_submodules=include_submodules,
             include_meson_subprojects=include_meson_subprojects,
         )
@@ -204,7 +233,9 @@ class Project:
             vcs_strategy=self.vcs_strategy,
         )
 
-    def reuse_info_of(self, path: StrPath) -> list[ReuseInfo]:
+    def reuse_info_of(
+        self, path: StrPath, contents: ReuseInfo | None = None
+    ) -> list[ReuseInfo]:
         """Return REUSE info of *path*.
 
         This function will return any REUSE information that it can find: from
@@ -226,7 +257,13 @@ class Project:
 
         The exact precedence handling is detailed in the specification.
 
-        An empty list is returned if no information was found whatsoever.
+        An empty list is returned if no information was found whatsoever. The
+        exception is a file that could only be partially scanned, in which case
+        its (possibly empty) :class:`ReuseInfo` is always included.
+
+        If *contents* is given, it is used as the REUSE information in the
+        contents of the file instead of searching them, for instance because
+        they were searched in ranges with :meth:`large_file_ranges`.
         """
         # pylint: disable=too-many-branches
         original_path = Path(path)
@@ -237,7 +274,7 @@ class Project:
         global_results: defaultdict[PrecedenceType, list[ReuseInfo]] = (
             defaultdict(list)
         )
-        file_result = ReuseInfo()
+        file_result = ReuseInfo.EMPTY
         result: list[ReuseInfo] = []
 
         # Search the global licensing file for REUSE information.
@@ -263,9 +300,8 @@ class Project:
                 ).format(path=path)
             )
         else:
-            with path.open("rb", buffering=CHUNK_SIZE) as fp:
-                file_result = reuse_info_of_file(fp)
-            if file_result.contains_info():
+            file_result = self._reuse_info_of_contents(path, contents)
+            if file_result.contains_info() or file_result.partially_scanned:
                 source_type = SourceType.FILE_HEADER
                 if path.suffix == ".license":
                     source_type = SourceType.DOT_LICENSE
@@ -279,7 +315,9 @@ class Project:
 
         result.extend(global_results[PrecedenceType.OVERRIDE])
         result.extend(global_results[PrecedenceType.AGGREGATE])
-        if file_result.contains_info():
+        # A partially scanned file is included even without information, so
+        # that the diagnostic is not lost.
+        if file_result.contains_info() or file_result.partially_scanned:
             result.append(file_result)
         if not file_result.contains_copyright_or_licensing():
             result.extend(global_results[PrecedenceType.CLOSEST])
@@ -303,6 +341,151 @@ class Project:
                     )
         return result
 
+    def large_file_ranges(self, path: StrPath) -> FileRanges | None:
+        """If :meth:`reuse_info_of` would search the contents of *path*, and
+        they are at least :const:`~reuse.extract.LARGE_FILE_SIZE` bytes large
+        and not in :attr:`file_cache`, return the ranges in which they can be
+        searched in parallel. Otherwise, return :const:`None`.
+        """
+        original_path = Path(path)
+        path = _determine_license_path(path)
+        try:
+            if path.stat().st_size < LARGE_FILE_SIZE:
+                return None
+            if self.global_licensing and (
+                PrecedenceType.OVERRIDE
+                in self.global_licensing.reuse_info_of(
+                    self.relative_from_root(original_path)
+                )
+            ):
+                return None
+            with path.open("rb") as fp:
+                _key, cached = self._cached_reuse_info_of_contents(
+                    path, fp, os.fstat(fp.fileno())
+                )
+            if cached is not None:
+                return None
+            return ranges_of_file(path)
+        # Leave it to reuse_info_of to surface the error.
+        except OSError:
+            return None
+
+    def _cached_reuse_info_of_contents(
+        self, path: Path, fp: BinaryIO, stat: os.stat_result
+    ) -> tuple[cache.CacheKey | None, ReuseInfo | None]:
+        """Return the key of the contents of *path* in :attr:`file_cache`, and
+        their cached REUSE information if there is any.
+        """
+        file_cache = self.file_cache
+        if file_cache is None:
+            return None, None
+        key = file_cache.key(
+            relative_from_root(path, self.root).as_posix(), fp, stat
+        )
+        return key, None if key is None else file_cache.get(key)
+
+    def _reuse_info_of_contents(
+        self, path: Path, contents: ReuseInfo | None = None
+    ) -> ReuseInfo:
+        """Extract the REUSE information from the contents of *path*, or get it
+        from :attr:`file_cache`, or use *contents*. The result has no path or
+        source.
+        """
+        with path.open("rb", buffering=CHUNK_SIZE) as fp:
+            stat = os.fstat(fp.fileno())
+            key, cached = self._cached_reuse_info_of_contents(path, fp, stat)
+            if cached is not None:
+                return cached
+            result: ReuseInfo | None = contents
+            if result is None and stat.st_size < LARGE_FILE_SIZE:
+                result = reuse_info_of_file(fp)
+        if result is None:
+            result = reuse_info_of_large_file(path)
+        # A partial scan may be complete the next time.
+        if (
+            self.file_cache is not None
+            and key is not None
+            and not result.partially_scanned
+        ):
+            self.file_cache.put(key, result)
+        return result
+
+    @functools.cached_property
+    def file_cache(self) -> cache.ReuseInfoCache | None:
+        """The cache of the REUSE information in the contents of files, if
+        :attr:`cache_directory` is set. Its kind depends on :attr:`cache_mode`.
+
+        The content cache is not in :attr:`cache_directory`, but shared by all
+        projects. See :func:`reuse.cache.content_cache_path`.
+        """
+        if self.cache_directory is None:
+            return None
+        if self.cache_mode == cache.CacheMode.CONTENT:
+            path = cache.content_cache_path()
+            if path is None:
+                return None
+            return cache.ContentCache(
+                path,
+                self.vcs_strategy,
+                backend=(
+                    cache.HTTPCacheBackend(self.cache_url)
+                    if self.cache_url
+                    else None
+                ),
+            )
+        return cache.FileCache(self.cache_directory / "files.sqlite")
+
+    def fingerprint(self) -> str | None:
+        """Return a fingerprint of the files in the project that changes when
+        they change, or :const:`None` if it cannot be determined reliably.
+
+        If the VCS reports that no file differs from the last commit, this is
+        the ID of the committed tree, for which no files need to be read.
+        Otherwise, it is a hash of the metadata of the files that the VCS does
+        not ignore. See :func:`reuse.cache.tree_fingerprint`.
+        """
+        tree_id = self.vcs_strategy.clean_tree_id()
+        if tree_id is not None:
+            return f"tree:{tree_id}"
+        result = cache.tree_fingerprint(
+            self.root,
+            vcs_strategy=self.vcs_strategy,
+            include_submodules=self.include_submodules,
+        )
+        return None if result is None else f"metadata:{result}"
+
+    def reuse_info_of_subtree(
+        self, directory: StrPath
+    ) -> list[ReuseInfo] | None:
+        """If the global licensing file overrides the REUSE information of
+        every file in and below *directory* with the same information, return
+        what :meth:`reuse_info_of` would return for each of these files, but
+        without a path. Otherwise, return :const:`None`.
+
+        The files need not be read to determine this.
+        """
+        if not self.global_licensing:
+            return None
+        global_results = self.global_licensing.reuse_info_of_subtree(
+            self.relative_from_root(Path(directory))
+        )
+        if global_results is None or (
+            PrecedenceType.OVERRIDE not in global_results
+        ):
+            return None
+        _LOGGER.info(
+            _(
+                "'{path}' is covered exclusively by REUSE.toml. Not reading"
+                " the contents of its files."
+            ).format(path=directory)
+        )
+        # Equivalent to reuse_info_of() for a file without information.
+        return [
+            *global_results[PrecedenceType.OVERRIDE],
+            *global_results.get(PrecedenceType.AGGREGATE, []),
+            *global_results.get(PrecedenceType.CLOSEST, []),
+        ]
+
     def relative_from_root(self, path: Path) -> Path:
         """If the project root is /tmp/project, and *path* is
         /tmp/project/src/file, then return src/file.
@@ -366,14 +549,20 @@ class Project:
 
     @classmethod
     def _global_licensing_from_found(
-        cls, found: list[GlobalLicensingFound], root: StrPath
+        cls,
+        found: list[GlobalLicensingFound],
+        root: StrPath,
+        cache_directory: StrPath | None = None,
     ) -> GlobalLicensing:
         if len(found) == 1 and found[0].cls == ReuseDep5:
             return ReuseDep5.from_file(found[0].path)
         # This is an impossible scenario at time of writing.
         if not all(item.cls == ReuseTOML for item in found):
             raise NotImplementedError()
-        tomls = [ReuseTOML.from_file(item.path) for item in found]
+        tomls = [
+            ReuseTOML.from_file(item.path, cache_directory=cache_directory)
+            for item in found
+        ]
         return NestedReuseTOML(reuse_tomls=tomls, source=str(root))
 
     def _identifier_of_license(self, path: Path) -> str:
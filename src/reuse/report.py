@@ -9,17 +9,23 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+# pylint: disable=too-many-lines
+
 """Module that contains reports about files and projects for linting."""
 
 import bdb
-import contextlib
 import datetime
 import logging
 import random
 from collections import defaultdict
 from collections.abc import Collection, Generator
-from concurrent.futures import ProcessPoolExecutor
-from functools import cached_property
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from functools import cached_property, lru_cache
 from hashlib import md5
 from io import StringIO
 from os import cpu_count
@@ -27,15 +33,14 @@ from pathlib import Path, PurePath
 from typing import Any, Final, NamedTuple, Optional, Protocol, cast
 from uuid import uuid4
 
-from . import __REUSE_version__, __version__
+from . import __REUSE_version__, __version__, cache
 from ._util import (
     _add_plus_to_identifier,
     _checksum,
     _strip_plus_from_identifier,
 )
-from .copyright import SpdxExpression
-from .extract import _LICENSEREF_PATTERN
-from .global_licensing import ReuseDep5
+from .copyright import SourceType, SpdxExpression
+from .extract import _LICENSEREF_PATTERN, FileRanges, _RangeResult, merge_ranges
 from .i18n import _
 from .project import Project, ReuseInfo
 from .types import StrPath
@@ -49,68 +54,170 @@ _CPU_COUNT: Final[int] = cpu_count() or 1
 #: :const:`False`, generating :meth:`FileReport.generate` will not use
 #: parallelisation.
 ENABLE_PARALLEL = True
+#: Files are sent to worker processes in batches. The first batches are small,
+#: so that all workers start early, and the following ones grow up to this
+#: size.
+_MAX_BATCH_SIZE = 256
+#: The number of batches that may be in or wait for worker processes at a time.
+_MAX_IN_FLIGHT = 2 * _CPU_COUNT
 
 # REUSE-IgnoreStart
 
 
+@lru_cache(maxsize=1024)
+def _license_concluded(expressions: frozenset[str]) -> str:
+    """Return the simplified conjunction of *expressions*. Files tend to share
+    the same few sets of expressions, so the result is memoised.
+    """
+    # Merge all the license expressions together, wrapping them in
+    # parentheses to make sure an expression doesn't spill into another
+    # one. The extra parentheses will be removed by the roundtrip
+    # through parse() -> simplify() -> render().
+    return str(
+        SpdxExpression.combine(
+            [SpdxExpression(expression) for expression in sorted(expressions)]
+        ).simplify()
+    )
+
+
 class _MultiprocessingContainer:
     """Container that remembers some data in order to generate a FileReport."""
 
     def __init__(
         self, project: Project, do_checksum: bool, add_license_concluded: bool
     ):
-        if isinstance(project.global_licensing, ReuseDep5):
-            # Remember that a dep5_copyright was (or was not) set prior.
-            self.has_dep5 = bool(project.global_licensing)
-            # TODO: We create a copy of the project in the following
-            # song-and-dance because the debian Copyright object cannot be
-            # pickled.
-            new_project = Project(
-                project.root,
-                vcs_strategy=project.vcs_strategy,
-                license_map=project.license_map,
-                licenses=project.licenses.copy(),
-                # TODO: adjust this method/class to account for REUSE.toml as
-                # well. Unset dep5_copyright
-                global_licensing=None,
-                include_submodules=project.include_submodules,
-                include_meson_subprojects=project.include_meson_subprojects,
-            )
-            new_project.licenses_without_extension = (
-                project.licenses_without_extension
-            )
-            self.project = new_project
-        else:
-            self.has_dep5 = False
-            self.project = project
-
-        self.reuse_dep5: ReuseDep5 | None = None
+        self.project = project
         self.do_checksum = do_checksum
         self.add_license_concluded = add_license_concluded
 
-    def __call__(self, file_: StrPath) -> "_MultiprocessingResult":
-        # By remembering that we've parsed the .reuse/dep5, we only parse it
-        # once (the first time) inside of each process.
-        if self.has_dep5 and not self.reuse_dep5:
-            with contextlib.suppress(Exception):
-                self.reuse_dep5 = ReuseDep5.from_file(
-                    self.project.root / ".reuse/dep5"
-                )
-                self.project.global_licensing = self.reuse_dep5
+    def __call__(
+        self, file_: StrPath, contents: ReuseInfo | None = None
+    ) -> "_MultiprocessingResult":
         # pylint: disable=broad-except
         try:
-            return _MultiprocessingResult(
+            result = _MultiprocessingResult(
                 file_,
                 FileReport.generate(
                     self.project,
                     file_,
                     do_checksum=self.do_checksum,
                     add_license_concluded=self.add_license_concluded,
+                    contents=contents,
                 ),
                 None,
             )
         except Exception as exc:
-            return _MultiprocessingResult(file_, None, exc)
+            result = _MultiprocessingResult(file_, None, exc)
+        # Only the main process writes to the cache.
+        if file_cache := self.project.file_cache:
+            result = result._replace(cache_entries=file_cache.pop_new_entries())
+        return result
+
+    def map_batch(
+        self,
+        files: list[StrPath],
+        contents: dict[StrPath, ReuseInfo] | None = None,
+    ) -> list["_MultiprocessingResult"]:
+        """Call this container on every file in *files*, with the REUSE
+        information in their *contents* if it is known.
+        """
+        contents = contents or {}
+        return [self(file_, contents.get(file_)) for file_ in files]
+
+
+#: The container of a worker process. See :func:`_initialize_worker`.
+_WORKER_CONTAINER: _MultiprocessingContainer | None = None
+
+
+def _initialize_worker(container: _MultiprocessingContainer) -> None:
+    """Remember *container* in a worker process, so that the project need not
+    be sent along with every batch of files.
+
+    With the fork start method, *container* is inherited instead of pickled,
+    together with the connections that the main process opened. These must not
+    be used here.
+    """
+    # pylint: disable=global-statement
+    global _WORKER_CONTAINER
+    if (file_cache := container.project.file_cache) is not None:
+        file_cache.forget_connections()
+    _WORKER_CONTAINER = container
+
+
+def _map_batch_in_worker(
+    files: list[StrPath],
+    contents: dict[StrPath, ReuseInfo] | None = None,
+) -> list["_MultiprocessingResult"]:
+    """Call the container of this worker process on every file in *files*."""
+    assert _WORKER_CONTAINER is not None
+    return _WORKER_CONTAINER.map_batch(files, contents)
+
+
+class _LargeFile(NamedTuple):
+    """A file whose contents are searched in ranges on the worker processes.
+    See :meth:`Project.large_file_ranges`.
+    """
+
+    path: StrPath
+    ranges: list[Future[_RangeResult]]
+
+    @classmethod
+    def submit(
+        cls, executor: ProcessPoolExecutor, path: StrPath, ranges: FileRanges
+    ) -> "_LargeFile":
+        """Search the *ranges* of the file at *path* on *executor*."""
+        return cls(
+            path,
+            [
+                executor.submit(ranges.scan, start, end)
+                for start, end in ranges.spans()
+            ],
+        )
+
+
+class _OverriddenSubtrees:
+    """Recognises directories in which the global licensing file overrides the
+    REUSE information of every file, and creates the reports of their files in
+    the main process from a single template per directory.
+
+    This requires that the files need not be read for their checksums.
+    """
+
+    def __init__(self, project: Project, add_license_concluded: bool):
+        self.project = project
+        self.add_license_concluded = add_license_concluded
+        self._templates: dict[Path, FileReport | None] = {}
+
+    def _template_of(self, directory: Path) -> Optional["FileReport"]:
+        if directory in self._templates:
+            return self._templates[directory]
+        template = None
+        # An overridden directory overrides its subdirectories, too.
+        if len(directory.parts) > len(self.project.root.parts):
+            template = self._template_of(directory.parent)
+        if template is None:
+            # pylint: disable=broad-except
+            try:
+                template = FileReport.generate_subtree(
+                    self.project,
+                    directory,
+                    add_license_concluded=self.add_license_concluded,
+                )
+            # Leave it to the per-file reports to surface the error.
+            except Exception:
+                template = None
+        self._templates[directory] = template
+        return template
+
+    def result_of(self, file_: StrPath) -> Optional["_MultiprocessingResult"]:
+        """Return the result of *file_* if it is in an overridden directory."""
+        path = Path(file_)
+        template = self._template_of(path.parent)
+        if template is None:
+            return None
+        return _MultiprocessingResult(
+            file_, FileReport.from_template(self.project, path, template), None
+        )
 
 
 class _MultiprocessingResult(NamedTuple):
@@ -119,6 +226,27 @@ class _MultiprocessingResult(NamedTuple):
     path: StrPath
     report: Optional["FileReport"]
     error: Exception | None
+    #: New entries of :attr:`Project.file_cache`.
+    cache_entries: dict[cache.CacheKey, ReuseInfo] | None = None
+
+
+def _project_report_cache_path(
+    project: Project, do_checksum: bool, add_license_concluded: bool
+) -> Path | None:
+    """Return the path at which the :class:`ProjectReport` of *project* with
+    these options is stored, if the project has a cache directory.
+    """
+    if project.cache_directory is None:
+        return None
+    options = (
+        str(Path(project.root).resolve()),
+        do_checksum,
+        add_license_concluded,
+        project.include_submodules,
+        project.include_meson_subprojects,
+    )
+    name = cache.digest(repr(options).encode("utf-8"))
+    return project.cache_directory / "project-report" / f"{name}.json"
 
 
 def _generate_file_reports(
@@ -129,27 +257,142 @@ def _generate_file_reports(
     add_license_concluded: bool = False,
 ) -> Generator[_MultiprocessingResult, None, None]:
     """Create a :class:`FileReport` for every file in the project, filtered
-    by *subset_files*.
+    by *subset_files*. If the project has a :attr:`Project.file_cache`, the
+    new entries are written to it at the end.
     """
+    # Create the cache before the project is sent to worker processes.
+    file_cache = project.file_cache
+    if file_cache is not None:
+        file_cache.prefetch()
+    new_entries: dict[cache.CacheKey, ReuseInfo] = {}
+    for result in _map_file_reports(
+        project,
+        do_checksum=do_checksum,
+        subset_files=subset_files,
+        multiprocessing=multiprocessing,
+        add_license_concluded=add_license_concluded,
+    ):
+        if result.cache_entries:
+            new_entries.update(result.cache_entries)
+        yield result
+    if file_cache is not None:
+        file_cache.write(new_entries)
+
+
+def _map_file_reports(
+    project: Project,
+    do_checksum: bool = True,
+    subset_files: Collection[StrPath] | None = None,
+    multiprocessing: bool = _CPU_COUNT > 1,
+    add_license_concluded: bool = False,
+) -> Generator[_MultiprocessingResult, None, None]:
+    # pylint: disable=too-many-locals
     container = _MultiprocessingContainer(
         project, do_checksum, add_license_concluded
     )
 
+    # The files in directories that are overridden by the global licensing
+    # file are not read, so their reports can be created without the workers,
+    # unless their checksums are needed.
+    subtrees = (
+        _OverriddenSubtrees(project, add_license_concluded)
+        if not do_checksum and project.global_licensing
+        else None
+    )
+
     files = (
         project.subset_files(subset_files)
         if subset_files is not None
         else project.all_files()
     )
     if multiprocessing and ENABLE_PARALLEL:
-        files_set = frozenset(files)
-        with ProcessPoolExecutor() as executor:
-            yield from executor.map(
-                container,
-                files_set,
-                chunksize=max(1, int(len(files_set) / _CPU_COUNT / 4)),
-            )
+        # Send the files to the workers while the project is still being
+        # walked, and never have more than a few batches in flight, so that
+        # the paths and results of a large project need not fit in memory.
+        # The container is sent to each worker only once, when it starts.
+        # Large files are split into ranges that are searched by all workers.
+        with ProcessPoolExecutor(
+            initializer=_initialize_worker, initargs=(container,)
+        ) as executor:
+            pending: set[Future[list[_MultiprocessingResult]]] = set()
+            large_files: list[_LargeFile] = []
+            batch: list[StrPath] = []
+            batch_size = 1
+            for file_ in files:
+                if subtrees and (result := subtrees.result_of(file_)):
+                    yield result
+                    continue
+                _submit_large_files(executor, pending, large_files)
+                if (ranges := project.large_file_ranges(file_)) is not None:
+                    large_files.append(
+                        _LargeFile.submit(executor, file_, ranges)
+                    )
+                    continue
+                batch.append(file_)
+                if len(batch) < batch_size:
+                    continue
+                yield from _drain(pending, _MAX_IN_FLIGHT - 1)
+                pending.add(executor.submit(_map_batch_in_worker, batch))
+                batch = []
+                batch_size = min(2 * batch_size, _MAX_BATCH_SIZE)
+            if batch:
+                pending.add(executor.submit(_map_batch_in_worker, batch))
+            while large_files:
+                wait(large_files[0].ranges)
+                _submit_large_files(executor, pending, large_files)
+            yield from _drain(pending, 0)
     else:
-        yield from map(container, files)
+        for file_ in files:
+            if subtrees and (result := subtrees.result_of(file_)):
+                yield result
+            else:
+                yield container(file_)
+
+
+def _submit_large_files(
+    executor: ProcessPoolExecutor,
+    pending: set[Future[list[_MultiprocessingResult]]],
+    large_files: list[_LargeFile],
+) -> None:
+    """Merge the ranges of the files in *large_files* whose ranges have all been
+    searched, and submit the reports of these files to *executor*. Add their
+    futures to *pending*, and remove the files from *large_files*.
+    """
+    for large_file in list(large_files):
+        if not all(future.done() for future in large_file.ranges):
+            continue
+        large_files.remove(large_file)
+        # pylint: disable=broad-except
+        try:
+            contents = merge_ranges(
+                future.result() for future in large_file.ranges
+            )
+        except Exception:
+            # Search the file again, in order to surface the error.
+            pending.add(
+                executor.submit(_map_batch_in_worker, [large_file.path])
+            )
+            continue
+        pending.add(
+            executor.submit(
+                _map_batch_in_worker,
+                [large_file.path],
+                {large_file.path: contents},
+            )
+        )
+
+
+def _drain(
+    pending: set[Future[list[_MultiprocessingResult]]], limit: int
+) -> Generator[_MultiprocessingResult, None, None]:
+    """Wait until at most *limit* futures in *pending* are not done. Remove the
+    futures that are done, and yield their results.
+    """
+    while len(pending) > limit:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield from future.result()
 
 
 def _process_error(error: Exception, path: StrPath) -> None:
@@ -197,6 +440,12 @@ class ProjectReportSubsetProtocol(Protocol):
     def files_without_copyright(self) -> set[Path]:
         """Set of paths that have no copyright information."""
 
+    @property
+    def partially_scanned_files(self) -> set[Path]:
+        """Set of paths that could not be fully searched for REUSE
+        information.
+        """
+
     @property
     def is_compliant(self) -> bool:
         """Whether the report subset is compliant with the REUSE Spec."""
@@ -389,7 +638,25 @@ class ProjectReport:
             multiprocessing: Whether to use multiprocessing.
             add_license_concluded: Whether to aggregate all found SPDX
                 expressions into a concluded license.
+
+        If the project has a :attr:`Project.cache_directory`, the report is
+        stored there together with the :meth:`Project.fingerprint`. As long as
+        the fingerprint does not change, the stored report is returned. Reports
+        with read errors or partially scanned files are not stored.
         """
+        cache_path = _project_report_cache_path(
+            project, do_checksum, add_license_concluded
+        )
+        fingerprint = project.fingerprint() if cache_path else None
+        stored: Any = None
+        if cache_path and fingerprint:
+            stored = cache.load(cache_path)
+            if (
+                not isinstance(stored, dict)
+                or stored.get("fingerprint") != fingerprint
+            ):
+                stored = None
+
         project_report = cls(do_checksum=do_checksum)
         project_report.path = project.root
         project_report.licenses = project.licenses
@@ -398,6 +665,29 @@ class ProjectReport:
             project.licenses_without_extension
         )
 
+        if stored is not None:
+            # pylint: disable=broad-except
+            try:
+                project_report.file_reports = {
+                    FileReport.from_dict_stored(
+                        project,
+                        value,
+                        do_checksum=do_checksum,
+                        add_license_concluded=add_license_concluded,
+                    )
+                    for value in stored["files"]
+                }
+                project_report.read_errors = {
+                    Path(path) for path in stored["read_errors"]
+                }
+            except Exception as error:
+                _LOGGER.debug("could not use stored report: %s", error)
+                project_report.file_reports = set()
+                project_report.read_errors = set()
+            else:
+                _LOGGER.debug("using stored report of '%s'", project.root)
+                return project_report
+
         results = _generate_file_reports(
             project,
             do_checksum=do_checksum,
@@ -413,6 +703,26 @@ class ProjectReport:
             file_report = cast(FileReport, result.report)
             project_report.file_reports.add(file_report)
 
+        # An incomplete report could be complete the next time.
+        if (
+            cache_path
+            and fingerprint
+            and not project_report.read_errors
+            and not project_report.partially_scanned_files
+        ):
+            cache.dump(
+                cache_path,
+                {
+                    "fingerprint": fingerprint,
+                    "files": [
+                        file_report.to_dict_stored()
+                        for file_report in project_report.file_reports
+                    ],
+                    "read_errors": [
+                        str(path) for path in project_report.read_errors
+                    ],
+                },
+            )
         return project_report
 
     @cached_property
@@ -493,6 +803,17 @@ class ProjectReport:
             if not file_report.copyright
         }
 
+    @cached_property
+    def partially_scanned_files(self) -> set[Path]:
+        """Set of paths that could not be fully searched for REUSE
+        information.
+        """
+        return {
+            file_report.path
+            for file_report in self.file_reports
+            if file_report.partially_scanned
+        }
+
     @cached_property
     def is_compliant(self) -> bool:
         """Whether the report is compliant with the REUSE Spec."""
@@ -687,6 +1008,17 @@ class ProjectSubsetReport:
             if not file_report.copyright
         }
 
+    @property
+    def partially_scanned_files(self) -> set[Path]:
+        """Set of paths that could not be fully searched for REUSE
+        information.
+        """
+        return {
+            file_report.path
+            for file_report in self.file_reports
+            if file_report.partially_scanned
+        }
+
     @property
     def is_compliant(self) -> bool:
         """Whether the report subset is compliant with the REUSE Spec."""
@@ -718,6 +1050,7 @@ class FileReport:  # pylint: disable=too-many-instance-attributes
 
         self.missing_licenses: set[str] = set()
         self.invalid_spdx_expressions: set[str] = set()
+        self.partially_scanned: bool = False
 
     def to_dict_lint(self) -> dict[str, Any]:
         """Turn the report into a json-like dictionary with exclusively
@@ -754,6 +1087,89 @@ class FileReport:  # pylint: disable=too-many-instance-attributes
             ],
         }
 
+    def to_dict_stored(self) -> dict[str, Any]:
+        """Turn the report into a JSON object from which
+        :meth:`from_dict_stored` creates it again.
+        """
+        return {
+            "name": self.name,
+            "path": str(self.path),
+            "chk_sum": self.chk_sum,
+            "reuse_infos": [
+                {
+                    **cache.reuse_info_to_json(reuse_info),
+                    "path": reuse_info.path,
+                    "source_path": reuse_info.source_path,
+                    "source_type": (
+                        reuse_info.source_type.value
+                        if reuse_info.source_type
+                        else None
+                    ),
+                    "partially_scanned": reuse_info.partially_scanned,
+                }
+                for reuse_info in self.reuse_infos
+            ],
+        }
+
+    @classmethod
+    def from_dict_stored(
+        cls,
+        project: Project,
+        values: dict[str, Any],
+        do_checksum: bool = True,
+        add_license_concluded: bool = False,
+    ) -> "FileReport":
+        """Create a report of a file in *project* from the JSON object
+        *values*, as created by :meth:`to_dict_stored`. Everything but the
+        REUSE information and the checksum is computed again.
+
+        Raises:
+            TypeError: *values* is not such an object.
+            ValueError: *values* contains an invalid source type.
+            CopyrightNoticeParseError: *values* contains an invalid copyright
+                notice.
+        """
+
+        def optional_string(value: Any) -> str | None:
+            if value is not None and not isinstance(value, str):
+                raise TypeError(f"{value!r} is not a string")
+            return value
+
+        if not isinstance(values, dict) or not isinstance(
+            values.get("reuse_infos"), list
+        ):
+            raise TypeError("a stored file report must be an object")
+        name = values.get("name")
+        path = values.get("path")
+        chk_sum = values.get("chk_sum")
+        if not (
+            isinstance(name, str)
+            and isinstance(path, str)
+            and isinstance(chk_sum, str)
+        ):
+            raise TypeError("'name', 'path' and 'chk_sum' must be strings")
+        report = cls(name, path, do_checksum=do_checksum)
+        report.chk_sum = chk_sum
+        report._set_id()
+        reuse_infos = []
+        for value in values["reuse_infos"]:
+            reuse_info = cache.reuse_info_from_json(value)
+            source_type = optional_string(value.get("source_type"))
+            reuse_infos.append(
+                reuse_info.copy(
+                    path=optional_string(value.get("path")),
+                    source_path=optional_string(value.get("source_path")),
+                    source_type=(
+                        SourceType(source_type) if source_type else None
+                    ),
+                    partially_scanned=value.get("partially_scanned") is True,
+                )
+            )
+        report._set_reuse_infos(
+            project, reuse_infos, add_license_concluded=add_license_concluded
+        )
+        return report
+
     @classmethod
     def generate(
         cls,
@@ -761,34 +1177,95 @@ class FileReport:  # pylint: disable=too-many-instance-attributes
         path: StrPath,
         do_checksum: bool = True,
         add_license_concluded: bool = False,
+        contents: ReuseInfo | None = None,
     ) -> "FileReport":
-        """Generate a FileReport from a path in a Project."""
-        # pylint: disable=too-many-branches
+        """Generate a FileReport from a path in a Project. See
+        :meth:`Project.reuse_info_of` for *contents*.
+        """
         path = Path(path)
         if not path.is_file():
             raise OSError(f"{path} is not a file")
 
         relative = project.relative_from_root(path)
         report = cls(f"./{relative}", path, do_checksum=do_checksum)
+        report._set_checksum_and_id()
+        report._set_reuse_infos(
+            project,
+            project.reuse_info_of(path, contents),
+            add_license_concluded=add_license_concluded,
+        )
+        return report
+
+    @classmethod
+    def generate_subtree(
+        cls,
+        project: Project,
+        directory: StrPath,
+        add_license_concluded: bool = False,
+    ) -> Optional["FileReport"]:
+        """If the global licensing file overrides the REUSE information of
+        every file in and below *directory*, return a template from which
+        :meth:`from_template` creates the reports of these files without
+        reading them. Otherwise, return :const:`None`.
+        """
+        reuse_infos = project.reuse_info_of_subtree(directory)
+        if reuse_infos is None:
+            return None
+        report = cls("", directory, do_checksum=False)
+        report._set_reuse_infos(
+            project, reuse_infos, add_license_concluded=add_license_concluded
+        )
+        return report
+
+    @classmethod
+    def from_template(
+        cls, project: Project, path: StrPath, template: "FileReport"
+    ) -> "FileReport":
+        """Create the report of *path* from a *template* that was created by
+        :meth:`generate_subtree` for one of its directories.
+        """
+        path = Path(path)
+        relative = project.relative_from_root(path)
+        report = cls(f"./{relative}", path, do_checksum=False)
+        report._set_checksum_and_id()
+        posix = relative.as_posix()
+        report.reuse_infos = [
+            reuse_info.copy(path=posix) for reuse_info in template.reuse_infos
+        ]
+        report.licenses_in_file = list(template.licenses_in_file)
+        report.license_concluded = template.license_concluded
+        report.copyright = template.copyright
+        report.missing_licenses = set(template.missing_licenses)
+        report.invalid_spdx_expressions = set(template.invalid_spdx_expressions)
+        report.partially_scanned = template.partially_scanned
+        return report
 
-        # Checksum and ID
-        if report.do_checksum:
-            report.chk_sum = _checksum(path)
+    def _set_checksum_and_id(self) -> None:
+        if self.do_checksum:
+            self.chk_sum = _checksum(self.path)
         else:
             # This path avoids a lot of heavy computation, which is handy for
             # scenarios where you only need a unique hash, not a consistent
             # hash.
-            report.chk_sum = f"{random.getrandbits(160):040x}"
+            self.chk_sum = f"{random.getrandbits(160):040x}"
+        self._set_id()
+
+    def _set_id(self) -> None:
         spdx_id = md5()
-        spdx_id.update(report.name.encode("utf-8"))
-        spdx_id.update(report.chk_sum.encode("utf-8"))
-        report.spdx_id = f"SPDXRef-{spdx_id.hexdigest()}"
+        spdx_id.update(self.name.encode("utf-8"))
+        spdx_id.update(cast(str, self.chk_sum).encode("utf-8"))
+        self.spdx_id = f"SPDXRef-{spdx_id.hexdigest()}"
 
-        reuse_infos = project.reuse_info_of(path)
+    def _set_reuse_infos(
+        self,
+        project: Project,
+        reuse_infos: list[ReuseInfo],
+        add_license_concluded: bool = False,
+    ) -> None:
         for reuse_info in reuse_infos:
             for expression in reuse_info.spdx_expressions:
                 if not expression.is_valid:
-                    report.invalid_spdx_expressions.add(str(expression))
+                    self.invalid_spdx_expressions.add(str(expression))
                     continue
                 for identifier in expression.licenses:
                     # A license expression akin to Apache-1.0+ should register
@@ -802,34 +1279,28 @@ class FileReport:  # pylint: disable=too-many-instance-attributes
                         identifiers.add(plus_identifier)
                     # Missing license
                     if not identifiers.intersection(project.licenses):
-                        report.missing_licenses.add(identifier)
+                        self.missing_licenses.add(identifier)
 
                     # Add license to report.
-                    report.licenses_in_file.append(identifier)
+                    self.licenses_in_file.append(identifier)
 
         if not add_license_concluded:
-            report.license_concluded = "NOASSERTION"
+            self.license_concluded = "NOASSERTION"
         elif not any(reuse_info.spdx_expressions for reuse_info in reuse_infos):
-            report.license_concluded = "NONE"
-        elif report.invalid_spdx_expressions:
-            report.license_concluded = "NOASSERTION"
+            self.license_concluded = "NONE"
+        elif self.invalid_spdx_expressions:
+            self.license_concluded = "NOASSERTION"
         else:
-            # Merge all the license expressions together, wrapping them in
-            # parentheses to make sure an expression doesn't spill into another
-            # one. The extra parentheses will be removed by the roundtrip
-            # through parse() -> simplify() -> render().
-            report.license_concluded = str(
-                SpdxExpression.combine(
-                    list(
-                        expression
-                        for reuse_info in reuse_infos
-                        for expression in reuse_info.spdx_expressions
-                    )
-                ).simplify()
+            self.license_concluded = _license_concluded(
+                frozenset(
+                    str(expression)
+                    for reuse_info in reuse_infos
+                    for expression in reuse_info.spdx_expressions
+                )
             )
 
         # Copyright text
-        report.copyright = "\n".join(
+        self.copyright = "\n".join(
             map(
                 str,
                 sorted(
@@ -840,8 +1311,10 @@ class FileReport:  # pylint: disable=too-many-instance-attributes
             )
         )
         # Source of licensing and copyright info
-        report.reuse_infos = reuse_infos
-        return report
+        self.reuse_infos = reuse_infos
+        self.partially_scanned = any(
+            reuse_info.partially_scanned for reuse_info in reuse_infos
+        )
 
     def __hash__(self) -> int:
         if self.chk_sum is not None:
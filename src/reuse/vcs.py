@@ -64,6 +64,23 @@ class VCSStrategy(ABC):
     def is_submodule(self, path: StrPath) -> bool:
         """Is *path* a VCS submodule?"""
 
+    def content_ids(self) -> dict[str, str]:
+        """Return the Git blob IDs of the files that the VCS tracks and that
+        are unmodified in the working tree, keyed on their POSIX paths relative
+        to :attr:`root`. Files whose contents in the working tree may differ
+        from their blobs, for instance because of a clean filter, are left
+        out. The files need not be read for this. VCSs that do not know the Git
+        blob IDs of files return an empty dictionary.
+        """
+        return {}
+
+    def clean_tree_id(self) -> str | None:
+        """If no file in :attr:`root` differs from the last commit, including
+        untracked files, return an ID of the committed tree of :attr:`root`.
+        Otherwise, or if the VCS cannot tell, return :const:`None`.
+        """
+        return None
+
     @classmethod
     @abstractmethod
     def in_repo(cls, directory: StrPath) -> bool:
@@ -169,6 +186,7 @@ class VCSStrategyGit(VCSStrategy):
             raise FileNotFoundError("Could not find binary for Git")
         self._all_ignored_files = self._find_all_ignored_files()
         self._submodules = self._find_submodules()
+        self._content_ids: dict[str, str] | None = None
 
     def _find_all_ignored_files(self) -> set[Path]:
         """Return a set of all files ignored by git. If a whole directory is
@@ -212,6 +230,127 @@ class VCSStrategyGit(VCSStrategy):
         # Each entry looks a little like 'submodule.submodule.path\nmy_path'.
         return {Path(entry.splitlines()[1]) for entry in submodule_entries}
 
+    def _find_content_ids(self) -> dict[str, str]:
+        command = [str(self.EXE), "ls-files", "--stage", "-z"]
+        result = execute_command(command, _LOGGER, cwd=self.root)
+        if result.returncode:
+            return {}
+        content_ids = {}
+        for entry in result.stdout.decode("utf-8").split("\0"):
+            if not entry:
+                continue
+            # Each entry looks like '<mode> <object> <stage>\t<path>'.
+            info, _, path = entry.partition("\t")
+            mode, object_id, stage = info.split(" ")
+            # Only regular files that are not in a merge conflict.
+            if stage == "0" and mode in ("100644", "100755"):
+                content_ids[path] = object_id
+
+        # Unlike 'git diff-files', 'git status' does not mistake files whose
+        # metadata changed for modified files. Its paths are relative to the
+        # top of the repository.
+        command = [str(self.EXE), "rev-parse", "--show-prefix"]
+        result = execute_command(command, _LOGGER, cwd=self.root)
+        if result.returncode:
+            return {}
+        prefix = result.stdout.decode("utf-8").strip()
+        command = [
+            str(self.EXE),
+            "status",
+            "--porcelain",
+            "--untracked-files=no",
+            "--no-renames",
+            "-z",
+            "--",
+            ".",
+        ]
+        result = execute_command(command, _LOGGER, cwd=self.root)
+        if result.returncode:
+            return {}
+        for entry in result.stdout.decode("utf-8").split("\0"):
+            # Each entry looks like 'XY <path>'.
+            content_ids.pop(entry[3:].removeprefix(prefix), None)
+        if not content_ids:
+            return content_ids
+        return self._remove_differing_blobs(content_ids)
+
+    def _remove_differing_blobs(
+        self, content_ids: dict[str, str]
+    ) -> dict[str, str]:
+        """Remove the paths from *content_ids* whose contents in the working
+        tree may differ from their blobs, and return it.
+        """
+        # The blob may differ from the file in the working tree even when Git
+        # reports no changes, for instance because of a clean filter such as
+        # Git LFS, or because of end-of-line conversion. Skip files that have
+        # a filter, and files whose size differs from that of their blob.
+        command = [str(self.EXE), "check-attr", "-z", "--stdin", "filter"]
+        result = execute_command(
+            command,
+            _LOGGER,
+            cwd=self.root,
+            input="\0".join(content_ids).encode("utf-8"),
+        )
+        if result.returncode:
+            return {}
+        # The output looks like '<path>\0filter\0<value>\0' for each path.
+        fields = result.stdout.decode("utf-8").split("\0")
+        for path, value in zip(fields[0::3], fields[2::3]):
+            if value not in ("unspecified", "unset"):
+                content_ids.pop(path, None)
+
+        object_ids = sorted(set(content_ids.values()))
+        command = [str(self.EXE), "cat-file", "--batch-check"]
+        result = execute_command(
+            command,
+            _LOGGER,
+            cwd=self.root,
+            input="".join(f"{object_id}\n" for object_id in object_ids).encode(
+                "utf-8"
+            ),
+        )
+        if result.returncode:
+            return {}
+        # Each line looks like '<object> blob <size>', or '<object> missing'.
+        sizes = {}
+        for line in result.stdout.decode("utf-8").splitlines():
+            fields = line.split(" ")
+            if len(fields) == 3:
+                sizes[fields[0]] = int(fields[2])
+        for path, object_id in list(content_ids.items()):
+            try:
+                size = (self.root / path).stat().st_size
+            except OSError:
+                size = None
+            if sizes.get(object_id) != size:
+                del content_ids[path]
+        return content_ids
+
+    def content_ids(self) -> dict[str, str]:
+        if self._content_ids is None:
+            self._content_ids = self._find_content_ids()
+        return self._content_ids
+
+    def clean_tree_id(self) -> str | None:
+        command = [
+            str(self.EXE),
+            "status",
+            "--porcelain",
+            "--untracked-files=all",
+            "-z",
+            "--",
+            ".",
+        ]
+        result = execute_command(command, _LOGGER, cwd=self.root)
+        if result.returncode or result.stdout:
+            return None
+        # The tree of the current directory in HEAD.
+        command = [str(self.EXE), "rev-parse", "--verify", "--quiet", "HEAD:./"]
+        result = execute_command(command, _LOGGER, cwd=self.root)
+        if result.returncode:
+            return None
+        return result.stdout.decode("utf-8").strip()
+
     def is_ignored(self, path: Path) -> bool:
         path = relative_from_root(path, self.root)
         return path in self._all_ignored_files
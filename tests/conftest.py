@@ -20,6 +20,7 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 from collections.abc import Generator
 from inspect import cleandoc
 from io import StringIO
@@ -44,6 +45,7 @@ except ImportError:
 finally:
     from reuse import extract, report
     from reuse._util import setup_logging
+    from reuse.cache_server import CacheServer
     from reuse.comment import (
         EmptyCommentStyle,
         UncommentableCommentStyle,
@@ -206,6 +208,30 @@ def add_license_concluded(request) -> Generator[bool, None, None]:
     yield request
 
 
+@pytest.fixture(autouse=True)
+def user_cache_directory(tmp_path_factory, monkeypatch) -> Path:
+    """Keep the caches that tests create out of the user's cache directory."""
+    directory = tmp_path_factory.mktemp("user_cache_directory")
+    monkeypatch.setattr("reuse.cache.user_cache_directory", lambda: directory)
+    return directory
+
+
+@pytest.fixture()
+def cache_server(tmp_path) -> Generator[CacheServer, None, None]:
+    """Run a cache server on a free port in a thread."""
+    server = CacheServer(("127.0.0.1", 0), tmp_path / "server.sqlite")
+    thread = threading.Thread(
+        target=server.serve_forever,
+        kwargs={"poll_interval": 0.01},
+        daemon=True,
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
 @pytest.fixture()
 def empty_directory(tmpdir_factory) -> Path:
     """Create a temporary empty directory."""
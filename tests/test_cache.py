@@ -0,0 +1,482 @@
+# SPDX-FileCopyrightText: 2025 Free Software Foundation Europe e.V. <https://fsfe.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""All tests for reuse.cache"""
+
+import io
+import json
+import os
+import pickle
+import sqlite3
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from conftest import git
+
+import reuse.cache
+from reuse.cache import (
+    CacheKey,
+    ContentCache,
+    FileCache,
+    HTTPCacheBackend,
+    cache_directory,
+    content_cache_path,
+    digest,
+    dump,
+    git_blob_id,
+    load,
+    reuse_info_to_json,
+    tree_fingerprint,
+)
+from reuse.copyright import CopyrightNotice, ReuseInfo, SpdxExpression
+from reuse.vcs import GIT_EXE, VCSStrategyNone
+
+
+def test_digest_distinguishes_parts():
+    """The boundaries between parts are part of the digest."""
+    assert digest(b"a", b"bc") != digest(b"ab", b"c")
+    assert digest(b"abc") == digest(b"abc")
+
+
+def test_user_cache_directory(tmp_path, monkeypatch):
+    """The user cache directory follows XDG_CACHE_HOME where that applies."""
+    # Undo the fixture that replaces the function.
+    monkeypatch.undo()
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert reuse.cache.user_cache_directory() == tmp_path / "reuse"
+    monkeypatch.setenv("XDG_CACHE_HOME", "relative")
+    assert reuse.cache.user_cache_directory() == (
+        Path.home() / ".cache" / "reuse"
+    )
+
+
+def test_cache_directory(empty_directory, user_cache_directory):
+    """The cache directory of a project is outside of the project, and differs
+    between projects.
+    """
+    (empty_directory / "foo").mkdir()
+    result = cache_directory(empty_directory)
+    assert result is not None
+    assert result.is_relative_to(user_cache_directory)
+    assert result == cache_directory(".")
+    assert result != cache_directory(empty_directory / "foo")
+
+
+def test_cache_directory_without_home(empty_directory, monkeypatch):
+    """If there is no user cache directory, there is no cache directory."""
+
+    def user_cache_directory():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(
+        "reuse.cache.user_cache_directory", user_cache_directory
+    )
+    assert cache_directory(empty_directory) is None
+    assert content_cache_path() is None
+
+
+def test_content_cache_path(empty_directory, user_cache_directory):
+    """The content cache is the same for all projects, wherever they are."""
+    result = content_cache_path()
+    directory = cache_directory(empty_directory)
+    assert result is not None
+    assert directory is not None
+    assert result.is_relative_to(user_cache_directory)
+    assert not result.is_relative_to(directory)
+
+
+def test_dump_load(empty_directory):
+    """A value that was dumped can be loaded again."""
+    path = empty_directory / "foo" / "bar.json"
+    dump(path, {"hello": [1, 2]})
+    assert load(path) == {"hello": [1, 2]}
+    assert not list(path.parent.glob(".tmp-*"))
+
+
+def test_dump_json(empty_directory):
+    """Values are stored as JSON."""
+    path = empty_directory / "foo.json"
+    dump(path, {"hello": [1, 2]})
+    assert json.loads(path.read_text()) == {"hello": [1, 2]}
+
+
+def test_dump_not_json(empty_directory):
+    """Values that are not JSON are not stored."""
+    path = empty_directory / "foo.json"
+    dump(path, {"hello": object()})
+    assert load(path) is None
+    assert not list(empty_directory.glob(".tmp-*"))
+
+
+def test_load_missing(empty_directory):
+    """Return None if there is no cached value."""
+    assert load(empty_directory / "foo.json") is None
+
+
+def test_load_corrupt(empty_directory):
+    """Return None if the cached value cannot be read."""
+    (empty_directory / "foo.json").write_bytes(b"not json")
+    assert load(empty_directory / "foo.json") is None
+
+
+def test_load_pickle(empty_directory):
+    """Pickled objects are not loaded."""
+    (empty_directory / "foo.json").write_bytes(pickle.dumps({"hello": 1}))
+    assert load(empty_directory / "foo.json") is None
+
+
+def test_dump_unwritable(empty_directory):
+    """Errors while writing are ignored."""
+    (empty_directory / "foo").write_text("not a directory")
+    dump(empty_directory / "foo" / "bar.json", 1)
+    assert load(empty_directory / "foo" / "bar.json") is None
+
+
+class TestFileCache:
+    """Tests for FileCache."""
+
+    @staticmethod
+    def _key(file_cache, path):
+        os.utime(path, ns=(10**18, 10**18))
+        with path.open("rb") as fp:
+            return file_cache.key(path.name, fp, os.fstat(fp.fileno()))
+
+    def test_write_get(self, empty_directory):
+        """Written entries can be looked up."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        reuse_info = ReuseInfo(spdx_expressions={SpdxExpression("MIT")})
+        file_cache = FileCache(empty_directory / "files.db")
+        key = self._key(file_cache, path)
+        assert file_cache.get(key) is None
+
+        file_cache.put(key, reuse_info)
+        # Not written yet.
+        assert file_cache.get(key) is None
+        file_cache.write(file_cache.pop_new_entries())
+        assert not file_cache.pop_new_entries()
+
+        file_cache = FileCache(empty_directory / "files.db")
+        assert file_cache.get(key) == reuse_info
+        assert file_cache.get(key._replace(name="bar.py")) is None
+
+    def test_json(self, empty_directory):
+        """Entries are stored as JSON. Other values are not loaded."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        reuse_info = ReuseInfo(
+            spdx_expressions={SpdxExpression("MIT")},
+            copyright_notices={
+                CopyrightNotice.from_string(
+                    "SPDX-FileCopyrightText: 2017 Jane Doe"
+                )
+            },
+            contributor_lines={"John Doe"},
+        )
+        file_cache = FileCache(empty_directory / "files.db")
+        key = self._key(file_cache, path)
+        file_cache.write({key: reuse_info})
+        with sqlite3.connect(file_cache.path) as connection:
+            (value,) = connection.execute(
+                "SELECT reuse_info FROM entries"
+            ).fetchone()
+            assert json.loads(value) == reuse_info_to_json(reuse_info)
+            connection.execute(
+                "UPDATE entries SET reuse_info = ?",
+                (pickle.dumps(reuse_info),),
+            )
+        connection.close()
+        assert FileCache(empty_directory / "files.db").get(key) is None
+
+    def test_metadata_changed(self, empty_directory):
+        """An entry is invalid when the metadata of its file changes."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        file_cache = FileCache(empty_directory / "files.db")
+        key = self._key(file_cache, path)
+        file_cache.write({key: ReuseInfo()})
+        path.write_text("foobar")
+        assert file_cache.get(self._key(file_cache, path)) is None
+
+    def test_racy(self, empty_directory):
+        """Files that were just modified are not cached."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        file_cache = FileCache(empty_directory / "files.db")
+        with path.open("rb") as fp:
+            assert file_cache.key("foo.py", fp, os.fstat(fp.fileno())) is None
+
+    def test_pickle(self, empty_directory):
+        """A pickled cache has no connection or new entries."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        file_cache = FileCache(empty_directory / "files.db")
+        key = self._key(file_cache, path)
+        file_cache.write({key: ReuseInfo()})
+        file_cache.put(key, ReuseInfo())
+        result = pickle.loads(pickle.dumps(file_cache))
+        assert result.path == file_cache.path
+        assert not result.pop_new_entries()
+
+    def test_corrupt(self, empty_directory):
+        """A corrupt database is ignored."""
+        path = empty_directory / "foo.py"
+        path.write_text("foo")
+        (empty_directory / "files.db").write_text("not a database")
+        file_cache = FileCache(empty_directory / "files.db")
+        key = self._key(file_cache, path)
+        assert file_cache.get(key) is None
+        file_cache.write({key: ReuseInfo()})
+
+
+class TestContentCache:
+    """Tests for ContentCache."""
+
+    @staticmethod
+    def _key(file_cache, path, name=None):
+        with path.open("rb") as fp:
+            return file_cache.key(name or path.name, fp, os.fstat(fp.fileno()))
+
+    def test_same_contents(self, empty_directory):
+        """Files with the same contents share an entry, wherever they are."""
+        (empty_directory / "foo.py").write_text("foo")
+        (empty_directory / "bar.py").write_text("foo")
+        reuse_info = ReuseInfo(spdx_expressions={SpdxExpression("MIT")})
+        file_cache = ContentCache(
+            empty_directory / "content.db", VCSStrategyNone(empty_directory)
+        )
+        file_cache.write(
+            {self._key(file_cache, empty_directory / "foo.py"): reuse_info}
+        )
+
+        file_cache = ContentCache(
+            empty_directory / "content.db", VCSStrategyNone(empty_directory)
+        )
+        assert (
+            file_cache.get(self._key(file_cache, empty_directory / "bar.py"))
+            == reuse_info
+        )
+        (empty_directory / "bar.py").write_text("bar")
+        assert (
+            file_cache.get(self._key(file_cache, empty_directory / "bar.py"))
+            is None
+        )
+
+    def test_content_ids_of_vcs(self, empty_directory, monkeypatch):
+        """The IDs that the VCS knows are used without reading the file."""
+        (empty_directory / "foo.py").write_text("foo")
+        vcs_strategy = VCSStrategyNone(empty_directory)
+        monkeypatch.setattr(
+            vcs_strategy, "content_ids", lambda: {"foo.py": "cafe"}
+        )
+        file_cache = ContentCache(empty_directory / "content.db", vcs_strategy)
+        assert self._key(file_cache, empty_directory / "foo.py").name == "cafe"
+        assert self._key(
+            file_cache, empty_directory / "foo.py", name="bar.py"
+        ).name == git_blob_id(io.BytesIO(b"foo"), 3)
+
+
+def _url(server):
+    host, port = server.server_address
+    return f"http://{host}:{port}"
+
+
+class TestHTTPCacheBackend:
+    """Tests for HTTPCacheBackend."""
+
+    def test_store_lookup(self, cache_server):
+        """Stored entries can be looked up in batches."""
+        backend = HTTPCacheBackend(_url(cache_server), batch_size=2)
+        entries = {
+            str(index): ReuseInfo(
+                spdx_expressions={SpdxExpression(f"MIT OR GPL-{index}.0")},
+                copyright_notices={
+                    CopyrightNotice.from_string(
+                        f"SPDX-FileCopyrightText: 20{index}0 Jane Doe"
+                    )
+                },
+                contributor_lines={"John Doe"},
+            )
+            for index in range(5)
+        }
+        backend.store(entries)
+        assert backend.lookup(["0", "2", "4", "5"]) == {
+            "0": entries["0"],
+            "2": entries["2"],
+            "4": entries["4"],
+        }
+
+    def test_invalid_entries(self, cache_server):
+        """Invalid entries are ignored."""
+        cache_server.store(
+            {
+                "foo": {"copyright_notices": ["not a copyright notice"]},
+                "bar": {"spdx_expressions": "MIT"},
+                "baz": ["MIT"],
+            }
+        )
+        backend = HTTPCacheBackend(_url(cache_server))
+        assert not backend.lookup(["foo", "bar", "baz"])
+
+    def test_unreachable(self, cache_server):
+        """If the server cannot be reached, nothing is found, and the server
+        is not contacted again.
+        """
+        url = _url(cache_server)
+        cache_server.shutdown()
+        cache_server.server_close()
+        backend = HTTPCacheBackend(url)
+        assert not backend.lookup(["foo"])
+        with mock.patch.object(backend, "_request") as request:
+            backend.store({"foo": ReuseInfo()})
+            request.assert_not_called()
+
+    def test_pickle(self, cache_server):
+        """A pickled backend has no connection."""
+        backend = HTTPCacheBackend(_url(cache_server))
+        backend.lookup(["foo"])
+        result = pickle.loads(pickle.dumps(backend))
+        assert result.url == backend.url
+
+    def test_invalid_url(self):
+        """Only HTTP URLs are accepted."""
+        with pytest.raises(ValueError):
+            HTTPCacheBackend("ftp://example.com")
+
+
+def test_content_cache_backend(empty_directory, cache_server, monkeypatch):
+    """A content cache looks up the files that the VCS knows in its backend
+    ahead of time, and sends new entries to it.
+    """
+    # pylint: disable=protected-access
+    (empty_directory / "foo.py").write_text("foo")
+    content_id = git_blob_id(io.BytesIO(b"foo"), 3)
+    vcs_strategy = VCSStrategyNone(empty_directory)
+    monkeypatch.setattr(
+        vcs_strategy, "content_ids", lambda: {"foo.py": content_id}
+    )
+    url = _url(cache_server)
+    reuse_info = ReuseInfo(spdx_expressions={SpdxExpression("MIT")})
+
+    file_cache = ContentCache(
+        empty_directory / "one.db", vcs_strategy, HTTPCacheBackend(url)
+    )
+    file_cache.write({CacheKey(content_id, ""): reuse_info})
+
+    file_cache = ContentCache(
+        empty_directory / "two.db", vcs_strategy, HTTPCacheBackend(url)
+    )
+    key = CacheKey(content_id, "")
+    assert file_cache.get(key) is None
+    file_cache.prefetch()
+    # The connection is not left open for worker processes to inherit.
+    assert file_cache._connection is None
+    assert file_cache.get(key) == reuse_info
+
+    # Entries that are in the database are not looked up again.
+    with mock.patch.object(file_cache.backend, "lookup") as lookup:
+        file_cache.prefetch()
+        lookup.assert_not_called()
+
+
+def test_forget_connections(empty_directory, cache_server):
+    """Forgotten connections are neither used nor closed, and new ones are
+    opened when needed.
+    """
+    # pylint: disable=protected-access
+    backend = HTTPCacheBackend(_url(cache_server))
+    file_cache = ContentCache(
+        empty_directory / "content.db",
+        VCSStrategyNone(empty_directory),
+        backend,
+    )
+    file_cache.write({CacheKey("foo", ""): ReuseInfo()})
+    backend.lookup(["foo"])
+    connection = file_cache._connection
+    assert connection is not None
+    with mock.patch.object(reuse.cache, "_INHERITED_CONNECTIONS", []):
+        file_cache.forget_connections()
+        assert reuse.cache._INHERITED_CONNECTIONS[0] is connection
+        assert len(reuse.cache._INHERITED_CONNECTIONS) == 2
+    assert file_cache._connection is None
+    assert backend._connection is None
+    assert file_cache.get(CacheKey("foo", "")) == ReuseInfo()
+    assert file_cache._connection not in (None, connection)
+    connection.close()
+
+
+@git
+def test_git_blob_id(empty_directory):
+    """The ID is the one that Git computes, and the position of the file is
+    unchanged.
+    """
+    path = empty_directory / "foo.py"
+    path.write_bytes(b"hello\nworld\n" * 1000)
+    expected = subprocess.run(
+        [str(GIT_EXE), "hash-object", str(path)],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+    with path.open("rb") as fp:
+        fp.read(5)
+        assert git_blob_id(fp, path.stat().st_size) == expected
+        assert fp.tell() == 5
+
+
+class TestTreeFingerprint:
+    """Tests for tree_fingerprint."""
+
+    @staticmethod
+    def _write(path, text, mtime=10**18):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        os.utime(path, ns=(mtime, mtime))
+
+    def test_changes(self, empty_directory):
+        """The fingerprint changes when a file is added, removed, renamed or
+        modified, and not otherwise.
+        """
+        self._write(empty_directory / "foo/bar.py", "bar")
+        first = tree_fingerprint(empty_directory)
+        assert first is not None
+        assert tree_fingerprint(empty_directory) == first
+
+        self._write(empty_directory / "foo/bar.py", "baz", mtime=10**18 + 1)
+        second = tree_fingerprint(empty_directory)
+        assert second != first
+
+        (empty_directory / "foo/bar.py").rename(empty_directory / "foo/baz.py")
+        third = tree_fingerprint(empty_directory)
+        assert third not in (first, second)
+
+        self._write(empty_directory / "baz.py", "baz")
+        assert tree_fingerprint(empty_directory) not in (first, second, third)
+
+    def test_skipped(self, empty_directory, monkeypatch):
+        """The directories of VCSs, directories without files, and what the VCS
+        ignores are skipped.
+        """
+        vcs_strategy = VCSStrategyNone(empty_directory)
+        monkeypatch.setattr(
+            vcs_strategy, "is_ignored", lambda path: path.name == "build"
+        )
+        self._write(empty_directory / "foo.py", "foo")
+        expected = tree_fingerprint(empty_directory, vcs_strategy=vcs_strategy)
+        self._write(empty_directory / "build/foo.py", "foo")
+        self._write(empty_directory / ".git/index", "foo")
+        (empty_directory / "bar/baz").mkdir(parents=True)
+        assert (
+            tree_fingerprint(empty_directory, vcs_strategy=vcs_strategy)
+            == expected
+        )
+        assert tree_fingerprint(empty_directory) != expected
+
+    def test_racy(self, empty_directory):
+        """There is no fingerprint while a file was just modified."""
+        (empty_directory / "foo.py").write_text("foo")
+        assert tree_fingerprint(empty_directory) is None
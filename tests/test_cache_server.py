@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2025 Free Software Foundation Europe e.V. <https://fsfe.org>
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""All tests for reuse.cache_server"""
+
+import http.client
+import json
+
+
+def _request(server, method, path, body=None):
+    connection = http.client.HTTPConnection(*server.server_address)
+    data = None if body is None else json.dumps(body).encode("utf-8")
+    connection.request(method, path, data)
+    response = connection.getresponse()
+    content = response.read()
+    connection.close()
+    return response.status, json.loads(content) if content else None
+
+
+def test_put_get(cache_server):
+    """Entries that are put can be gotten."""
+    assert _request(cache_server, "GET", "/entries/foo") == (404, None)
+    assert _request(cache_server, "PUT", "/entries/foo", {"a": 1}) == (
+        204,
+        None,
+    )
+    assert _request(cache_server, "GET", "/entries/foo") == (200, {"a": 1})
+
+
+def test_batch(cache_server):
+    """Many entries can be put and looked up at once."""
+    status, _ = _request(
+        cache_server, "PUT", "/entries", {"foo": [1], "bar": [2]}
+    )
+    assert status == 204
+    assert _request(cache_server, "POST", "/lookup", ["foo", "bar", "baz"]) == (
+        200,
+        {"foo": [1], "bar": [2]},
+    )
+
+
+def test_persistent_connection(cache_server):
+    """Many requests can be sent over the same connection."""
+    connection = http.client.HTTPConnection(*cache_server.server_address)
+    for index in range(3):
+        connection.request("PUT", f"/entries/{index}", json.dumps(index))
+        assert connection.getresponse().read() == b""
+    connection.request("POST", "/lookup", json.dumps(["0", "1", "2"]))
+    assert json.loads(connection.getresponse().read()) == {
+        "0": 0,
+        "1": 1,
+        "2": 2,
+    }
+    connection.close()
+
+
+def test_bad_requests(cache_server):
+    """Invalid requests are refused."""
+    assert _request(cache_server, "POST", "/lookup", {"foo": 1})[0] == 400
+    assert _request(cache_server, "POST", "/lookup", [1])[0] == 400
+    assert _request(cache_server, "PUT", "/entries", ["foo"])[0] == 400
+    assert _request(cache_server, "POST", "/foo", ["foo"])[0] == 404
+    assert _request(cache_server, "PUT", "/foo/bar", 1)[0] == 404
+    assert _request(cache_server, "GET", "/entries/foo/bar")[0] == 404
+
+    connection = http.client.HTTPConnection(*cache_server.server_address)
+    connection.request("PUT", "/entries/foo", b"not json")
+    assert connection.getresponse().status == 400
+    connection.close()
@@ -266,3 +266,18 @@ class TestLint:
 
         assert result.exit_code == 0
         assert ":-)" in result.output
+
+    def test_cache(self, fake_repository_reuse_toml, user_cache_directory):
+        """REUSE.toml is cached in the user's cache directory, unless --no-cache
+        is given. Nothing is written to the project.
+        """
+        result = CliRunner().invoke(main, ["--no-cache", "lint"])
+        assert result.exit_code == 0
+        assert not list(user_cache_directory.iterdir())
+
+        for _ in range(2):
+            result = CliRunner().invoke(main, ["lint"])
+            assert result.exit_code == 0
+            assert ":-)" in result.output
+        assert list(user_cache_directory.glob("projects/*/reuse-toml/*.json"))
+        assert not (fake_repository_reuse_toml / ".reuse").exists()
@@ -29,3 +29,33 @@ class TestMain:
         assert result.output.startswith(f"reuse, version {__version__}\n")
         assert "This program is free software:" in result.output
         assert "GNU General Public License" in result.output
+
+    def test_cache_url_requires_content_mode(self):
+        """--cache-url cannot be used without the content cache."""
+        result = CliRunner().invoke(
+            main, ["--cache-url", "http://localhost", "lint"]
+        )
+        assert result.exit_code == 2
+        assert "--cache-mode content" in result.output
+
+        result = CliRunner().invoke(
+            main,
+            [
+                "--cache-mode",
+                "content",
+                "--no-cache",
+                "--cache-url",
+                "http://localhost",
+                "lint",
+            ],
+        )
+        assert result.exit_code == 2
+
+    def test_cache_url_invalid(self):
+        """--cache-url must be an HTTP URL."""
+        result = CliRunner().invoke(
+            main,
+            ["--cache-mode", "content", "--cache-url", "localhost", "lint"],
+        )
+        assert result.exit_code == 2
+        assert "not an HTTP URL" in result.output
@@ -11,6 +11,7 @@
 
 """Tests for reuse.copyright"""
 
+import pickle
 import re
 from typing import cast
 from unittest import mock
@@ -535,6 +536,18 @@ class TestCopyrightNoticeFromString:
         notice = CopyrightNotice.from_string(f"{text} Jane Doe")
         assert notice == CopyrightNotice("Jane Doe", prefix=prefix)
 
+    def test_spacing_in_prefix_without_difflib(self, monkeypatch):
+        """Unexpected spacing in the prefix is resolved without a fuzzy
+        match.
+        """
+        get_close_matches = mock.Mock()
+        monkeypatch.setattr("difflib.get_close_matches", get_close_matches)
+        notice = CopyrightNotice.from_string(
+            "SPDX-FileCopyrightText:   Copyright  (c) 2017 Jane Doe"
+        )
+        assert notice.prefix == CopyrightPrefix.SPDX_STRING_C_LOWER
+        get_close_matches.assert_not_called()
+
     def test_with_year(self):
         """If a year is given, parse it correctly."""
         notice = CopyrightNotice.from_string("Copyright 2017 Jane Doe")
@@ -715,6 +728,51 @@ class TestCopyrightNoticeFromString:
         assert notice.name == "helloworld,Jane Doe"
 
 
+class TestCopyrightNoticeIntern:
+    """Tests for the intern table of CopyrightNotice.from_match."""
+
+    def test_same_object(self):
+        """Parsing the same text twice returns the same object."""
+        first = CopyrightNotice.from_string("SPDX-FileCopyrightText: 2017 Jane")
+        second = CopyrightNotice.from_string(
+            "SPDX-FileCopyrightText: 2017 Jane"
+        )
+        assert first is second
+        assert first.original == "SPDX-FileCopyrightText: 2017 Jane"
+
+    def test_original_differs(self):
+        """Notices with equal values but different original texts are not
+        shared.
+        """
+        first = CopyrightNotice.from_string("SPDX-FileCopyrightText: 2017 Jane")
+        second = CopyrightNotice.from_string(
+            "SPDX-FileCopyrightText:  2017 Jane"
+        )
+        assert first == second
+        assert first is not second
+        assert second.original == "SPDX-FileCopyrightText:  2017 Jane"
+
+    def test_cache_info(self):
+        """Hits and misses are counted."""
+        CopyrightNotice.cache_clear()
+        for _ in range(3):
+            CopyrightNotice.from_string("Copyright 2017 Jane Doe")
+        CopyrightNotice.from_string("Copyright 2017 John Doe")
+        info = CopyrightNotice.cache_info()
+        assert info.hits == 2
+        assert info.misses == 2
+        assert info.currsize == 2
+        assert info.hit_rate == 0.5
+
+    def test_cache_clear(self):
+        """Clearing the table resets the statistics."""
+        CopyrightNotice.from_string("Copyright 2017 Jane Doe")
+        CopyrightNotice.cache_clear()
+        info = CopyrightNotice.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+        assert info.hit_rate == 0.0
+
+
 class TestCopyrightNoticeToString:
     """Tests for CopyrightNotice.to_string."""
 
@@ -921,6 +979,95 @@ class TestSpdxExpressionLicenses:
         assert expression.licenses == ["0BSD AND"]
 
 
+class TestSpdxExpressionParseCache:
+    """Tests for the process-wide parse cache of SpdxExpression."""
+
+    def test_shared_between_instances(self):
+        """Identical expressions are parsed once."""
+        SpdxExpression.cache_clear()
+        first = SpdxExpression("MIT OR 0BSD")
+        second = SpdxExpression("MIT  OR\n0BSD")
+        assert first.is_valid and second.is_valid
+        # pylint: disable=protected-access
+        assert first._expression is second._expression
+        info = SpdxExpression.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+        assert info.hit_rate == 0.5
+
+    def test_licenses_not_shared(self):
+        """Each instance has its own list of licenses."""
+        first = SpdxExpression("MIT OR 0BSD")
+        first.licenses.append("Apache-2.0")
+        assert SpdxExpression("MIT OR 0BSD").licenses == ["MIT", "0BSD"]
+
+    def test_invalid_keeps_text(self):
+        """Invalid expressions that share a parse result keep their own
+        text.
+        """
+        assert str(SpdxExpression("MIT  AND")) == "MIT  AND"
+        assert str(SpdxExpression("MIT AND")) == "MIT AND"
+
+
+class TestSpdxExpressionSimpleForms:
+    """Tests for the recognition of simple expressions without the full
+    parser.
+    """
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "MIT",
+            "GPL-2.0+",
+            "LicenseRef-foo.bar",
+            "GPL-3.0-or-later WITH Classpath-exception-2.0",
+            "MIT OR 0BSD OR MIT",
+            "MIT AND Apache-2.0 WITH LLVM-exception",
+        ],
+    )
+    def test_same_as_parser(self, text):
+        """Simple forms have the same result as the full parser, without
+        building the expression tree.
+        """
+        SpdxExpression.cache_clear()
+        expression = SpdxExpression(text)
+        parsed = _LICENSING.parse(text, simple=True)
+        assert expression.is_valid
+        assert expression.licenses == _LICENSING.license_keys(parsed)
+        assert str(expression) == str(parsed)
+        # pylint: disable=protected-access
+        assert expression._parsed is not None
+        assert expression._parsed._expression is None
+        assert expression._expression == parsed
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "MIT OR 0BSD AND Apache-2.0",
+            "(MIT OR 0BSD)",
+            "mit or 0bsd",
+            "DocumentRef-x:LicenseRef-y",
+        ],
+    )
+    def test_other_forms(self, text):
+        """Other valid forms are handed to the full parser."""
+        expression = SpdxExpression(text)
+        parsed = _LICENSING.parse(text, simple=True)
+        assert expression.is_valid
+        assert str(expression) == str(parsed)
+
+    @pytest.mark.parametrize(
+        "text",
+        ["MIT AND", "MIT WITH", "AND", "MIT AND or", "MIT WITH a WITH b"],
+    )
+    def test_invalid(self, text):
+        """Invalid expressions are still invalid."""
+        assert not SpdxExpression(text).is_valid
+
+    def test_simplify(self):
+        """Simple forms can still be simplified."""
+        assert SpdxExpression("MIT OR MIT").simplify() == SpdxExpression("MIT")
+
+
 class TestSpdxExpressionCombine:
     """Tests for :classmethod:`SpdxExpression.combine`."""
 
@@ -1117,6 +1264,51 @@ def test_reuse_info_copy_simple():
     assert new_info.source_path == "bar"
 
 
+def test_reuse_info_frozensets():
+    """Sets are stored as frozensets, and ReuseInfo is hashable."""
+    info = ReuseInfo(spdx_expressions={SpdxExpression("MIT")})
+    assert isinstance(info.spdx_expressions, frozenset)
+    assert isinstance(info.copyright_notices, frozenset)
+    assert hash(info) == hash(
+        ReuseInfo(spdx_expressions=frozenset({SpdxExpression("MIT")}))
+    )
+
+
+def test_reuse_info_empty():
+    """The shared empty instance contains nothing."""
+    assert ReuseInfo.EMPTY == ReuseInfo()
+    assert not ReuseInfo.EMPTY
+    assert not ReuseInfo.EMPTY.contains_info()
+
+
+def test_reuse_info_pickle():
+    """ReuseInfo survives a round trip through pickle."""
+    info = ReuseInfo(
+        spdx_expressions={SpdxExpression("MIT")},
+        source_type=SourceType.FILE_HEADER,
+    )
+    result = pickle.loads(pickle.dumps(info))
+    assert result == info
+    assert result.contains_info()
+
+
+def test_reuse_info_copy_shares_sets():
+    """A copy shares the sets that are not replaced."""
+    info = ReuseInfo(spdx_expressions={SpdxExpression("MIT")})
+    assert info.copy() is info
+    new_info = info.copy(source_path="bar")
+    assert new_info.spdx_expressions is info.spdx_expressions
+
+
+def test_reuse_info_copy_replace_set():
+    """Replacing a set in a copy converts it and updates contains_info."""
+    info = ReuseInfo(source_path="foo")
+    new_info = info.copy(spdx_expressions={SpdxExpression("MIT")})
+    assert isinstance(new_info.spdx_expressions, frozenset)
+    assert new_info.contains_info()
+    assert not new_info.copy(spdx_expressions=set()).contains_info()
+
+
 def test_reuse_info_copy_nonexistent_attribute():
     """
     Expect a KeyError when trying to copy a nonexistent field into ReuseInfo.
@@ -1160,6 +1352,13 @@ class TestReuseInfoUnion:
         result = info.union()
         assert result == info
 
+    def test_empty_other(self):
+        """If the other arguments contain no information, *self* is returned
+        as-is.
+        """
+        info = ReuseInfo(copyright_notices={CopyrightNotice("Jane Doe")})
+        assert info.union(ReuseInfo(source_path="foo"), ReuseInfo.EMPTY) is info
+
     def test_multiple(self):
         """If multi arguments are provided, merge them all."""
         copyright1 = CopyrightNotice("Jane Doe")
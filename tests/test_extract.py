@@ -16,25 +16,43 @@ import subprocess
 import sys
 from inspect import cleandoc
 from io import BytesIO
+from itertools import count
+from types import SimpleNamespace
 
 import pytest
 from conftest import RESOURCES_DIRECTORY, chardet
 
+from reuse.comment import (
+    CCommentStyle,
+    CppCommentStyle,
+    EmptyCommentStyle,
+    PythonCommentStyle,
+)
 from reuse.copyright import CopyrightNotice, CopyrightPrefix
 from reuse.copyright import FourDigitString as F
 from reuse.copyright import ReuseInfo, SpdxExpression, YearRange
 from reuse.exceptions import NoEncodingModuleError
 from reuse.extract import (
+    CHUNK_SIZE,
+    _scan_range,
     contains_reuse_info,
     detect_encoding,
     detect_newline,
     extract_reuse_info,
+    filter_comment_regions,
     filter_ignore_block,
     get_encoding_module,
+    merge_ranges,
+    ranges_of_file,
     reuse_info_of_file,
+    reuse_info_of_files,
+    reuse_info_of_large_file,
+    reuse_tags_of_file,
     set_encoding_module,
 )
 
+# pylint: disable=too-many-lines
+
 _IGNORE_END = "REUSE-IgnoreEnd"
 
 # REUSE-IgnoreStart
@@ -221,6 +239,21 @@ class TestExtractReuseInfo:
             CopyrightNotice.from_string("Copyright 2019 Jane Doe")
         }
 
+    def test_long_line(self):
+        """A tag on an overly long line is still found, but the result is
+        marked as partially scanned.
+        """
+        result = extract_reuse_info(
+            "x" * 1024 * 8 + " SPDX-License-Identifier: MIT " + "x" * 1024 * 8
+        )
+        assert result.partially_scanned
+        assert len(result.spdx_expressions) == 1
+
+    def test_not_partially_scanned(self):
+        """A regular text is not marked as partially scanned."""
+        result = extract_reuse_info("SPDX-License-Identifier: MIT")
+        assert not result.partially_scanned
+
     def test_contributors(self):
         """Correctly extract SPDX-FileContributor information from text."""
         text = cleandoc(
@@ -380,6 +413,96 @@ class TestReuseInfoOfFile:
             CopyrightNotice("Jane", prefix=CopyrightPrefix.STRING)
         }
 
+    def test_time_budget(self, caplog):
+        """If the time budget is exceeded, stop reading and mark the result as
+        partially scanned.
+        """
+        buffer = BytesIO(
+            b"SPDX-License-Identifier: MIT\n"
+            + b"x\n" * CHUNK_SIZE
+            + b"SPDX-License-Identifier: 0BSD\n"
+        )
+        buffer.name = "foo.py"
+        result = reuse_info_of_file(buffer, chunk_size=16, time_budget=0)
+        assert result.partially_scanned
+        assert SpdxExpression("0BSD") not in result.spdx_expressions
+        assert "'foo.py' could not be searched" in caplog.text
+
+    def test_time_budget_within_chunk(self, monkeypatch):
+        """The time budget is also enforced between the lines of a single
+        chunk.
+        """
+        clock = count()
+        monkeypatch.setattr(
+            "reuse.extract.time", SimpleNamespace(monotonic=lambda: next(clock))
+        )
+        buffer = BytesIO(
+            "".join(
+                f"SPDX-License-Identifier: LicenseRef-{i}\n" for i in range(10)
+            ).encode("utf-8")
+        )
+        result = reuse_info_of_file(buffer, time_budget=5)
+        assert result.partially_scanned
+        assert 0 < len(result.spdx_expressions) < 10
+
+    def test_no_time_budget(self):
+        """If there is no time budget, read the whole file."""
+        buffer = BytesIO(
+            b"SPDX-License-Identifier: MIT\n"
+            + b"x\n" * CHUNK_SIZE
+            + b"SPDX-License-Identifier: 0BSD\n"
+        )
+        result = reuse_info_of_file(buffer, chunk_size=16, time_budget=None)
+        assert not result.partially_scanned
+        assert len(result.spdx_expressions) == 2
+
+    def test_comment_style(self):
+        """With a comment style, only information in comments is found, also
+        when a comment spans multiple chunks.
+        """
+        buffer = BytesIO(
+            cleandoc(
+                """
+                /*
+                 * SPDX-FileCopyrightText: 2019 Jane Doe
+                 *
+                 * SPDX-License-Identifier: MIT
+                 */
+                char *s = "SPDX-License-Identifier: 0BSD";
+                """
+            ).encode("utf-8")
+        )
+        result = reuse_info_of_file(
+            buffer, chunk_size=10, comment_style=CCommentStyle
+        )
+        assert result.spdx_expressions == {SpdxExpression("MIT")}
+        assert len(result.copyright_notices) == 1
+
+    def test_comment_style_incomplete(self):
+        """A comment style that does not describe where the headers of its
+        files are, such as Python docstrings, searches the entire file.
+        """
+        buffer = BytesIO(
+            cleandoc(
+                '''
+                """
+                SPDX-FileCopyrightText: 2019 Jane Doe
+
+                SPDX-License-Identifier: MIT
+                """
+                '''
+            ).encode("utf-8")
+        )
+        result = reuse_info_of_file(buffer, comment_style=PythonCommentStyle)
+        assert result.spdx_expressions == {SpdxExpression("MIT")}
+        assert len(result.copyright_notices) == 1
+
+    def test_comment_style_without_comments(self):
+        """A comment style without comments searches the entire file."""
+        buffer = BytesIO(b"SPDX-License-Identifier: MIT")
+        result = reuse_info_of_file(buffer, comment_style=EmptyCommentStyle)
+        assert result.spdx_expressions == {SpdxExpression("MIT")}
+
     def test_binary(self, caplog):
         """If the file is a binary, return an empty ReuseInfo and log."""
         caplog.set_level(logging.INFO)
@@ -449,6 +572,256 @@ class TestReuseInfoOfFile:
         )
 
 
+class TestReuseInfoOfFiles:
+    """Tests for reuse_info_of_files."""
+
+    @pytest.mark.parametrize("window", [None, 1, 3])
+    def test_simple(self, tmp_path, window):
+        """Yield the REUSE information of every file."""
+        paths = []
+        for i in range(10):
+            path = tmp_path / f"foo{i}.py"
+            path.write_text(f"# SPDX-FileCopyrightText: 200{i} Jane Doe")
+            paths.append(path)
+        result = dict(reuse_info_of_files(paths, workers=2, window=window))
+        assert result == {
+            path: ReuseInfo(
+                copyright_notices={
+                    CopyrightNotice(
+                        "Jane Doe", years=(YearRange(F(f"200{i}")),)
+                    )
+                }
+            )
+            for i, path in enumerate(paths)
+        }
+
+    def test_comments_only(self, tmp_path):
+        """Only the comments of files are searched, including comments that
+        their comment style does not write, and files whose headers are
+        commonly not comments are searched entirely.
+        """
+        c_path = tmp_path / "foo.c"
+        c_path.write_text(
+            "// SPDX-License-Identifier: GPL-2.0\n"
+            'char *s = "SPDX-License-Identifier: 0BSD";\n'
+        )
+        py_path = tmp_path / "foo.py"
+        py_path.write_text(
+            '"""\nSPDX-License-Identifier: MIT\n"""\n\nimport os\n'
+        )
+        result = dict(
+            reuse_info_of_files([c_path, py_path], comments_only=True)
+        )
+        assert result[c_path] == ReuseInfo(
+            spdx_expressions={SpdxExpression("GPL-2.0")}
+        )
+        assert result[py_path] == ReuseInfo(
+            spdx_expressions={SpdxExpression("MIT")}
+        )
+
+    def test_error(self, tmp_path):
+        """If a file cannot be read, yield the error."""
+        path = tmp_path / "foo.py"
+        path.write_text("SPDX-License-Identifier: MIT")
+        result = dict(
+            reuse_info_of_files([path, tmp_path / "does-not-exist.py"])
+        )
+        reuse_info = result[path]
+        assert isinstance(reuse_info, ReuseInfo)
+        assert reuse_info.spdx_expressions == {SpdxExpression("MIT")}
+        assert isinstance(
+            result[tmp_path / "does-not-exist.py"], FileNotFoundError
+        )
+
+
+class TestReuseInfoOfLargeFile:
+    """Tests for reuse_info_of_large_file."""
+
+    @pytest.mark.parametrize("encoding", ["utf_8", "utf_16"])
+    @pytest.mark.parametrize("range_size", [1, 7, 100, 1024 * 1024])
+    def test_same_as_reuse_info_of_file(self, tmp_path, encoding, range_size):
+        """The result is the same as that of reuse_info_of_file, also when
+        ignore blocks span multiple ranges.
+        """
+        text = "\n".join(
+            [
+                "SPDX-FileCopyrightText: 2019 Jane Doe",
+                "REUSE-IgnoreStart",
+                *(
+                    f"SPDX-FileCopyrightText: 2019 Ignored {i}"
+                    for i in range(20)
+                ),
+                _IGNORE_END,
+                "SPDX-License-Identifier: MIT",
+                "x" * 200,
+                "REUSE-IgnoreStart SPDX-License-Identifier: GPL-3.0-or-later",
+                f"{_IGNORE_END} SPDX-FileContributor: John Doe",
+                "REUSE-IgnoreStart",
+                "SPDX-License-Identifier: Apache-2.0",
+            ]
+        )
+        path = tmp_path / "foo.txt"
+        path.write_bytes(text.encode(encoding))
+        with path.open("rb") as fp:
+            expected = reuse_info_of_file(fp)
+        result = reuse_info_of_large_file(path, range_size=range_size)
+        assert result == expected
+        assert result.spdx_expressions == {SpdxExpression("MIT")}
+        assert result.contributor_lines == {"John Doe"}
+
+    def test_binary(self):
+        """If the file is a binary, return an empty ReuseInfo."""
+        path = RESOURCES_DIRECTORY / "fsfe.png"
+        assert reuse_info_of_large_file(path) == ReuseInfo()
+
+    def test_ranges(self, tmp_path):
+        """The ranges of a file cover it without gaps, and can be scanned and
+        merged separately.
+        """
+        path = tmp_path / "foo.txt"
+        path.write_text(
+            "SPDX-License-Identifier: MIT\n"
+            + "x\n" * 100
+            + "SPDX-FileContributor: John Doe\n"
+        )
+        ranges = ranges_of_file(path, range_size=16)
+        assert ranges is not None
+        spans = ranges.spans()
+        assert len(spans) > 1
+        assert spans[0][0] == 0
+        assert spans[-1][1] == path.stat().st_size
+        assert all(
+            end == start for (_, end), (start, _) in zip(spans, spans[1:])
+        )
+        result = merge_ranges(ranges.scan(start, end) for start, end in spans)
+        assert result == reuse_info_of_large_file(path)
+        assert result.contributor_lines == {"John Doe"}
+
+    def test_ranges_of_binary(self):
+        """A binary has no ranges."""
+        assert ranges_of_file(RESOURCES_DIRECTORY / "fsfe.png") is None
+
+    def test_scan_range_both_states(self, tmp_path):
+        """A range is scanned once, both as though it starts outside of an
+        ignore block and as though it starts inside of one.
+        """
+        path = tmp_path / "foo.txt"
+        path.write_text(
+            "SPDX-License-Identifier: MIT\n"
+            f"{_IGNORE_END}\n"
+            "SPDX-License-Identifier: 0BSD\n"
+            "REUSE-IgnoreStart\n"
+        )
+        result = _scan_range(path, 0, path.stat().st_size, "utf_8", "\n")
+        assert result.outside[0].spdx_expressions == {
+            SpdxExpression("MIT"),
+            SpdxExpression("0BSD"),
+        }
+        assert result.inside[0].spdx_expressions == {SpdxExpression("0BSD")}
+        assert result.outside[1] and result.inside[1]
+
+    def test_scan_range_without_markers(self, tmp_path):
+        """A range without ignore markers that starts inside of an ignore block
+        is entirely ignored.
+        """
+        path = tmp_path / "foo.txt"
+        path.write_text("SPDX-License-Identifier: MIT\n")
+        result = _scan_range(path, 0, path.stat().st_size, "utf_8", "\n")
+        assert result.outside == (
+            ReuseInfo(spdx_expressions={SpdxExpression("MIT")}),
+            False,
+        )
+        assert result.inside == (ReuseInfo(), True)
+
+
+class TestReuseTagsOfFile:
+    """Tests for reuse_tags_of_file."""
+
+    def test_simple(self):
+        """Yield all tags in order, with their line numbers and byte spans."""
+        data = cleandoc(
+            """
+            # SPDX-FileCopyrightText: 2019 Jane Doe
+            #
+            # SPDX-License-Identifier: MIT
+            # SPDX-FileContributor: John Doe
+            """
+        ).encode("utf-8")
+        result = list(reuse_tags_of_file(BytesIO(data)))
+        assert [(tag.kind, tag.value, tag.line) for tag in result] == [
+            (
+                "copyright_notices",
+                CopyrightNotice("Jane Doe", years=(YearRange(F("2019")),)),
+                1,
+            ),
+            ("spdx_expressions", SpdxExpression("MIT"), 3),
+            ("contributor_lines", "John Doe", 4),
+        ]
+        assert [data[tag.start : tag.end] for tag in result] == [
+            b"SPDX-FileCopyrightText: 2019 Jane Doe",
+            b"SPDX-License-Identifier: MIT",
+            b"SPDX-FileContributor: John Doe",
+        ]
+        assert all(tag.encoding == "utf_8" for tag in result)
+
+    @pytest.mark.parametrize("newline", ["\r\n", "\r", "\n"])
+    @pytest.mark.parametrize("encoding", ["utf_8", "utf_8_sig", "utf_16"])
+    def test_byte_spans(self, newline, encoding):
+        """The byte spans point into the file, regardless of newlines, byte
+        order marks, multi-byte characters, ignore blocks, and chunking.
+        """
+        text = newline.join(
+            [
+                "# Ärger",
+                "# SPDX-FileCopyrightText: 2019 Jäne Doe",
+                "# REUSE-IgnoreStart",
+                "# SPDX-License-Identifier: GPL-3.0-or-later",
+                f"# {_IGNORE_END}",
+                "# SPDX-License-Identifier: MIT",
+            ]
+        )
+        data = text.encode(encoding)
+        result = list(
+            reuse_tags_of_file(BytesIO(data), chunk_size=64, line_size=256)
+        )
+        decode = {"utf_8_sig": "utf_8", "utf_16": "utf_16_le"}.get(
+            encoding, encoding
+        )
+        assert [tag.line for tag in result] == [2, 6]
+        assert [data[tag.start : tag.end].decode(decode) for tag in result] == [
+            "SPDX-FileCopyrightText: 2019 Jäne Doe",
+            "SPDX-License-Identifier: MIT",
+        ]
+
+    def test_stop_early(self):
+        """The caller can stop iterating before the whole file is read."""
+        buffer = BytesIO(
+            b"SPDX-License-Identifier: MIT\n" + b"x\n" * CHUNK_SIZE
+        )
+        tags = reuse_tags_of_file(buffer, chunk_size=16)
+        assert next(tags).value == SpdxExpression("MIT")
+        assert buffer.tell() < CHUNK_SIZE
+
+    def test_binary(self):
+        """If the file is a binary, yield nothing."""
+        path = RESOURCES_DIRECTORY / "fsfe.png"
+        with path.open("rb") as fp:
+            assert not list(reuse_tags_of_file(fp))
+
+    def test_same_as_reuse_info_of_file(self):
+        """The yielded tags make up the same information as
+        reuse_info_of_file.
+        """
+        path = RESOURCES_DIRECTORY / "fake_repository/src/multiple_licenses.rs"
+        with path.open("rb") as fp:
+            expected = reuse_info_of_file(fp)
+            fp.seek(0)
+            tags = list(reuse_tags_of_file(fp))
+        assert {tag.value for tag in tags} == set(
+            expected.copyright_notices
+        ) | set(expected.spdx_expressions) | set(expected.contributor_lines)
+
+
 class TestFilterIgnoreBlock:
     """Tests for filter_ignore_block."""
 
@@ -660,6 +1033,87 @@ class TestFilterIgnoreBlock:
         result = filter_ignore_block(text, in_ignore_block=True)
         assert result == (expected, False)
 
+    def test_start_inside_open_block(self):
+        """If the text is already in an ignore block, a start marker before the
+        first end marker does not leak the preceding text.
+        """
+        text = f"Ignored REUSE-IgnoreStart text{_IGNORE_END}Relevant text"
+        expected = "Relevant text"
+
+        result = filter_ignore_block(text, in_ignore_block=True)
+        assert result == (expected, False)
+
+    def test_many_ignore_blocks(self):
+        """A text with very many ignore blocks is filtered without exceeding the
+        recursion limit.
+        """
+        block = f"a\nREUSE-IgnoreStart\nb\n{_IGNORE_END}\n"
+        text = block * (sys.getrecursionlimit() * 2)
+        expected = "a\n\n" * (sys.getrecursionlimit() * 2)
+
+        result = filter_ignore_block(text)
+        assert result == (expected, False)
+
+
+class TestFilterCommentRegions:
+    """Tests for filter_comment_regions."""
+
+    def test_single_line(self):
+        """Only lines with single-line comments are kept."""
+        text = cleandoc(
+            """
+            import os
+            # SPDX-License-Identifier: MIT
+            foo = "Copyright Jane Doe"
+            bar = 1  # trailing
+            """
+        )
+        result = filter_comment_regions(text, PythonCommentStyle)
+        assert result == (
+            "# SPDX-License-Identifier: MIT\nbar = 1  # trailing",
+            False,
+        )
+
+    def test_multi_line(self):
+        """Whole lines that contain a multi-line comment are kept."""
+        text = cleandoc(
+            """
+            int x;
+            /*
+             * SPDX-License-Identifier: MIT
+             */ int y;
+            char *z = "Copyright Jane Doe";
+            """
+        )
+        result = filter_comment_regions(text, CCommentStyle)
+        assert result == (
+            "/*\n * SPDX-License-Identifier: MIT\n */ int y;",
+            False,
+        )
+
+    def test_single_and_multi_line(self):
+        """Both single-line and multi-line comments are kept."""
+        text = "a\n// b\nc\n/* d */\ne"
+        result = filter_comment_regions(text, CppCommentStyle)
+        assert result == ("// b\n/* d */", False)
+
+    def test_extra_single_line(self):
+        """Single-line comments of the language that the comment style does not
+        write are kept, too.
+        """
+        text = "// SPDX-License-Identifier: GPL-2.0\nint x;\n/* a */"
+        result = filter_comment_regions(text, CCommentStyle)
+        assert result == ("// SPDX-License-Identifier: GPL-2.0\n/* a */", False)
+
+    def test_open_comment(self):
+        """A multi-line comment that is not closed is signalled, and continues
+        in the next text.
+        """
+        text, in_comment = filter_comment_regions("a\n/* b\nc", CCommentStyle)
+        assert (text, in_comment) == ("/* b\nc", True)
+        result = filter_comment_regions("d\ne */\nf", CCommentStyle, in_comment)
+        assert result == ("d\ne */", False)
+
 
 class TestDetectNewLine:
     """Tests for detect_newline."""
@@ -4,14 +4,17 @@
 
 """Tests for REUSE.toml and .reuse/dep5."""
 
+import json
+import pickle
 import shutil
 from inspect import cleandoc
-from pathlib import Path
+from pathlib import Path, PurePath
 
 import pytest
 from conftest import RESOURCES_DIRECTORY, git, posix, vcs_params
 from debian.copyright import Copyright
 
+from reuse import global_licensing
 from reuse.copyright import (
     CopyrightNotice,
     ReuseInfo,
@@ -241,7 +244,7 @@ class TestAnnotationsItemFromDict:
             }
         )
         assert not item.copyright_notices
-        assert isinstance(item.copyright_notices, set)
+        assert isinstance(item.copyright_notices, frozenset)
 
     def test_both_keys_missing(self):
         """If both REUSE info keys are missing, raise no error."""
@@ -598,6 +601,25 @@ class TestReuseTOMLReuseInfoOf:
             ]
         }
 
+    def test_shared_template(self):
+        """The results for different paths share the sets of the item's
+        precomputed REUSE information.
+        """
+        annotations_item = AnnotationsItem(
+            paths={"**"}, spdx_expressions={"MIT"}
+        )
+        reuse_toml = ReuseTOML("REUSE.toml", 1, [annotations_item])
+        foo = reuse_toml.reuse_info_of("foo.py")[PrecedenceType.CLOSEST][0]
+        bar = reuse_toml.reuse_info_of("bar.py")[PrecedenceType.CLOSEST][0]
+        assert foo.path == "foo.py"
+        assert bar.path == "bar.py"
+        assert foo.copy(path=None) == annotations_item.reuse_info
+        assert (
+            foo.spdx_expressions
+            is bar.spdx_expressions
+            is annotations_item.spdx_expressions
+        )
+
     def test_latest_annotations_item(self, annotations_item):
         """If two items match, use exclusively the latest."""
         reuse_toml = ReuseTOML(
@@ -696,6 +718,84 @@ class TestReuseTOMLReuseInfoOf:
         assert not reuse_toml.reuse_info_of("foo.c")
 
 
+class TestReuseTOMLFindAnnotationsItem:
+    """Test the find_annotations_item method of ReuseTOML."""
+
+    def test_latest_wins(self):
+        """The latest matching item is returned, whether it matches by exact
+        path or by glob.
+        """
+        items = [
+            AnnotationsItem(paths={"src/foo.py"}),
+            AnnotationsItem(paths={"src/**"}),
+            AnnotationsItem(paths={"src/bar.py"}),
+            AnnotationsItem(paths={"**/*.py"}),
+            AnnotationsItem(paths={"src/baz.py"}),
+        ]
+        reuse_toml = ReuseTOML("REUSE.toml", 1, items)
+        assert reuse_toml.find_annotations_item("src/foo.py") is items[3]
+        assert reuse_toml.find_annotations_item("src/baz.py") is items[4]
+        assert reuse_toml.find_annotations_item("src/foo.c") is items[1]
+        assert reuse_toml.find_annotations_item("foo.c") is None
+
+    def test_nested_directories(self):
+        """Globs in deeper directories are only tried for paths in those
+        directories.
+        """
+        items = [
+            AnnotationsItem(paths={"src/*.py"}),
+            AnnotationsItem(paths={"src/sub/*"}),
+            AnnotationsItem(paths={"doc/**"}),
+        ]
+        reuse_toml = ReuseTOML("REUSE.toml", 1, items)
+        assert reuse_toml.find_annotations_item("src/foo.py") is items[0]
+        assert reuse_toml.find_annotations_item("src/sub/foo.py") is items[1]
+        assert reuse_toml.find_annotations_item("src/sub/a/foo.py") is None
+        assert reuse_toml.find_annotations_item("doc/a/b/c") is items[2]
+        assert reuse_toml.find_annotations_item("src") is None
+
+    def test_same_as_matches(self):
+        """The result is the same as the latest item whose matches method
+        returns True.
+        """
+        globs = [
+            "*",
+            "**",
+            "*.py",
+            "src/*",
+            "src/**/*.py",
+            "src/foo*",
+            r"src/\*.py",
+            r"\\*.py",
+            "***.py",
+            "doc/README",
+            "src/a/b",
+        ]
+        items = [AnnotationsItem(paths={glob}) for glob in globs]
+        paths = [
+            "foo.py",
+            "README",
+            "src/foo.py",
+            "src/*.py",
+            "src/a/b",
+            "src/a/b.py",
+            "doc/README",
+            r"\foo.py",
+        ]
+        for count in range(1, len(items) + 1):
+            reuse_toml = ReuseTOML("REUSE.toml", 1, items[:count])
+            for path in paths:
+                expected = next(
+                    (
+                        item
+                        for item in reversed(items[:count])
+                        if item.matches(path)
+                    ),
+                    None,
+                )
+                assert reuse_toml.find_annotations_item(path) is expected
+
+
 class TestReuseTOMLFromFile:
     """Test the from-file method of ReuseTOML."""
 
@@ -736,6 +836,129 @@ class TestReuseTOMLFromFile:
         result = ReuseTOML.from_file("REUSE.toml")
         assert result.annotations[0].precedence == PrecedenceType.CLOSEST
 
+    def test_cache(self, annotations_item, empty_directory):
+        """The parsed file is cached, and used again for as long as its contents
+        do not change.
+        """
+        text = cleandoc(
+            """
+            version = 1
+
+            [[annotations]]
+            path = "foo.py"
+            precedence = "override"
+            SPDX-FileCopyrightText = "2023 Jane Doe"
+            SPDX-License-Identifier = "MIT"
+            """
+        )
+        (empty_directory / "REUSE.toml").write_text(text)
+        cache_directory = empty_directory / "cache"
+        first = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+        (cache_path,) = cache_directory.glob("reuse-toml/*.json")
+        assert json.loads(cache_path.read_text())["reuse_toml"]["version"] == 1
+
+        second = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+        assert second == first
+        assert second.annotations[0] == annotations_item
+        assert second.find_annotations_item("foo.py") == annotations_item
+        assert second.reuse_info_of("foo.py") == first.reuse_info_of("foo.py")
+
+        (empty_directory / "REUSE.toml").write_text(
+            text.replace("foo.py", "bar.py")
+        )
+        third = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+        assert third.find_annotations_item("foo.py") is None
+        assert third.find_annotations_item("bar.py") is not None
+
+    def test_cache_parse_error(self, empty_directory):
+        """Files that cannot be parsed are not cached."""
+        (empty_directory / "REUSE.toml").write_text("version = 1,")
+        cache_directory = empty_directory / "cache"
+        for _ in range(2):
+            with pytest.raises(GlobalLicensingParseError):
+                ReuseTOML.from_file(
+                    "REUSE.toml", cache_directory=cache_directory
+                )
+        assert not list(cache_directory.glob("reuse-toml/*.json"))
+
+    def test_cache_not_validated(self, empty_directory, monkeypatch):
+        """A cached file is neither parsed nor validated again."""
+        (empty_directory / "REUSE.toml").write_text(
+            cleandoc(
+                """
+                version = 1
+
+                [[annotations]]
+                path = ["foo.py", "src/**"]
+                precedence = "aggregate"
+                SPDX-FileCopyrightText = [
+                    "2023 Jane Doe",
+                    "Copyright (C) 2019 - 2021, 2023 John Doe",
+                ]
+                SPDX-License-Identifier = ["MIT", "Apache-2.0 OR MIT"]
+                """
+            )
+        )
+        cache_directory = empty_directory / "cache"
+        first = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed or validated again")
+
+        monkeypatch.setattr(global_licensing, "_parse_toml", fail)
+        monkeypatch.setattr(global_licensing, "_to_set_of_notice", fail)
+        monkeypatch.setattr(AnnotationsItem, "__attrs_post_init__", fail)
+        monkeypatch.setattr(CopyrightNotice, "from_string", fail)
+        second = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+        assert second == first
+        item = second.annotations[0]
+        assert item.copyright_notices == first.annotations[0].copyright_notices
+        assert {notice.original for notice in item.copyright_notices} == {
+            notice.original for notice in first.annotations[0].copyright_notices
+        }
+        assert item.spdx_expressions == first.annotations[0].spdx_expressions
+        assert second.reuse_info_of("src/foo.py") == first.reuse_info_of(
+            "src/foo.py"
+        )
+        assert pickle.loads(pickle.dumps(second)) == first
+
+    def test_cache_invalid(self, empty_directory):
+        """If a cached file does not have the expected shape, the file is
+        parsed again.
+        """
+        (empty_directory / "REUSE.toml").write_text(
+            cleandoc(
+                """
+                version = 1
+
+                [[annotations]]
+                path = "foo.py"
+                SPDX-License-Identifier = "MIT"
+                """
+            )
+        )
+        cache_directory = empty_directory / "cache"
+        ReuseTOML.from_file("REUSE.toml", cache_directory=cache_directory)
+        (cache_path,) = cache_directory.glob("reuse-toml/*.json")
+        cached = json.loads(cache_path.read_text())
+        cached["reuse_toml"]["annotations"][0]["paths"] = [1]
+        cache_path.write_text(json.dumps(cached))
+
+        result = ReuseTOML.from_file(
+            "REUSE.toml", cache_directory=cache_directory
+        )
+        assert result.find_annotations_item("foo.py") is not None
+
 
 class TestReuseTOMLDirectory:
     """Test the directory property of ReuseTOML."""
@@ -878,6 +1101,106 @@ class TestNestedReuseTOMLFindReuseTomls:
         }
 
 
+class TestNestedReuseTOMLFindRelevantTomls:
+    """Tests for NestedReuseTOML._find_relevant_tomls."""
+
+    # pylint: disable=protected-access
+
+    def test_topmost_to_deepest(self):
+        """Only the REUSE.toml files in the directories of the path are
+        returned, from topmost to deepest.
+        """
+        deep = ReuseTOML("src/sub/REUSE.toml", 1, [])
+        top = ReuseTOML("REUSE.toml", 1, [])
+        other = ReuseTOML("doc/REUSE.toml", 1, [])
+        mid = ReuseTOML("src/REUSE.toml", 1, [])
+        nested = NestedReuseTOML(".", [deep, top, other, mid])
+        assert nested._find_relevant_tomls("src/sub/foo.py") == [
+            top,
+            mid,
+            deep,
+        ]
+        assert nested._find_relevant_tomls("src/foo.py") == [top, mid]
+        assert nested._find_relevant_tomls("foo.py") == [top]
+        assert nested._find_relevant_tomls("src/sub") == [top, mid, deep]
+
+    def test_siblings_share_chain(self):
+        """Files in the same directory share one lookup."""
+        top = ReuseTOML("REUSE.toml", 1, [])
+        mid = ReuseTOML("src/REUSE.toml", 1, [])
+        nested = NestedReuseTOML(".", [top, mid])
+        first = nested._find_relevant_tomls("src/foo.py")
+        second = nested._find_relevant_tomls("src/bar.py")
+        assert first is second
+        assert list(nested._toml_chains) == [PurePath("src")]
+
+
+class TestNestedReuseTOMLResolutionCache:
+    """Tests for the per-directory caches of NestedReuseTOML.reuse_info_of."""
+
+    # pylint: disable=protected-access
+
+    def test_distinguishes_siblings(self):
+        """Only globs and paths that can tell files in a directory apart
+        distinguish siblings.
+        """
+        reuse_toml = ReuseTOML(
+            "REUSE.toml",
+            1,
+            [
+                AnnotationsItem(paths={"**"}),
+                AnnotationsItem(paths={"src/**"}),
+                AnnotationsItem(paths={"src/sub/*.py"}),
+                AnnotationsItem(paths={"doc/README"}),
+            ],
+        )
+        assert not reuse_toml._distinguishes_siblings(".")
+        assert not reuse_toml._distinguishes_siblings("src")
+        assert reuse_toml._distinguishes_siblings("src/sub")
+        assert not reuse_toml._distinguishes_siblings("src/sub/deeper")
+        assert reuse_toml._distinguishes_siblings("doc")
+
+    def test_directory_shared(self):
+        """Files in a directory that only directory globs apply to share their
+        resolution, but still get their own path.
+        """
+        outer = ReuseTOML(
+            "REUSE.toml",
+            1,
+            [AnnotationsItem(paths={"src/**"}, spdx_expressions={"MIT"})],
+        )
+        inner = ReuseTOML(
+            "src/REUSE.toml",
+            1,
+            [
+                AnnotationsItem(
+                    paths={"**"}, copyright_notices={"2023 Jane Doe"}
+                ),
+                AnnotationsItem(
+                    paths={"sub/*.py"}, copyright_notices={"2023 John Doe"}
+                ),
+            ],
+        )
+        nested = NestedReuseTOML(".", [outer, inner])
+        foo = nested.reuse_info_of("src/foo.py")[PrecedenceType.CLOSEST]
+        bar = nested.reuse_info_of("src/bar.c")[PrecedenceType.CLOSEST]
+        assert [info.path for info in foo] == ["src/foo.py", "src/foo.py"]
+        assert [info.path for info in bar] == ["src/bar.c", "src/bar.c"]
+        assert foo[0].copy(path="src/bar.c") == bar[0]
+        assert list(nested._directory_items) == [PurePath("src")]
+        assert len(nested._resolutions) == 1
+
+        sub_py = nested.reuse_info_of("src/sub/foo.py")
+        sub_c = nested.reuse_info_of("src/sub/foo.c")
+        assert list(nested._directory_items) == [PurePath("src")]
+        assert sub_py[PrecedenceType.CLOSEST][-1].copyright_notices == {
+            CopyrightNotice.from_string("SPDX-FileCopyrightText: 2023 John Doe")
+        }
+        assert sub_c[PrecedenceType.CLOSEST][-1].copyright_notices == {
+            CopyrightNotice.from_string("SPDX-FileCopyrightText: 2023 Jane Doe")
+        }
+
+
 class TestNestedReuseTOMLReuseInfoOf:
     """Tests for NestedReuseTOML.reuse_info_of."""
 
@@ -1195,6 +1518,94 @@ class TestNestedReuseTOMLReuseInfoOf:
         assert len(infos) == 2
 
 
+class TestReuseInfoOfSubtree:
+    """Tests for reuse_info_of_subtree."""
+
+    @staticmethod
+    def _toml(source, *items):
+        return ReuseTOML(
+            source=source,
+            version=1,
+            annotations=[
+                AnnotationsItem(paths, precedence, {"Jane Doe"}, {"MIT"})
+                for paths, precedence in items
+            ],
+        )
+
+    def test_directory_glob(self):
+        """A directory glob with override precedence covers its subtree."""
+        toml = self._toml("REUSE.toml", ({"vendor/**"}, "override"))
+        result = toml.reuse_info_of_subtree("vendor")
+        assert result == {
+            PrecedenceType.OVERRIDE: [toml.annotations[0].reuse_info]
+        }
+        assert toml.reuse_info_of_subtree("vendor/sub") == result
+        assert toml.reuse_info_of_subtree(".") is None
+        assert toml.reuse_info_of_subtree("src") is None
+
+    def test_not_override(self):
+        """Other precedences do not cover a subtree."""
+        toml = self._toml("REUSE.toml", ({"vendor/**"}, "aggregate"))
+        assert toml.reuse_info_of_subtree("vendor") is None
+
+    def test_later_item_inside(self):
+        """A later item that matches some of the files in the subtree prevents
+        the subtree from being covered, but an earlier one does not.
+        """
+        toml = self._toml(
+            "REUSE.toml",
+            ({"vendor/foo.py"}, "closest"),
+            ({"vendor/**"}, "override"),
+            ({"vendor/sub/*.py"}, "closest"),
+        )
+        assert toml.reuse_info_of_subtree("vendor") is None
+        assert toml.reuse_info_of_subtree("vendor/sub") is None
+        assert toml.reuse_info_of_subtree("vendor/other") is not None
+
+    def test_later_item_above(self):
+        """A later glob above the subtree only prevents it from being covered
+        if the glob reaches into subdirectories.
+        """
+        toml = self._toml(
+            "REUSE.toml",
+            ({"vendor/**"}, "override"),
+            ({"*.py"}, "closest"),
+        )
+        assert toml.reuse_info_of_subtree("vendor") is not None
+        toml = self._toml(
+            "REUSE.toml",
+            ({"vendor/**"}, "override"),
+            ({"**/*.py"}, "closest"),
+        )
+        assert toml.reuse_info_of_subtree("vendor") is None
+
+    def test_nested(self):
+        """An overriding item in an outer REUSE.toml covers the subtree
+        regardless of the REUSE.toml files in it, and is combined with the
+        items of the REUSE.toml files above it.
+        """
+        outer = self._toml("REUSE.toml", ({"**"}, "aggregate"))
+        middle = self._toml("vendor/REUSE.toml", ({"sub/**"}, "override"))
+        inner = self._toml("vendor/sub/REUSE.toml", ({"**"}, "override"))
+        toml = NestedReuseTOML(".", [outer, middle, inner])
+        result = toml.reuse_info_of_subtree("vendor/sub")
+        assert result is not None
+        assert len(result[PrecedenceType.AGGREGATE]) == 1
+        assert result[PrecedenceType.OVERRIDE][0].source_path == (
+            "vendor/REUSE.toml"
+        )
+        info = toml.reuse_info_of("vendor/sub/deeper/foo.py")
+        assert {
+            precedence: [item.copy(path=None) for item in infos]
+            for precedence, infos in info.items()
+        } == result
+        assert toml.reuse_info_of_subtree("vendor") is None
+
+    def test_dep5(self, reuse_dep5):
+        """.reuse/dep5 never overrides."""
+        assert reuse_dep5.reuse_info_of_subtree("doc") is None
+
+
 class TestReuseDep5FromFile:
     """Tests for ReuseDep5.from_file."""
 
@@ -1265,4 +1676,88 @@ def test_reuse_dep5_reuse_info_of(reuse_dep5):
     )
 
 
+class TestReuseDep5ReuseInfoOf:
+    """Tests for ReuseDep5.reuse_info_of."""
+
+    @pytest.fixture()
+    def dep5(self, empty_directory):
+        """A dep5 file with overlapping paragraphs."""
+        (empty_directory / "dep5").write_text(
+            cleandoc(
+                """
+                Format: something
+                Upstream-Name: example
+
+                Files: *
+                Copyright: 2017 Jane Doe
+                License: MIT
+
+                Files: src/*.py src/main.c
+                Copyright: 2018 John Doe
+                License: 0BSD
+
+                Files: src/foo?.py
+                Copyright: 2019 Alice
+                License: CC0-1.0
+
+                Files: src/main.c
+                Copyright: 2020 Bob
+                License: Apache-2.0
+                """
+            )
+        )
+        return ReuseDep5.from_file(empty_directory / "dep5")
+
+    @staticmethod
+    def _expressions(dep5, path):
+        infos = dep5.reuse_info_of(path)[PrecedenceType.AGGREGATE]
+        assert len(infos) == 1
+        assert infos[0].path == path
+        return {str(expression) for expression in infos[0].spdx_expressions}
+
+    def test_last_paragraph_wins(self, dep5):
+        """The last matching paragraph is used, whether its glob is literal or
+        not.
+        """
+        assert self._expressions(dep5, "README") == {"MIT"}
+        assert self._expressions(dep5, "src/bar.py") == {"0BSD"}
+        assert self._expressions(dep5, "src/foo1.py") == {"CC0-1.0"}
+        assert self._expressions(dep5, "src/main.c") == {"Apache-2.0"}
+        # The asterisk matches slashes in dep5.
+        assert self._expressions(dep5, "src/sub/bar.py") == {"0BSD"}
+
+    def test_no_match(self, empty_directory):
+        """Return an empty dictionary if no paragraph matches."""
+        (empty_directory / "dep5").write_text(
+            cleandoc(
+                """
+                Format: something
+
+                Files: doc/*
+                Copyright: 2017 Jane Doe
+                License: MIT
+                """
+            )
+        )
+        dep5 = ReuseDep5.from_file(empty_directory / "dep5")
+        assert not dep5.reuse_info_of("src/foo.py")
+
+    def test_same_as_copyright(self, dep5):
+        """The result agrees with Copyright.find_files_paragraph."""
+        for path in ["README", "src/bar.py", "src/foo1.py", "src/main.c"]:
+            paragraph = dep5.dep5_copyright.find_files_paragraph(path)
+            assert self._expressions(dep5, path) == {paragraph.license.synopsis}
+
+    def test_pickle(self, dep5):
+        """The object can be pickled, and is parsed again only if
+        dep5_copyright is needed.
+        """
+        result = pickle.loads(pickle.dumps(dep5))
+        assert result == dep5
+        assert result.reuse_info_of("src/main.c") == dep5.reuse_info_of(
+            "src/main.c"
+        )
+        assert result.dep5_copyright.__class__ == Copyright
+
+
 # REUSE-IgnoreEnd
@@ -206,6 +206,21 @@ def test_lint_files_without_copyright_and_licensing(fake_repository):
     assert "reuse.software/tutorial" in result
 
 
+def test_lint_partially_scanned(fake_repository):
+    """A file with an overly long line is listed as partially scanned."""
+    (fake_repository / "foo.min.js").write_text(
+        "/* SPDX-FileCopyrightText: 2019 Jane Doe */ "
+        + "x" * 1024 * 8
+        + "\n// SPDX-License-Identifier: MIT"
+    )
+    project = Project.from_directory(fake_repository)
+    report = ProjectReport.generate(project)
+    result = format_plain(report)
+
+    assert "# PARTIALLY SCANNED FILES" in result
+    assert "foo.min.js" in result
+
+
 def test_lint_json_output(fake_repository):
     """Test for lint with JSON output."""
     (fake_repository / "foo.py").write_text("SPDX-License-Identifier: MIT")
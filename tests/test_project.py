@@ -17,8 +17,14 @@ from pathlib import Path
 from unittest import mock
 
 import pytest
-from conftest import RESOURCES_DIRECTORY, vcs_params
+from conftest import RESOURCES_DIRECTORY, git, vcs_params
 
+from reuse.cache import (
+    CacheMode,
+    ContentCache,
+    cache_directory,
+    content_cache_path,
+)
 from reuse.copyright import (
     CopyrightNotice,
     ReuseInfo,
@@ -30,6 +36,7 @@ from reuse.exceptions import (
     GlobalLicensingConflictError,
     GlobalLicensingParseError,
 )
+from reuse.extract import reuse_info_of_large_file
 from reuse.global_licensing import ReuseDep5, ReuseTOML
 from reuse.project import Project
 from reuse.vcs import VCSStrategyNone
@@ -192,9 +199,9 @@ def test_reuse_info_of_only_copyright(fake_repository):
     reuse_info = project.reuse_info_of("foo.py")[0]
     assert not any(reuse_info.spdx_expressions)
     assert len(reuse_info.copyright_notices) == 1
-    assert reuse_info.copyright_notices.pop() == CopyrightNotice.from_string(
-        "SPDX-FileCopyrightText: 2017 Jane Doe"
-    )
+    assert next(
+        iter(reuse_info.copyright_notices)
+    ) == CopyrightNotice.from_string("SPDX-FileCopyrightText: 2017 Jane Doe")
     assert reuse_info.source_type == SourceType.FILE_HEADER
     assert reuse_info.source_path == "foo.py"
     assert reuse_info.path == "foo.py"
@@ -620,6 +627,160 @@ def test_reuse_info_of_no_duplicates(empty_directory):
     )
 
 
+def test_reuse_info_of_file_cache(empty_directory):
+    """The REUSE information in the contents of a file is cached for as long as
+    its metadata does not change.
+    """
+    path = empty_directory / "foo.py"
+    path.write_text("SPDX-License-Identifier: MIT")
+    os.utime(path, ns=(10**18, 10**18))
+    project = Project.from_directory(empty_directory, use_cache=True)
+    expected = project.reuse_info_of("foo.py")
+    assert project.file_cache is not None
+    project.file_cache.write(project.file_cache.pop_new_entries())
+
+    project = Project.from_directory(empty_directory, use_cache=True)
+    with mock.patch("reuse.project.reuse_info_of_file") as reuse_info_of_file:
+        assert project.reuse_info_of("foo.py") == expected
+        reuse_info_of_file.assert_not_called()
+
+    path.write_text("SPDX-License-Identifier: 0BSD")
+    os.utime(path, ns=(10**18, 10**18))
+    result = project.reuse_info_of("foo.py")
+    assert SpdxExpression("0BSD") in result[0].spdx_expressions
+
+
+@git
+def test_reuse_info_of_content_cache(git_repository):
+    """With the content cache, the REUSE information in the contents of a file
+    is cached for as long as its contents do not change, even when the file
+    moves or is in another clone at another path.
+    """
+    project = Project.from_directory(
+        git_repository, use_cache=True, cache_mode=CacheMode.CONTENT
+    )
+    assert isinstance(project.file_cache, ContentCache)
+    expected = project.reuse_info_of("src/source_code.py")
+    project.file_cache.write(project.file_cache.pop_new_entries())
+
+    clone = git_repository / "clone"
+    shutil.copytree(git_repository / "src", clone)
+    project = Project.from_directory(
+        clone, use_cache=True, cache_mode=CacheMode.CONTENT
+    )
+    # The clones have different cache directories, but share the content
+    # cache.
+    assert project.cache_directory != cache_directory(git_repository)
+    assert project.file_cache is not None
+    assert project.file_cache.path == content_cache_path()
+    with mock.patch("reuse.project.reuse_info_of_file") as reuse_info_of_file:
+        result = project.reuse_info_of(clone / "source_code.py")
+        reuse_info_of_file.assert_not_called()
+    assert result[0].spdx_expressions == expected[0].spdx_expressions
+
+
+def test_fingerprint(empty_directory):
+    """Without a VCS, the fingerprint is a hash of the metadata of the files."""
+    path = empty_directory / "foo.py"
+    path.write_text("foo")
+    os.utime(path, ns=(10**18, 10**18))
+    project = Project.from_directory(empty_directory)
+    expected = project.fingerprint()
+    assert expected is not None
+    assert expected.startswith("metadata:")
+    assert project.fingerprint() == expected
+    os.utime(path, ns=(10**18 + 1, 10**18 + 1))
+    assert project.fingerprint() != expected
+
+
+@git
+def test_fingerprint_git(git_repository):
+    """In a clean Git repository, the fingerprint is the tree ID of HEAD."""
+    project = Project.from_directory(git_repository)
+    assert project.fingerprint() == (
+        f"tree:{project.vcs_strategy.clean_tree_id()}"
+    )
+
+
+@git
+def test_fingerprint_git_modified(git_repository):
+    """In a Git repository with changes, the fingerprint is a hash of the
+    metadata of the files that Git does not ignore.
+    """
+    (git_repository / "src/custom.py").write_text("changed")
+    for path in git_repository.rglob("*"):
+        if path.is_file() and not path.is_symlink():
+            os.utime(path, ns=(10**18, 10**18))
+    project = Project.from_directory(git_repository)
+    expected = project.fingerprint()
+    assert expected is not None
+    assert expected.startswith("metadata:")
+    (git_repository / "build/hello.py").write_text("changed")
+    assert project.fingerprint() == expected
+    (git_repository / "src/custom.py").write_text("changed again")
+    assert project.fingerprint() is None
+
+
+def test_reuse_info_of_large_file(empty_directory, monkeypatch):
+    """Large files are searched in ranges, in this process."""
+    (empty_directory / "foo.py").write_text("SPDX-License-Identifier: MIT")
+    monkeypatch.setattr("reuse.project.LARGE_FILE_SIZE", 0)
+    project = Project.from_directory(empty_directory)
+    with mock.patch(
+        "reuse.project.reuse_info_of_large_file",
+        wraps=reuse_info_of_large_file,
+    ) as wrapped:
+        result = project.reuse_info_of("foo.py")
+    wrapped.assert_called_once()
+    assert result[0].spdx_expressions == {SpdxExpression("MIT")}
+
+
+def test_reuse_info_of_contents(empty_directory):
+    """Given contents are used instead of searching the file."""
+    (empty_directory / "foo.py").write_text("SPDX-License-Identifier: MIT")
+    project = Project.from_directory(empty_directory)
+    result = project.reuse_info_of(
+        "foo.py", ReuseInfo(spdx_expressions={SpdxExpression("0BSD")})
+    )
+    assert result[0].spdx_expressions == {SpdxExpression("0BSD")}
+
+
+def test_large_file_ranges(empty_directory, monkeypatch):
+    """Only large files whose contents would be searched, and that are not
+    cached, have ranges.
+    """
+    (empty_directory / "foo.py").write_text("SPDX-License-Identifier: MIT")
+    (empty_directory / "bar.py").write_text("SPDX-License-Identifier: MIT")
+    (empty_directory / "REUSE.toml").write_text(
+        cleandoc(
+            """
+            version = 1
+
+            [[annotations]]
+            path = "bar.py"
+            precedence = "override"
+            SPDX-License-Identifier = "0BSD"
+            """
+        )
+    )
+    project = Project.from_directory(empty_directory)
+    assert project.large_file_ranges("foo.py") is None
+    monkeypatch.setattr("reuse.project.LARGE_FILE_SIZE", 0)
+    ranges = project.large_file_ranges("foo.py")
+    assert ranges is not None
+    assert ranges.spans() == [(0, len("SPDX-License-Identifier: MIT"))]
+    assert project.large_file_ranges("bar.py") is None
+    assert project.large_file_ranges("does-not-exist.py") is None
+
+    os.utime(empty_directory / "foo.py", ns=(10**18, 10**18))
+    project = Project.from_directory(empty_directory, use_cache=True)
+    project.reuse_info_of("foo.py")
+    assert project.file_cache is not None
+    project.file_cache.write(project.file_cache.pop_new_entries())
+    project = Project.from_directory(empty_directory, use_cache=True)
+    assert project.large_file_ranges("foo.py") is None
+
+
 def test_reuse_info_of_binary_succeeds(fake_repository_dep5):
     """reuse_info_of succeeds when the target is covered by dep5."""
     shutil.copy(
@@ -7,21 +7,48 @@
 """Tests for reuse.report"""
 
 
+import functools
+import multiprocessing as multiprocessing_module
 import os
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from inspect import cleandoc
+from pathlib import Path
 from textwrap import dedent
+from unittest import mock
 
-from conftest import cpython, no_root, posix
+import pytest
+from conftest import cpython, git, no_root, posix
 
-from reuse.copyright import SourceType
+from reuse.cache import CacheMode, ContentCache, FileCache
+from reuse.copyright import ReuseInfo, SourceType, SpdxExpression
+from reuse.extract import ranges_of_file
 from reuse.project import Project
-from reuse.report import FileReport, ProjectReport, ProjectSubsetReport
+from reuse.report import (
+    FileReport,
+    ProjectReport,
+    ProjectSubsetReport,
+    _initialize_worker,
+    _LargeFile,
+    _license_concluded,
+    _MultiprocessingContainer,
+    _MultiprocessingResult,
+    _project_report_cache_path,
+)
 
 # REUSE-IgnoreStart
 
 
+def _lint_dict(report):
+    """Return the lint dictionary of *report*, with its files in a fixed
+    order.
+    """
+    result = report.to_dict_lint()
+    result["files"].sort(key=lambda file_: file_["path"])
+    return result
+
+
 class TestGenerateFileReport:
     """Tests for FileReport.generate."""
 
@@ -216,6 +243,24 @@ class TestGenerateFileReport:
         )
         assert not result.missing_licenses
 
+    def test_license_concluded_memoised(self, empty_directory):
+        """Files with the same set of expressions share one computation of
+        LicenseConcluded.
+        """
+        (empty_directory / "foo.py").write_text(
+            "SPDX-License-Identifier: MIT\nSPDX-License-Identifier: 0BSD"
+        )
+        (empty_directory / "bar.py").write_text(
+            "SPDX-License-Identifier: 0BSD\nSPDX-License-Identifier: MIT"
+        )
+        project = Project.from_directory(empty_directory)
+        _license_concluded.cache_clear()
+        foo = FileReport.generate(project, "foo.py", add_license_concluded=True)
+        bar = FileReport.generate(project, "bar.py", add_license_concluded=True)
+        assert foo.license_concluded == bar.license_concluded == "0BSD AND MIT"
+        info = _license_concluded.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_invalid_spdx_expression_add_license_concluded(
         self, fake_repository, add_license_concluded
     ):
@@ -345,6 +390,142 @@ class TestGenerateProjectReport:
         assert not result.read_errors
         assert result.file_reports
 
+    def test_bounded_batches(self, fake_repository, monkeypatch):
+        """With small batches and few batches in flight, every file is still
+        reported once.
+        """
+        project = Project.from_directory(fake_repository)
+        expected = ProjectReport.generate(project, multiprocessing=False)
+        monkeypatch.setattr("reuse.report.ENABLE_PARALLEL", True)
+        monkeypatch.setattr("reuse.report._MAX_BATCH_SIZE", 2)
+        monkeypatch.setattr("reuse.report._MAX_IN_FLIGHT", 1)
+        result = ProjectReport.generate(project, multiprocessing=True)
+        assert sorted(report.name for report in result.file_reports) == sorted(
+            report.name for report in expected.file_reports
+        )
+        assert _lint_dict(result) == _lint_dict(expected)
+
+    @pytest.mark.parametrize("start_method", ["spawn", "forkserver"])
+    def test_start_method(self, fake_repository, monkeypatch, start_method):
+        """Worker processes that do not inherit the memory of the main process
+        are initialised with the project, too.
+        """
+        if start_method not in multiprocessing_module.get_all_start_methods():
+            pytest.skip(f"'{start_method}' is not supported")
+        project = Project.from_directory(fake_repository)
+        expected = ProjectReport.generate(project, multiprocessing=False)
+        monkeypatch.setattr("reuse.report.ENABLE_PARALLEL", True)
+        monkeypatch.setattr(
+            "reuse.report.ProcessPoolExecutor",
+            functools.partial(
+                ProcessPoolExecutor,
+                max_workers=2,
+                mp_context=multiprocessing_module.get_context(start_method),
+            ),
+        )
+        monkeypatch.setattr("reuse.report._MAX_BATCH_SIZE", 1)
+        pickled = []
+
+        def getstate(container):
+            pickled.append(container)
+            return container.__dict__
+
+        monkeypatch.setattr(
+            _MultiprocessingContainer, "__getstate__", getstate, raising=False
+        )
+        result = ProjectReport.generate(project, multiprocessing=True)
+        assert _lint_dict(result) == _lint_dict(expected)
+        # Once per worker, not once per batch.
+        assert 1 <= len(pickled) <= 2
+
+    @git
+    def test_fork_content_cache(
+        self, git_repository, cache_server, monkeypatch, tmp_path_factory
+    ):
+        """Forked worker processes do not use the connections to the content
+        cache and its backend that the main process opened.
+        """
+        # pylint: disable=protected-access
+        if "fork" not in multiprocessing_module.get_all_start_methods():
+            pytest.skip("'fork' is not supported")
+        host, port = cache_server.server_address
+        project = Project.from_directory(
+            git_repository,
+            use_cache=True,
+            cache_mode=CacheMode.CONTENT,
+            cache_url=f"http://{host}:{port}",
+        )
+        expected = ProjectReport.generate(project, multiprocessing=False)
+        directory = tmp_path_factory.mktemp("workers")
+        file_cache = project.file_cache
+        assert isinstance(file_cache, ContentCache)
+        assert file_cache.backend is not None
+        # Open the connections, as though the main process were still using
+        # them when the workers are forked.
+        file_cache.backend.lookup(["foo"])
+        monkeypatch.setattr(file_cache, "prefetch", file_cache._connect)
+
+        def initialize_worker(container):
+            _initialize_worker(container)
+            cache_ = container.project.file_cache
+            (directory / str(os.getpid())).write_text(
+                str(cache_._connection is cache_.backend._connection is None)
+            )
+
+        monkeypatch.setattr("reuse.report.ENABLE_PARALLEL", True)
+        monkeypatch.setattr(
+            "reuse.report._initialize_worker", initialize_worker
+        )
+        monkeypatch.setattr(
+            "reuse.report.ProcessPoolExecutor",
+            functools.partial(
+                ProcessPoolExecutor,
+                max_workers=2,
+                mp_context=multiprocessing_module.get_context("fork"),
+            ),
+        )
+        assert file_cache._connection is not None
+        with warnings.catch_warnings():
+            # Forking a process with threads is deprecated.
+            warnings.simplefilter("ignore", DeprecationWarning)
+            result = ProjectReport.generate(project, multiprocessing=True)
+        assert _lint_dict(result) == _lint_dict(expected)
+        workers = [path.read_text() for path in directory.iterdir()]
+        assert workers and all(worker == "True" for worker in workers)
+
+    def test_large_file(self, empty_directory, monkeypatch):
+        """Under the default parallel lint, large files are split into ranges
+        that are searched on the worker processes.
+        """
+        (empty_directory / "foo.py").write_text(
+            "SPDX-License-Identifier: MIT\n"
+            + "x\n" * 100
+            + "SPDX-FileCopyrightText: 2017 Jane Doe\n"
+        )
+        (empty_directory / "bar.py").write_text("SPDX-License-Identifier: MIT")
+        monkeypatch.setattr("reuse.project.LARGE_FILE_SIZE", 100)
+        monkeypatch.setattr(
+            "reuse.project.ranges_of_file",
+            functools.partial(ranges_of_file, range_size=16),
+        )
+        monkeypatch.setattr("reuse.report.ENABLE_PARALLEL", True)
+        project = Project.from_directory(empty_directory)
+        expected = ProjectReport.generate(project, multiprocessing=False)
+        submit = mock.Mock(wraps=_LargeFile.submit)
+        monkeypatch.setattr(_LargeFile, "submit", submit)
+        result = ProjectReport.generate(project, multiprocessing=True)
+        submit.assert_called_once()
+        _executor, path, ranges = submit.call_args.args
+        assert Path(path).name == "foo.py"
+        assert len(ranges.spans()) > 1
+        assert _lint_dict(result) == _lint_dict(expected)
+        (foo,) = [
+            file_report
+            for file_report in result.file_reports
+            if file_report.name == "./foo.py"
+        ]
+        assert foo.copyright == "SPDX-FileCopyrightText: 2017 Jane Doe"
+
     def test_licenses_without_extension(self, fake_repository, multiprocessing):
         """Licenses without extension are detected."""
         (fake_repository / "LICENSES/CC0-1.0.txt").rename(
@@ -554,6 +735,186 @@ class TestGenerateProjectReport:
         assert file_report.copyright == "SPDX-FileCopyrightText: Jane Doe"
         assert file_report.licenses_in_file == ["0BSD"]
 
+    def test_overridden_subtree(
+        self, empty_directory, multiprocessing, monkeypatch
+    ):
+        """The reports of files in a directory that REUSE.toml overrides are
+        created without looking into the files individually, and are the same
+        as reports that do.
+        """
+        (empty_directory / "REUSE.toml").write_text(
+            cleandoc(
+                """
+                version = 1
+
+                [[annotations]]
+                path = "vendor/**"
+                precedence = "override"
+                SPDX-FileCopyrightText = "Jane Doe"
+                SPDX-License-Identifier = "MIT"
+                """
+            )
+        )
+        (empty_directory / "vendor/sub").mkdir(parents=True)
+        for name in ["vendor/foo.py", "vendor/sub/bar.py", "baz.py"]:
+            (empty_directory / name).write_text(
+                "# SPDX-License-Identifier: 0BSD"
+            )
+        project = Project.from_directory(empty_directory)
+        expected = {
+            file_report.name: file_report.to_dict_lint()
+            for file_report in ProjectReport.generate(
+                project, do_checksum=True, multiprocessing=multiprocessing
+            ).file_reports
+        }
+
+        original = Project.reuse_info_of
+
+        def reuse_info_of(self, path, contents=None):
+            assert "vendor" not in str(path)
+            return original(self, path, contents)
+
+        if not multiprocessing:
+            monkeypatch.setattr(Project, "reuse_info_of", reuse_info_of)
+        report = ProjectReport.generate(
+            project, do_checksum=False, multiprocessing=multiprocessing
+        )
+        result = {
+            file_report.name: file_report.to_dict_lint()
+            for file_report in report.file_reports
+        }
+        assert result == expected
+        bar = result["./vendor/sub/bar.py"]
+        assert [item["value"] for item in bar["spdx_expressions"]] == ["MIT"]
+
+    def test_file_cache(self, empty_directory, multiprocessing):
+        """The entries of the file cache that the workers add are written at
+        the end.
+        """
+        path = empty_directory / "foo.py"
+        path.write_text("# SPDX-License-Identifier: MIT")
+        os.utime(path, ns=(10**18, 10**18))
+        project = Project.from_directory(empty_directory, use_cache=True)
+        ProjectReport.generate(
+            project, do_checksum=False, multiprocessing=multiprocessing
+        )
+        assert project.file_cache is not None
+        file_cache = FileCache(project.file_cache.path)
+        with path.open("rb") as fp:
+            key = file_cache.key("foo.py", fp, os.fstat(fp.fileno()))
+        assert key is not None
+        reuse_info = file_cache.get(key)
+        assert reuse_info is not None
+        assert reuse_info.spdx_expressions == {SpdxExpression("MIT")}
+
+
+class TestStoredProjectReport:
+    """Tests for the stored reports of ProjectReport.generate."""
+
+    def test_stored_report(self, empty_directory):
+        """As long as the fingerprint of the project does not change, the
+        stored report is returned.
+        """
+        path = empty_directory / "foo.py"
+        path.write_text("# SPDX-License-Identifier: MIT")
+        os.utime(path, ns=(10**18, 10**18))
+        project = Project.from_directory(empty_directory, use_cache=True)
+        expected = ProjectReport.generate(project, multiprocessing=False)
+
+        project = Project.from_directory(empty_directory, use_cache=True)
+        with mock.patch(
+            "reuse.report._generate_file_reports"
+        ) as generate_file_reports:
+            result = ProjectReport.generate(project, multiprocessing=False)
+            generate_file_reports.assert_not_called()
+            # Other options are stored separately.
+            ProjectReport.generate(
+                project, do_checksum=False, multiprocessing=False
+            )
+            generate_file_reports.assert_called_once()
+        assert _lint_dict(result) == _lint_dict(expected)
+
+        path.write_text("# SPDX-License-Identifier: 0BSD")
+        os.utime(path, ns=(10**18, 10**18 + 1))
+        result = ProjectReport.generate(project, multiprocessing=False)
+        assert result.used_licenses == {"0BSD"}
+
+    @pytest.mark.parametrize("problem", ["partially_scanned", "read_error"])
+    def test_incomplete_report_not_stored(self, empty_directory, problem):
+        """Reports with partially scanned files or read errors are not
+        stored.
+        """
+        path = empty_directory / "foo.py"
+        path.write_text("# SPDX-License-Identifier: MIT")
+        os.utime(path, ns=(10**18, 10**18))
+        project = Project.from_directory(empty_directory, use_cache=True)
+        if problem == "partially_scanned":
+            patch = mock.patch(
+                "reuse.project.reuse_info_of_file",
+                return_value=ReuseInfo(partially_scanned=True),
+            )
+        else:
+            patch = mock.patch(
+                "reuse.report._generate_file_reports",
+                return_value=iter(
+                    [_MultiprocessingResult(path, None, OSError("foo"))]
+                ),
+            )
+        with patch:
+            result = ProjectReport.generate(project, multiprocessing=False)
+        assert result.partially_scanned_files or result.read_errors
+        cache_path = _project_report_cache_path(project, True, False)
+        assert cache_path is not None
+        assert not cache_path.exists()
+
+    def test_stored_report_round_trip(self, fake_repository):
+        """The stored report is the same as the generated one."""
+        project = Project.from_directory(fake_repository, use_cache=True)
+        expected = ProjectReport.generate(
+            project, multiprocessing=False, add_license_concluded=True
+        )
+        project = Project.from_directory(fake_repository, use_cache=True)
+        with mock.patch(
+            "reuse.report._generate_file_reports"
+        ) as generate_file_reports:
+            result = ProjectReport.generate(
+                project, multiprocessing=False, add_license_concluded=True
+            )
+            generate_file_reports.assert_not_called()
+
+        def details(report):
+            return sorted(
+                (
+                    file_report.name,
+                    file_report.to_dict_lint(),
+                    file_report.spdx_id,
+                    file_report.chk_sum,
+                    file_report.license_concluded,
+                    file_report.copyright,
+                )
+                for file_report in report.file_reports
+            )
+
+        assert details(result) == details(expected)
+        assert result.used_licenses == expected.used_licenses
+
+    def test_stored_report_invalid(self, empty_directory):
+        """A stored report that cannot be read is generated again."""
+        (empty_directory / "foo.py").write_text(
+            "# SPDX-License-Identifier: MIT"
+        )
+        project = Project.from_directory(empty_directory, use_cache=True)
+        with mock.patch(
+            "reuse.report.cache.load",
+            return_value={
+                "fingerprint": project.fingerprint(),
+                "files": [{"name": 1}],
+                "read_errors": [],
+            },
+        ):
+            result = ProjectReport.generate(project, multiprocessing=False)
+        assert result.used_licenses == {"MIT"}
+
 
 class TestProjectSubsetReport:
     """Tests for ProjectSubsetReport."""
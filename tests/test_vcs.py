@@ -10,9 +10,12 @@
 
 
 import os
+import subprocess
 from pathlib import Path
 
-from conftest import vcs_params
+from conftest import git, vcs_params
+
+from reuse.vcs import GIT_EXE, VCSStrategyGit
 
 
 @vcs_params
@@ -26,3 +29,60 @@ class TestVCSStrategyCommon:
         os.chdir("src")
         result = vcs_strategy.find_root()
         assert result == Path(os.path.relpath(vcs_repo, Path.cwd()))
+
+
+@git
+def test_git_content_ids(git_repository):
+    """The content IDs are the blob IDs of tracked files that are unmodified."""
+    (git_repository / "src/custom.py").write_text("changed")
+    (git_repository / "untracked.py").write_text("untracked")
+    result = VCSStrategyGit(git_repository).content_ids()
+    expected = subprocess.run(
+        [str(GIT_EXE), "hash-object", "src/source_code.py"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+    assert result["src/source_code.py"] == expected
+    assert "src/custom.py" not in result
+    assert "untracked.py" not in result
+
+
+@git
+def test_git_content_ids_differ_from_blob(git_repository):
+    """Files whose contents may differ from their blobs although Git reports
+    no changes have no content IDs.
+    """
+    (git_repository / ".gitattributes").write_text("*.py filter=lfs\n")
+    result = VCSStrategyGit(git_repository).content_ids()
+    assert "src/source_code.py" not in result
+    assert "src/custom.py" not in result
+    assert "LICENSES/GPL-3.0-or-later.txt" in result
+
+    (git_repository / ".gitattributes").unlink()
+    (git_repository / "src/custom.py").write_text("changed")
+    subprocess.run(
+        [str(GIT_EXE), "update-index", "--assume-unchanged", "src/custom.py"],
+        check=True,
+    )
+    result = VCSStrategyGit(git_repository).content_ids()
+    assert "src/source_code.py" in result
+    assert "src/custom.py" not in result
+
+
+@git
+def test_git_clean_tree_id(git_repository):
+    """The tree ID is only returned while the working tree is clean."""
+    expected = subprocess.run(
+        [str(GIT_EXE), "rev-parse", "HEAD:src"],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+    assert VCSStrategyGit(git_repository / "src").clean_tree_id() == expected
+
+    (git_repository / "src/untracked.py").write_text("untracked")
+    assert VCSStrategyGit(git_repository / "src").clean_tree_id() is None
+    (git_repository / "src/untracked.py").unlink()
+    (git_repository / "src/custom.py").write_text("changed")
+    assert VCSStrategyGit(git_repository).clean_tree_id() is None